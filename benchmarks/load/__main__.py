@@ -0,0 +1,126 @@
+"""HTTP load test of a running application.
+
+Start docker-compose-test services (make up-bench-services), the app with
+DATABASE_URL and REDIS_HOST of them and, for the report scenario, a celery
+worker. Then run from the project root (make bench-load does the same):
+
+    python -m benchmarks.load --base-url http://127.0.0.1:8000 \\
+        --output benchmarks/results/$(git rev-parse --short HEAD).json \\
+        --compare benchmarks/results/baseline.json
+
+The dataset is seeded through the API and deleted afterwards. Results are
+saved as JSON with the commit, so runs of different commits are comparable.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+from dataclasses import asdict
+from datetime import datetime, timezone
+
+import httpx
+from redis.asyncio import Redis  # type: ignore
+
+from benchmarks.load.driver import print_stats, run
+from benchmarks.load.scenarios import SCENARIOS, cleanup, seed
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument(
+        "--redis-url",
+        default="redis://127.0.0.1:6378/1",
+        help="cache of the app, flushed before the cold scenario",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=SCENARIOS,
+        help="repeat for several, default: all but report",
+    )
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    parser.add_argument("--warmup", type=float, default=5.0, help="seconds")
+    parser.add_argument("--menus", type=int, default=5)
+    parser.add_argument("--submenus", type=int, default=5, help="per menu")
+    parser.add_argument("--dishes", type=int, default=10, help="per submenu")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON file for results")
+    parser.add_argument("--compare", help="JSON results of a previous run")
+    return parser.parse_args()
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main(args: argparse.Namespace) -> None:
+    scenarios = args.scenario or [name for name in SCENARIOS if name != "report"]
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["scenarios"]
+
+    results: dict[str, dict] = {}
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.base_url, limits=limits, timeout=60
+    ) as client:
+        dataset = await seed(client, args.menus, args.submenus, args.dishes)
+        print(
+            f"{len(dataset.menus)} menus, {len(dataset.submenus)} submenus, "
+            f"{len(dataset.dishes)} dishes, concurrency {args.concurrency}"
+        )
+        try:
+            for name in scenarios:
+                warmup = args.warmup
+                if name == "cold":
+                    redis = Redis.from_url(args.redis_url)
+                    await redis.flushdb()
+                    await redis.close()
+                    warmup = 0
+
+                stats = await run(
+                    client,
+                    SCENARIOS[name](dataset),
+                    concurrency=args.concurrency,
+                    duration=args.duration,
+                    warmup=warmup,
+                    seed=args.seed,
+                )
+                results[name] = asdict(stats)
+                print_stats(name, stats, baseline.get(name))
+        finally:
+            await cleanup(client, dataset)
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as file:
+            json.dump(
+                {
+                    "commit": git_commit(),
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "parameters": {
+                        key: value
+                        for key, value in vars(args).items()
+                        if key not in ("output", "compare")
+                    },
+                    "scenarios": results,
+                },
+                file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,131 @@
+"""Closed-loop load driver: workers repeat a scenario step for a duration"""
+import asyncio
+import math
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+import httpx
+
+COMPARED = ("throughput", "p50", "p99")
+
+
+@dataclass
+class Stats:
+    requests: int
+    errors: int
+    duration: float
+    throughput: float  # requests per second
+    p50: float  # milliseconds
+    p90: float
+    p99: float
+    max: float
+
+    @classmethod
+    def from_latencies(
+        cls, latencies: list[float], errors: int, duration: float
+    ) -> "Stats":
+        latencies_ms = sorted(latency * 1000 for latency in latencies) or [0.0]
+        return cls(
+            requests=len(latencies),
+            errors=errors,
+            duration=round(duration, 3),
+            throughput=round(len(latencies) / duration, 1) if duration else 0.0,
+            p50=round(statistics.median(latencies_ms), 2),
+            p90=round(_percentile(latencies_ms, 0.90), 2),
+            p99=round(_percentile(latencies_ms, 0.99), 2),
+            max=round(latencies_ms[-1], 2),
+        )
+
+
+def _percentile(values: list[float], rank: float) -> float:
+    return values[math.ceil(len(values) * rank) - 1]
+
+
+@dataclass
+class Session:
+    """HTTP client of one worker, records requests made after warmup"""
+
+    client: httpx.AsyncClient
+    rng: random.Random
+    record_after: float = 0.0  # perf_counter time, requests of warmup are skipped
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        started = time.perf_counter()
+        recording = started >= self.record_after
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.errors += recording
+            raise
+        if recording:
+            self.latencies.append(time.perf_counter() - started)
+            self.errors += response.status_code >= 400
+        return response
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+
+Step = Callable[[Session], Awaitable[bool]]
+
+
+async def run(
+    client: httpx.AsyncClient,
+    step: Step,
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    seed: int,
+) -> Stats:
+    """Workers call step until duration ends or step returns False
+
+    Requests of the warmup period aren't recorded.
+    """
+    record_after = time.perf_counter() + warmup
+    deadline = record_after + duration
+    sessions = [
+        Session(client, random.Random(seed + worker), record_after=record_after)
+        for worker in range(concurrency)
+    ]
+
+    async def worker(session: Session) -> None:
+        while time.perf_counter() < deadline:
+            try:
+                if not await step(session):
+                    return
+            except httpx.HTTPError:
+                pass
+
+    await asyncio.gather(*(worker(session) for session in sessions))
+
+    return Stats.from_latencies(
+        [latency for session in sessions for latency in session.latencies],
+        errors=sum(session.errors for session in sessions),
+        duration=max(time.perf_counter() - record_after, 0.0),
+    )
+
+
+def print_stats(name: str, stats: Stats, baseline: dict | None) -> None:
+    print(
+        f"{name:<8} {stats.requests:7d} req {stats.errors:5d} err | "
+        f"{stats.throughput:8.1f} req/s | p50 {stats.p50:8.2f} ms, "
+        f"p90 {stats.p90:8.2f} ms, p99 {stats.p99:8.2f} ms, max {stats.max:8.2f} ms"
+    )
+    if baseline:
+        changes = ", ".join(
+            f"{metric} {(getattr(stats, metric) / baseline[metric] - 1) * 100:+.1f}%"
+            for metric in COMPARED
+            if baseline.get(metric)
+        )
+        print(f"{'':<8} vs baseline: {changes}")
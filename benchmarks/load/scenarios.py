@@ -0,0 +1,168 @@
+"""Dataset seeded through the API and scenarios over it"""
+import asyncio
+import itertools
+import random
+import time
+from dataclasses import dataclass, field
+
+import httpx
+
+from benchmarks.load.driver import Session, Step
+
+MENUS = "/api/v1/menus"
+
+REPORT_POLL_INTERVAL = 0.2  # seconds
+REPORT_TIMEOUT = 120.0
+
+
+@dataclass
+class Dataset:
+    """Menus created for the run, titles are unique by the run prefix"""
+
+    prefix: str
+    menus: list[str] = field(default_factory=list)
+    submenus: list[tuple[str, str]] = field(default_factory=list)
+    dishes: list[tuple[str, str, str]] = field(default_factory=list)
+
+    def urls(self) -> list[str]:
+        """Every read endpoint of every object"""
+        urls = [f"{MENUS}/"]
+        for menu_id in self.menus:
+            urls += [f"{MENUS}/{menu_id}", f"{MENUS}/{menu_id}/submenus"]
+            urls.append(f"{MENUS}/{menu_id}/tree")
+        for menu_id, submenu_id in self.submenus:
+            url = f"{MENUS}/{menu_id}/submenus/{submenu_id}"
+            urls += [url, f"{url}/dishes"]
+        for menu_id, submenu_id, dish_id in self.dishes:
+            urls.append(f"{MENUS}/{menu_id}/submenus/{submenu_id}/dishes/{dish_id}")
+        return urls
+
+
+async def seed(
+    client: httpx.AsyncClient, menus: int, submenus: int, dishes: int
+) -> Dataset:
+    """Menus with submenus per menu and dishes per submenu"""
+    dataset = Dataset(prefix=f"{int(time.time()) % 100000:05d}")
+
+    for menu_number in range(menus):
+        response = await client.post(
+            f"{MENUS}/",
+            json={
+                "title": f"b{dataset.prefix}-m{menu_number}",
+                "description": "benchmark menu",
+            },
+        )
+        response.raise_for_status()
+        menu_id = response.json()["id"]
+        dataset.menus.append(menu_id)
+
+        for submenu_number in range(submenus):
+            response = await client.post(
+                f"{MENUS}/{menu_id}/submenus",
+                json={
+                    "title": f"b{dataset.prefix}-m{menu_number}-s{submenu_number}",
+                    "description": "benchmark submenu",
+                },
+            )
+            response.raise_for_status()
+            submenu_id = response.json()["id"]
+            dataset.submenus.append((menu_id, submenu_id))
+
+            for dish_number in range(dishes):
+                response = await client.post(
+                    f"{MENUS}/{menu_id}/submenus/{submenu_id}/dishes",
+                    json={
+                        "title": (
+                            f"b{dataset.prefix}-{menu_number}"
+                            f"-{submenu_number}-{dish_number}"
+                        ),
+                        "description": "benchmark dish",
+                        "price": f"{10 + dish_number * 1.25:.2f}",
+                    },
+                )
+                response.raise_for_status()
+                dataset.dishes.append((menu_id, submenu_id, response.json()["id"]))
+
+    return dataset
+
+
+async def cleanup(client: httpx.AsyncClient, dataset: Dataset) -> None:
+    """Submenus and dishes are deleted by cascade"""
+    for menu_id in dataset.menus:
+        await client.delete(f"{MENUS}/{menu_id}")
+
+
+def browse(dataset: Dataset) -> Step:
+    """Read-heavy browsing, mostly served from cache after the first reads"""
+    urls = dataset.urls()
+
+    async def step(session: Session) -> bool:
+        await session.get(session.rng.choice(urls))
+        return True
+
+    return step
+
+
+def cold(dataset: Dataset) -> Step:
+    """Every url read once after the cache is flushed, each read is a miss
+
+    Workers share the shuffled list, the scenario ends when it's exhausted.
+    """
+    urls = dataset.urls()
+    random.Random(0).shuffle(urls)
+    iterator = iter(urls)
+
+    async def step(session: Session) -> bool:
+        url = next(iterator, None)
+        if url is None:
+            return False
+        await session.get(url)
+        return True
+
+    return step
+
+
+def writes(dataset: Dataset) -> Step:
+    """Dish price updates, each followed by a read of the invalidated list"""
+    prices = itertools.count()
+
+    async def step(session: Session) -> bool:
+        menu_id, submenu_id, dish_id = session.rng.choice(dataset.dishes)
+        url = f"{MENUS}/{menu_id}/submenus/{submenu_id}/dishes"
+        await session.patch(
+            f"{url}/{dish_id}", json={"price": f"{next(prices) % 1000 + 0.5:.2f}"}
+        )
+        await session.get(url)
+        return True
+
+    return step
+
+
+def report(dataset: Dataset) -> Step:
+    """Report task round trip, from request to SUCCESS, needs a celery worker
+
+    The whole round trip is recorded as one request, polls are not.
+    """
+
+    async def step(session: Session) -> bool:
+        started = time.perf_counter()
+        response = await session.client.post("/api/v1/report/")
+        task_id = response.json()["task_id"]
+
+        status = "PENDING"
+        while status not in ("SUCCESS", "FAILURE"):
+            if time.perf_counter() - started > REPORT_TIMEOUT:
+                break
+            await asyncio.sleep(REPORT_POLL_INTERVAL)
+            response = await session.client.get(f"/api/v1/report/{task_id}")
+            status = response.json()["task"]["status"]
+
+        if started >= session.record_after:
+            session.latencies.append(time.perf_counter() - started)
+            session.errors += status != "SUCCESS"
+        return True
+
+    return step
+
+
+SCENARIOS = {"browse": browse, "cold": cold, "writes": writes, "report": report}
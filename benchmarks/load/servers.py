@@ -0,0 +1,117 @@
+"""Throughput of server configurations, each one started in turn.
+
+Needs docker-compose-test services (make up-bench-services) and the
+environment of the app, DATABASE_URL and REDIS_HOST of them. The app is
+started by its launcher with server settings of the configuration:
+
+    python -m benchmarks.load.servers --workers 4 --scenario browse
+
+"default" is the former launcher, one worker with asyncio and h11. The
+others are compared with it.
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from dataclasses import asdict
+
+import httpx
+
+from benchmarks.load.driver import print_stats, run
+from benchmarks.load.scenarios import SCENARIOS, cleanup, seed
+
+STARTUP_TIMEOUT = 30.0  # seconds
+
+
+def configurations(workers: int) -> dict[str, dict[str, str]]:
+    return {
+        "default": {"SERVER_LOOP": "asyncio", "SERVER_HTTP": "h11", "WORKERS": "1"},
+        "uvloop": {"SERVER_LOOP": "uvloop", "SERVER_HTTP": "httptools", "WORKERS": "1"},
+        "workers": {
+            "SERVER_LOOP": "uvloop",
+            "SERVER_HTTP": "httptools",
+            "WORKERS": str(workers),
+        },
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load.servers")
+    parser.add_argument("--port", type=int, default=8010)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[name for name in SCENARIOS if name != "report"],
+        help="repeat for several, default: browse",
+    )
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds")
+    parser.add_argument("--warmup", type=float, default=3.0, help="seconds")
+    parser.add_argument("--menus", type=int, default=5)
+    parser.add_argument("--submenus", type=int, default=5, help="per menu")
+    parser.add_argument("--dishes", type=int, default=10, help="per submenu")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+async def wait_started(client: httpx.AsyncClient, server: subprocess.Popen) -> None:
+    deadline = time.perf_counter() + STARTUP_TIMEOUT
+    while time.perf_counter() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"Server exited with code {server.returncode}")
+        try:
+            await client.get("/metrics")
+            return
+        except httpx.TransportError:
+            await asyncio.sleep(0.2)
+    raise RuntimeError("Server didn't start in time")
+
+
+async def bench(args: argparse.Namespace, name: str, env: dict[str, str]) -> dict:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "src.presentation.api.asgi"],
+        env={**os.environ, **env, "PORT": str(args.port), "LOOP_LAG_THRESHOLD": ""},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    results = {}
+    try:
+        limits = httpx.Limits(max_connections=args.concurrency)
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{args.port}", limits=limits, timeout=60
+        ) as client:
+            await wait_started(client, server)
+            dataset = await seed(client, args.menus, args.submenus, args.dishes)
+            try:
+                for scenario in args.scenario or ["browse"]:
+                    stats = await run(
+                        client,
+                        SCENARIOS[scenario](dataset),
+                        concurrency=args.concurrency,
+                        duration=args.duration,
+                        warmup=args.warmup,
+                        seed=args.seed,
+                    )
+                    results[scenario] = stats
+            finally:
+                await cleanup(client, dataset)
+    finally:
+        server.terminate()
+        server.wait()
+    return results
+
+
+async def main(args: argparse.Namespace) -> None:
+    baseline: dict[str, dict] = {}
+    for name, env in configurations(args.workers).items():
+        print(f"{name}: {', '.join(f'{key}={value}' for key, value in env.items())}")
+        for scenario, stats in (await bench(args, name, env)).items():
+            print_stats(scenario, stats, baseline.get(scenario))
+            baseline.setdefault(scenario, asdict(stats))
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
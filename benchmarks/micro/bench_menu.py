@@ -0,0 +1,49 @@
+"""Menu use cases and cache serialization over synthetic trees
+
+    pytest benchmarks/micro -o python_files="bench_*.py" --benchmark-only
+"""
+import json
+
+from benchmarks.micro.fakes import FakeCache, FakeUoW
+from src.domain.menu.usecases.menu import GetMenu, GetMenus, get_len
+
+
+def test_get_len(benchmark, loop, menus):
+    submenus = [submenu for menu in menus for submenu in menu.submenus]
+
+    benchmark(lambda: loop.run_until_complete(get_len(submenus, dishes=True)))
+
+
+def test_menu_to_dto(benchmark, menus):
+    benchmark(lambda: [menu.to_dto(1, 1).dict() for menu in menus])
+
+
+def test_menu_to_tree_dto(benchmark, menus):
+    benchmark(lambda: [menu.to_tree_dto().dict() for menu in menus])
+
+
+def test_get_menus_cache_miss(benchmark, loop, menus):
+    uow = FakeUoW(menus)
+
+    benchmark(lambda: loop.run_until_complete(GetMenus(uow, FakeCache())()))
+
+
+def test_get_menus_cache_hit(benchmark, loop, menus):
+    uow, cache = FakeUoW(menus), FakeCache()
+    loop.run_until_complete(GetMenus(uow, cache)())
+
+    benchmark(lambda: loop.run_until_complete(GetMenus(uow, cache)()))
+
+
+def test_get_menu_cache_miss(benchmark, loop, menus):
+    uow, menu_id = FakeUoW(menus), str(menus[-1].id)
+
+    benchmark(
+        lambda: loop.run_until_complete(GetMenu(uow, FakeCache())(menu_id, load=True))
+    )
+
+
+def test_cache_serialization(benchmark, menus):
+    trees = [menu.to_tree_dto().dict() for menu in menus]
+
+    benchmark(lambda: json.loads(json.dumps(trees)))
@@ -0,0 +1,51 @@
+"""Report data collection and rendering over synthetic trees"""
+import shutil
+
+import pytest
+
+from benchmarks.micro.fakes import FakeUoW
+from src.domain.report.dto.report import ReportFormat
+from src.domain.report.usecases.report import GetReportData
+from src.presentation.celery.tasks import collect_menu_data
+
+
+def test_get_report_data(benchmark, loop, menus):
+    uow = FakeUoW(menus)
+
+    benchmark(lambda: loop.run_until_complete(GetReportData(uow)()))
+
+
+@pytest.mark.parametrize("report_format", list(ReportFormat), ids=str)
+def test_collect_menu_data(
+    benchmark, report_menus, report_format, tmp_path, settings_env
+):
+    """Cold build, reports and fragments of the previous round are removed"""
+
+    def setup():
+        shutil.rmtree(tmp_path / "reports", ignore_errors=True)
+
+    benchmark.pedantic(
+        collect_menu_data,
+        args=(report_menus, report_format.value),
+        setup=setup,
+        rounds=5,
+    )
+
+
+def test_collect_menu_data_cached_fragments(
+    benchmark, report_menus, tmp_path, settings_env
+):
+    """Excel rebuild after a report change, menus fragments are cached"""
+    collect_menu_data(report_menus, ReportFormat.xlsx.value)
+
+    def setup():
+        # Fragments are kept in the fragments subdirectory
+        for path in (tmp_path / "reports").glob("*_menu.*"):
+            path.unlink()
+
+    benchmark.pedantic(
+        collect_menu_data,
+        args=(report_menus, ReportFormat.xlsx.value),
+        setup=setup,
+        rounds=5,
+    )
@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+from benchmarks.micro.fakes import FakeUoW, build_menus
+from src.domain.report.usecases.report import GetReportData
+
+# (menus, submenus per menu, dishes per submenu)
+SIZES = {"small": (2, 3, 5), "medium": (10, 10, 10), "large": (20, 20, 50)}
+
+
+@pytest.fixture
+def settings_env(tmp_path, monkeypatch):
+    """Settings of a task, services aren't used by benchmarks"""
+    for name in ("DATABASE_URL", "DATABASE_TEST_URL", "BROKER_URL"):
+        monkeypatch.setenv(name, "postgresql+asyncpg://benchmark@localhost/benchmark")
+    for name in ("REDIS_HOST", "REDIS_TEST_CACHE"):
+        monkeypatch.setenv(name, "localhost")
+    monkeypatch.setenv("REPORT_STORAGE", "local")
+    monkeypatch.setenv("REPORT_DIR", str(tmp_path / "reports"))
+
+
+@pytest.fixture(scope="session")
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session", params=SIZES.values(), ids=SIZES.keys())
+def menus(request):
+    return build_menus(*request.param)
+
+
+@pytest.fixture(scope="session")
+def report_menus(loop, menus):
+    return loop.run_until_complete(GetReportData(FakeUoW(menus))())
@@ -0,0 +1,100 @@
+"""In-memory cache and unit of work, use cases run without Postgres and Redis"""
+import hashlib
+import uuid
+from decimal import Decimal
+from types import SimpleNamespace
+
+from src.domain.common.interfaces.cache import ICache
+from src.infrastructure.db.models.dish import Dish
+from src.infrastructure.db.models.menu import Menu
+from src.infrastructure.db.models.submenu import SubMenu
+
+
+class FakeCache(ICache):
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.fields: dict[str, dict[str, str]] = {}
+
+    async def get(self, name: str) -> str | None:
+        return self.values.get(name)
+
+    async def put(self, name: str, value: str, expire_at: int | None = None) -> None:
+        self.values[name] = value
+
+    async def delete(self, name: str) -> None:
+        self.values.pop(name, None)
+        self.fields.pop(name, None)
+
+    async def get_many(self, names: list[str]) -> list[str | None]:
+        return [self.values.get(name) for name in names]
+
+    async def put_many(self, values: dict[str, str]) -> None:
+        self.values.update(values)
+
+    async def get_etag(self, name: str) -> str | None:
+        value = self.values.get(name)
+        if value is None:
+            return None
+        return f'"{hashlib.sha1(value.encode()).hexdigest()}"'
+
+    async def get_field(self, name: str, field: str) -> str | None:
+        return self.fields.get(name, {}).get(field)
+
+    async def put_field(
+        self, name: str, field: str, value: str, expire_at: int | None = None
+    ) -> None:
+        self.fields.setdefault(name, {})[field] = value
+
+
+class FakeMenuRepository:
+    def __init__(self, menus: list[Menu]):
+        self.menus = {str(menu.id): menu for menu in menus}
+
+    async def get_all(self) -> list[Menu]:
+        return list(self.menus.values())
+
+    async def get_by_id_all(self, id_: str, load: bool) -> Menu | None:
+        return self.menus.get(id_)
+
+    async def get_tree(self, id_: str) -> Menu | None:
+        return self.menus.get(id_)
+
+
+class FakeUoW:
+    def __init__(self, menus: list[Menu]):
+        self.menu_holder = SimpleNamespace(menu_repo=FakeMenuRepository(menus))
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+
+def build_menus(menus: int, submenus: int, dishes: int) -> list[Menu]:
+    """Transient ORM objects, submenus per menu and dishes per submenu"""
+    return [
+        Menu(
+            id=uuid.uuid4(),
+            title=f"menu {menu_number}",
+            description=f"description of menu {menu_number}",
+            submenus=[
+                SubMenu(
+                    id=uuid.uuid4(),
+                    title=f"submenu {menu_number}.{submenu_number}",
+                    description="description of submenu",
+                    dishes=[
+                        Dish(
+                            id=uuid.uuid4(),
+                            title=f"dish {menu_number}.{submenu_number}.{number}",
+                            description="description of dish",
+                            price=Decimal(f"{10 + number * 1.25:.2f}"),
+                        )
+                        for number in range(dishes)
+                    ],
+                )
+                for submenu_number in range(submenus)
+            ],
+        )
+        for menu_number in range(menus)
+    ]
@@ -0,0 +1,87 @@
+"""Event loop lag during a burst of report tasks publishing.
+
+Run from the project root:
+
+    python -m benchmarks.tasks_sender
+"""
+import asyncio
+import math
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from src.infrastructure.tasks_sender.celery.celery import CeleryTasksSender
+
+PUBLISH_LATENCY = 0.02  # seconds of broker I/O for one send_task
+BURST = 50
+PROBE_INTERVAL = 0.001
+
+
+class SlowCelery:
+    """Celery app stand-in, send_task blocks like a publish to the broker"""
+
+    def __init__(self):
+        self.backend = SimpleNamespace(store_result=lambda *args: None)
+
+    def send_task(
+        self, name: str, args: tuple, task_id: str | None = None
+    ) -> SimpleNamespace:
+        time.sleep(PUBLISH_LATENCY)
+        return SimpleNamespace(id=task_id or name)
+
+
+async def probe_lag(stop: asyncio.Event) -> list[float]:
+    lags = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - started - PROBE_INTERVAL)
+    return lags
+
+
+async def run_burst(publish) -> tuple[float, list[float]]:
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_lag(stop))
+    await asyncio.sleep(PROBE_INTERVAL)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(publish() for _ in range(BURST)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    return elapsed, await probe
+
+
+def report(name: str, elapsed: float, lags: list[float]) -> None:
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    p99 = lags_ms[math.ceil(len(lags_ms) * 0.99) - 1]
+    print(
+        f"{name:<10} burst {elapsed * 1000:8.1f} ms | loop lag "
+        f"p50 {statistics.median(lags_ms):7.2f} ms, p99 {p99:7.2f} ms, "
+        f"max {lags_ms[-1]:7.2f} ms"
+    )
+
+
+async def main() -> None:
+    celery_app = SlowCelery()
+
+    async def blocking_publish():
+        # Previous behaviour: send_task called right in the coroutine
+        return celery_app.send_task("collect_menu_data", args=([], "xlsx")).id
+
+    sender = CeleryTasksSender(
+        celery_app,  # type: ignore
+        ThreadPoolExecutor(thread_name_prefix="celery-publish"),
+    )
+
+    async def offloaded_publish():
+        return await sender.collect_menu_data([], "xlsx")
+
+    print(f"{BURST} reports, {PUBLISH_LATENCY * 1000:.0f} ms broker latency each")
+    report("blocking", *await run_burst(blocking_publish))
+    report("offloaded", *await run_burst(offloaded_publish))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,7 @@
+from src.domain.common.exceptions.base import AppException
+
+
+class FieldsNotAllowed(AppException):
+    """Requested fields are not in the output entity"""
+
+    pass
@@ -10,3 +10,20 @@ class ICache(Protocol):
 
     async def delete(self, name: str) -> None:
         pass
+
+    async def get_many(self, names: list[str]) -> list[str | None]:
+        pass
+
+    async def put_many(self, values: dict[str, str]) -> None:
+        pass
+
+    async def get_etag(self, name: str) -> str | None:
+        pass
+
+    async def get_field(self, name: str, field: str) -> str | None:
+        pass
+
+    async def put_field(
+        self, name: str, field: str, value: str, expire_at: int | None = None
+    ) -> None:
+        pass
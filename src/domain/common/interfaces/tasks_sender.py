@@ -1,9 +1,6 @@
-from typing import Any, Protocol
+from typing import Protocol
 
 
 class TasksSender(Protocol):
-    def collect_menu_data(self, menu: list[dict]) -> str:
-        pass
-
-    def get_info_by_task_id(self, task_id: str) -> Any:
+    async def collect_menu_data(self, menu: list[dict], report_format: str) -> str:
         pass
@@ -0,0 +1,40 @@
+import json
+from collections.abc import Awaitable, Callable
+
+from src.domain.common.interfaces.cache import ICache
+
+
+async def get_batch(
+    cache: ICache,
+    entity: str,
+    ids: list[str],
+    load: Callable[[list[str]], Awaitable[dict[str, dict]]],
+) -> tuple[list[dict], list[str]]:
+    """Entities by ids in request order and ids which weren't found
+
+    Cache is read with one call, only misses are loaded and written back
+    to the cache with one call too. Keys are "{entity}-{id}" like the ones of
+    single entities, so a menu isn't taken for a submenu with the same id.
+    """
+    ids = list(dict.fromkeys(ids))
+
+    found = {
+        id_: json.loads(value)
+        for id_, value in zip(
+            ids, await cache.get_many([f"{entity}-{id_}" for id_ in ids])
+        )
+        if value
+    }
+
+    missed = [id_ for id_ in ids if id_ not in found]
+    if missed:
+        loaded = await load(missed)
+        if loaded:
+            await cache.put_many(
+                {f"{entity}-{id_}": json.dumps(item) for id_, item in loaded.items()}
+            )
+            found.update(loaded)
+
+    return [found[id_] for id_ in ids if id_ in found], [
+        id_ for id_ in ids if id_ not in found
+    ]
@@ -0,0 +1,17 @@
+from src.domain.common.dto.base import DTO
+from src.domain.common.exceptions.fields import FieldsNotAllowed
+
+
+def get_projection(fields: str | None, dto: type[DTO]) -> list[str] | None:
+    """Fields from "fields" query parameter in order of the DTO
+
+    The same set of fields gives the same projection, so it can be a cache key.
+    """
+    if not fields:
+        return None
+
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    if not requested or requested - dto.__fields__.keys():
+        raise FieldsNotAllowed
+
+    return [field for field in dto.__fields__ if field in requested]
@@ -1,3 +1,6 @@
+from decimal import Decimal
+from typing import Literal
+
 from src.domain.common.dto.base import DTO
 from src.domain.menu.dto.menu import BaseMenu
 
@@ -14,6 +17,42 @@ class OutputDish(DTO):
     price: str
 
 
+class FoundDish(OutputDish):
+    menu_id: str
+    submenu_id: str
+
+
+class DishesBatch(DTO):
+    items: list[OutputDish]
+    not_found: list[str]
+
+
+DishSort = Literal["price", "-price"]
+
+
+def _key_part(value: Decimal | str | None) -> str:
+    return "" if value is None else str(value)
+
+
+class DishFilter(DTO):
+    min_price: Decimal | None = None
+    max_price: Decimal | None = None
+    sort: DishSort | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return self.min_price is None and self.max_price is None and not self.sort
+
+    @property
+    def key(self) -> str:
+        """Cache key part, equal filters give the same key"""
+        # min_price=0 is a filter, it doesn't match the missing one
+        return (
+            f"min={_key_part(self.min_price)}:max={_key_part(self.max_price)}"
+            f":sort={_key_part(self.sort)}"
+        )
+
+
 class CreateDish(BaseDish):
     menu_id: str
     submenu_id: str
@@ -24,3 +24,8 @@ class UpdateMenu(BaseMenu):
     menu_id: str
     title: str | None = None  # type: ignore
     description: str | None = None  # type: ignore
+
+
+class MenusBatch(DTO):
+    items: list[OutputMenu]
+    not_found: list[str]
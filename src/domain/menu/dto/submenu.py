@@ -15,6 +15,11 @@ class OutputSubMenu(DTO):
     dishes_count: int = 0
 
 
+class SubMenusBatch(DTO):
+    items: list[OutputSubMenu]
+    not_found: list[str]
+
+
 class CreateSubMenu(BaseSubMenu):
     menu_id: str
 
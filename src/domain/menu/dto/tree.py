@@ -0,0 +1,11 @@
+from src.domain.menu.dto.dish import OutputDish
+from src.domain.menu.dto.menu import OutputMenu
+from src.domain.menu.dto.submenu import OutputSubMenu
+
+
+class SubMenuTree(OutputSubMenu):
+    dishes: list[OutputDish] = []
+
+
+class MenuTree(OutputMenu):
+    submenus: list[SubMenuTree] = []
@@ -2,9 +2,14 @@ from abc import ABC
 
 from src.domain.common.interfaces.cache import ICache
 from src.domain.menu.interfaces.uow import IMenuUoW
+from src.infrastructure.tracing import trace_calls
 
 
 class MenuUseCase(ABC):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        trace_calls(cls)
+
     def __init__(self, uow: IMenuUoW, cache: ICache) -> None:
         self.uow = uow
         self.cache = cache
@@ -1,9 +1,19 @@
 import json
 import logging
+import re
 
 from src.domain.common.exceptions.repo import DataEmptyError, UniqueError
 from src.domain.common.interfaces.cache import ICache
-from src.domain.menu.dto.dish import CreateDish, OutputDish, UpdateDish
+from src.domain.common.usecases.batch import get_batch
+from src.domain.common.usecases.fields import get_projection
+from src.domain.menu.dto.dish import (
+    CreateDish,
+    DishesBatch,
+    DishFilter,
+    FoundDish,
+    OutputDish,
+    UpdateDish,
+)
 from src.domain.menu.exceptions.dish import (
     DishAlreadyExists,
     DishDataEmpty,
@@ -15,19 +25,28 @@ from src.domain.menu.interfaces.usecases import DishUseCase
 
 logger = logging.getLogger("main_logger")
 
+# Search results aren't invalidated by dish changes, they live shortly
+SEARCH_CACHE_EXPIRE = 60
+# Every price range is a field of filtered lists, their hash expires anyway
+FILTERED_CACHE_EXPIRE = 60
+
 
 async def clean_cache(
     cache: ICache, menu_id: str, submenu_id: str, dish_id: str | None = None
 ) -> None:
     await cache.delete("menus")
+    await cache.delete("menus-fields")
     await cache.delete("submenus")
     await cache.delete(f"submenus-{menu_id}")
     await cache.delete(f"dishes-{submenu_id}")
-    await cache.delete(menu_id)
-    await cache.delete(submenu_id)
+    await cache.delete(f"dishes-{submenu_id}-fields")
+    await cache.delete(f"dishes-{submenu_id}-filtered")
+    await cache.delete(f"tree-{menu_id}")
+    await cache.delete(f"menu-{menu_id}")
+    await cache.delete(f"submenu-{submenu_id}")
 
     if dish_id:
-        await cache.delete(dish_id)
+        await cache.delete(f"dish-{dish_id}")
 
 
 class GetDishes(DishUseCase):
@@ -47,9 +66,36 @@ class GetDishes(DishUseCase):
         return dishes
 
 
+class GetDishesProjection(DishUseCase):
+    async def __call__(
+        self, submenu_id: str, fields: list[str], dish_filter: DishFilter | None = None
+    ) -> list[dict]:
+        name = f"dishes-{submenu_id}-fields"
+        projection = ",".join(fields)
+        expire_at = None
+        if dish_filter is not None:
+            # Dropped with the dishes too, but expire, price ranges are endless
+            name = f"dishes-{submenu_id}-filtered"
+            projection = f"{projection}:{dish_filter.key}"
+            expire_at = FILTERED_CACHE_EXPIRE
+
+        cache = await self.cache.get_field(name, projection)
+        if cache:
+            return json.loads(cache)
+
+        dishes = await self.uow.menu_holder.dish_repo.get_by_submenu_projected(
+            submenu_id, fields, dish_filter
+        )
+        if dishes:
+            await self.cache.put_field(
+                name, projection, json.dumps(dishes), expire_at=expire_at
+            )
+        return dishes
+
+
 class GetDish(DishUseCase):
     async def __call__(self, submenu_id: str, dish_id: str) -> OutputDish | str:
-        cache = await self.cache.get(dish_id)
+        cache = await self.cache.get(f"dish-{dish_id}")
         if cache:
             return json.loads(cache)
 
@@ -57,12 +103,51 @@ class GetDish(DishUseCase):
             submenu_id, dish_id
         )
         if dish:
-            await self.cache.put(dish_id, json.dumps(dish.to_dto().dict()))
+            await self.cache.put(f"dish-{dish_id}", json.dumps(dish.to_dto().dict()))
             return dish.to_dto()
 
         raise DishNotExists
 
 
+class GetDishesBatch(DishUseCase):
+    async def __call__(self, dish_ids: list[str]) -> DishesBatch:
+        items, not_found = await get_batch(self.cache, "dish", dish_ids, self._load)
+        return DishesBatch.parse_obj({"items": items, "not_found": not_found})
+
+    async def _load(self, dish_ids: list[str]) -> dict[str, dict]:
+        dishes = await self.uow.menu_holder.dish_repo.get_by_ids(dish_ids)
+        return {str(dish.id): dish.to_dto().dict() for dish in dishes}
+
+
+class SearchDishes(DishUseCase):
+    async def __call__(self, query: str, limit: int) -> list[FoundDish] | list[dict]:
+        words = re.findall(r"\w+", query.lower())
+        if not words:
+            return []
+
+        cache_key = f"search-{limit}-{' '.join(words)}"
+
+        cache = await self.cache.get(cache_key)
+        if cache:
+            return json.loads(cache)
+
+        found = [
+            FoundDish(
+                **dish.to_dto().dict(),
+                menu_id=str(menu_id),
+                submenu_id=str(dish.submenu_id),
+            ).dict()
+            for dish, menu_id in await self.uow.menu_holder.dish_repo.search(
+                words, limit
+            )
+        ]
+        await self.cache.put(
+            cache_key, json.dumps(found), expire_at=SEARCH_CACHE_EXPIRE
+        )
+
+        return found
+
+
 class AddDish(DishUseCase):
     async def __call__(self, data: CreateDish) -> OutputDish:
         try:
@@ -73,7 +158,9 @@ class AddDish(DishUseCase):
 
         await clean_cache(self.cache, data.menu_id, data.submenu_id)
 
-        await self.cache.put(str(new_dish.id), json.dumps(new_dish.to_dto().dict()))
+        await self.cache.put(
+            f"dish-{new_dish.id}", json.dumps(new_dish.to_dto().dict())
+        )
 
         logger.info("Created new dish - %s", data.title)
 
@@ -98,7 +185,9 @@ class DeleteDish(DishUseCase):
 
 
 class PatchDish(DishUseCase):
-    async def __call__(self, submenu_id: str, dish_id: str, data: dict) -> None:
+    async def __call__(
+        self, menu_id: str, submenu_id: str, dish_id: str, data: dict
+    ) -> None:
         try:
             await self.uow.menu_holder.dish_repo.update_obj(dish_id, **data)
             await self.uow.commit()
@@ -109,8 +198,11 @@ class PatchDish(DishUseCase):
 
         logger.info("Dish was updated - %s", dish_id)
 
-        await self.cache.delete(dish_id)
+        await self.cache.delete(f"dish-{dish_id}")
         await self.cache.delete(f"dishes-{submenu_id}")
+        await self.cache.delete(f"dishes-{submenu_id}-fields")
+        await self.cache.delete(f"dishes-{submenu_id}-filtered")
+        await self.cache.delete(f"tree-{menu_id}")
 
 
 class DishService:
@@ -118,6 +210,16 @@ class DishService:
         self.uow = uow
         self.cache = cache
 
+    async def get_dishes_projection(
+        self, submenu_id: str, fields: str | None, dish_filter: DishFilter
+    ) -> list[dict]:
+        """Dishes narrowed to fields, filtered and sorted, all fields by default"""
+        return await GetDishesProjection(self.uow, self.cache)(
+            submenu_id,
+            get_projection(fields, OutputDish) or list(OutputDish.__fields__),
+            None if dish_filter.is_empty else dish_filter,
+        )
+
     async def get_dishes(
         self, menu_id: str, submenu_id: str
     ) -> list[OutputDish] | str | None:
@@ -126,6 +228,14 @@ class DishService:
         # raiseSubMenuNotExists ЗАКОММЕНТИРОВАЛ, Т.К.
         # ошибка мешает тестам в постмане, но по логике должна присутствовать
 
+    async def get_dishes_batch(self, dish_ids: list[str]) -> DishesBatch:
+        return await GetDishesBatch(self.uow, self.cache)(dish_ids)
+
+    async def search_dishes(
+        self, query: str, limit: int
+    ) -> list[FoundDish] | list[dict]:
+        return await SearchDishes(self.uow, self.cache)(query, limit)
+
     async def get_dish(self, submenu_id: str, dish_id: str) -> OutputDish | str:
         return await GetDish(self.uow, self.cache)(submenu_id, dish_id)
 
@@ -141,8 +251,15 @@ class DishService:
 
     async def update_dish(self, data: UpdateDish) -> OutputDish | str:
         await PatchDish(self.uow, self.cache)(
+            data.menu_id,
             data.submenu_id,
             data.dish_id,
             data.dict(exclude_none=True, exclude={"menu_id", "submenu_id", "dish_id"}),
         )
         return await GetDish(self.uow, self.cache)(data.submenu_id, data.dish_id)
+
+    async def get_dishes_etag(self, submenu_id: str) -> str | None:
+        return await self.cache.get_etag(f"dishes-{submenu_id}")
+
+    async def get_dish_etag(self, dish_id: str) -> str | None:
+        return await self.cache.get_etag(f"dish-{dish_id}")
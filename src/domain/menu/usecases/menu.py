@@ -3,7 +3,9 @@ import logging
 
 from src.domain.common.exceptions.repo import DataEmptyError, UniqueError
 from src.domain.common.interfaces.cache import ICache
-from src.domain.menu.dto.menu import CreateMenu, OutputMenu, UpdateMenu
+from src.domain.common.usecases.batch import get_batch
+from src.domain.common.usecases.fields import get_projection
+from src.domain.menu.dto.menu import CreateMenu, MenusBatch, OutputMenu, UpdateMenu
 from src.domain.menu.exceptions.menu import (
     MenuAlreadyExists,
     MenuDataEmpty,
@@ -11,27 +13,50 @@ from src.domain.menu.exceptions.menu import (
 )
 from src.domain.menu.interfaces.uow import IMenuUoW
 from src.domain.menu.interfaces.usecases import MenuUseCase
+from src.infrastructure.db.models.menu import Menu
 from src.infrastructure.db.models.submenu import SubMenu
+from src.infrastructure.offload import serialize
 
 logger = logging.getLogger("main_logger")
 
 
-async def get_len(sub_menus: list[SubMenu], dishes: bool = False) -> int:
+def count_len(sub_menus: list[SubMenu], dishes: bool = False) -> int:
     if dishes:
-        counter = 0
+        return sum(len(sub_menu.dishes) for sub_menu in sub_menus)
 
-        for sub_menu in sub_menus:
-            for _ in sub_menu.dishes:
-                counter += 1
+    return len(sub_menus)
 
-        return counter
 
-    return len(sub_menus)
+async def get_len(sub_menus: list[SubMenu], dishes: bool = False) -> int:
+    return count_len(sub_menus, dishes)
+
+
+def get_tree_size(menus: list[Menu]) -> int:
+    """Menus, submenus and dishes, objects to serialize"""
+    return sum(
+        1 + count_len(menu.submenus) + count_len(menu.submenus, dishes=True)
+        for menu in menus
+    )
+
+
+def serialize_menus(menus: list[Menu]) -> str:
+    return json.dumps(
+        [
+            menu.to_dto(
+                count_len(menu.submenus), count_len(menu.submenus, dishes=True)
+            ).dict()
+            for menu in menus
+        ]
+    )
+
+
+def serialize_tree(menu: Menu) -> str:
+    return json.dumps(menu.to_tree_dto().dict())
 
 
 class GetMenu(MenuUseCase):
     async def __call__(self, menu_id: str, load: bool) -> OutputMenu | str:
-        cache = await self.cache.get(menu_id)
+        cache = await self.cache.get(f"menu-{menu_id}")
         if cache:
             return json.loads(cache)
         menu = await self.uow.menu_holder.menu_repo.get_by_id_all(menu_id, load)
@@ -39,29 +64,75 @@ class GetMenu(MenuUseCase):
             result_menu = menu.to_dto(
                 await get_len(menu.submenus), await get_len(menu.submenus, dishes=True)
             ).dict()
-            await self.cache.put(menu_id, json.dumps(result_menu))
+            await self.cache.put(f"menu-{menu_id}", json.dumps(result_menu))
             return result_menu
 
         raise MenuNotExists
 
 
+class GetMenuTree(MenuUseCase):
+    """JSON of the tree, it's sent as is without parsing and validation"""
+
+    async def __call__(self, menu_id: str) -> str | bytes:
+        cache = await self.cache.get(f"tree-{menu_id}")
+        if cache:
+            return cache
+
+        menu = await self.uow.menu_holder.menu_repo.get_tree(menu_id)
+        if menu:
+            dump = await serialize(
+                "menu_tree", get_tree_size([menu]), serialize_tree, menu
+            )
+            await self.cache.put(f"tree-{menu_id}", dump)
+            return dump
+
+        raise MenuNotExists
+
+
+class GetMenusProjection(MenuUseCase):
+    async def __call__(self, fields: list[str]) -> list[dict]:
+        projection = ",".join(fields)
+
+        cache = await self.cache.get_field("menus-fields", projection)
+        if cache:
+            return json.loads(cache)
+
+        menus = await self.uow.menu_holder.menu_repo.get_all_projected(fields)
+        if menus:
+            await self.cache.put_field("menus-fields", projection, json.dumps(menus))
+        return menus
+
+
 class GetMenus(MenuUseCase):
-    async def __call__(self) -> list[OutputMenu] | str:
+    """JSON of the menus, it's sent as is without parsing and validation"""
+
+    async def __call__(self) -> str | bytes:
         cache = await self.cache.get("menus")
         if cache:
-            return json.loads(cache)
+            return cache
         menus = await self.uow.menu_holder.menu_repo.get_all()
         if menus:
-            output_menus = [
-                menu.to_dto(
-                    await get_len(menu.submenus),
-                    await get_len(menu.submenus, dishes=True),
-                ).dict()
-                for menu in menus
-            ]
-            await self.cache.put("menus", json.dumps(output_menus))
-            return output_menus
-        return menus
+            dump = await serialize(
+                "menus", get_tree_size(menus), serialize_menus, menus
+            )
+            await self.cache.put("menus", dump)
+            return dump
+        return "[]"
+
+
+class GetMenusBatch(MenuUseCase):
+    async def __call__(self, menu_ids: list[str]) -> MenusBatch:
+        items, not_found = await get_batch(self.cache, "menu", menu_ids, self._load)
+        return MenusBatch.parse_obj({"items": items, "not_found": not_found})
+
+    async def _load(self, menu_ids: list[str]) -> dict[str, dict]:
+        menus = await self.uow.menu_holder.menu_repo.get_by_ids_all(menu_ids)
+        return {
+            str(menu.id): menu.to_dto(
+                await get_len(menu.submenus), await get_len(menu.submenus, dishes=True)
+            ).dict()
+            for menu in menus
+        }
 
 
 class AddMenu(MenuUseCase):
@@ -72,8 +143,11 @@ class AddMenu(MenuUseCase):
         except UniqueError:
             raise MenuAlreadyExists
 
-        await self.cache.put(str(new_menu.id), json.dumps(new_menu.to_dto().dict()))
+        await self.cache.put(
+            f"menu-{new_menu.id}", json.dumps(new_menu.to_dto().dict())
+        )
         await self.cache.delete("menus")
+        await self.cache.delete("menus-fields")
 
         logger.info("New menu - %s", data.title)
 
@@ -87,8 +161,11 @@ class DeleteMenu(MenuUseCase):
             await self.uow.menu_holder.menu_repo.delete(menu_obj)
             await self.uow.commit()
 
-            await self.cache.delete(str(menu_obj.id))
+            await self.cache.delete(f"menu-{menu_obj.id}")
+            await self.cache.delete(f"tree-{menu_obj.id}")
+            await self.cache.delete(f"submenus-{menu_obj.id}")
             await self.cache.delete("menus")
+            await self.cache.delete("menus-fields")
 
             logger.info("Menu was deleted - %s", menu_obj.title)
             return
@@ -108,8 +185,10 @@ class PatchMenu(MenuUseCase):
 
         logger.info("Menus was updated - %s", menu_id)
 
-        await self.cache.delete(menu_id)
+        await self.cache.delete(f"menu-{menu_id}")
+        await self.cache.delete(f"tree-{menu_id}")
         await self.cache.delete("menus")
+        await self.cache.delete("menus-fields")
 
 
 class MenuService:
@@ -122,12 +201,32 @@ class MenuService:
     async def create_menu(self, data: CreateMenu) -> OutputMenu:
         return await AddMenu(self.uow, self.cache)(data)
 
-    async def get_menus(self) -> list[OutputMenu] | str | None:
+    async def get_menus(self) -> str | bytes:
         return await GetMenus(self.uow, self.cache)()
 
+    async def get_menus_projection(self, fields: str) -> list[dict]:
+        return await GetMenusProjection(self.uow, self.cache)(
+            get_projection(fields, OutputMenu) or list(OutputMenu.__fields__)
+        )
+
     async def get_menu(self, menu_id: str) -> OutputMenu | str:
         return await GetMenu(self.uow, self.cache)(menu_id, load=True)
 
+    async def get_menus_batch(self, menu_ids: list[str]) -> MenusBatch:
+        return await GetMenusBatch(self.uow, self.cache)(menu_ids)
+
+    async def get_menu_tree(self, menu_id: str) -> str | bytes:
+        return await GetMenuTree(self.uow, self.cache)(menu_id)
+
+    async def get_menus_etag(self) -> str | None:
+        return await self.cache.get_etag("menus")
+
+    async def get_menu_etag(self, menu_id: str) -> str | None:
+        return await self.cache.get_etag(f"menu-{menu_id}")
+
+    async def get_menu_tree_etag(self, menu_id: str) -> str | None:
+        return await self.cache.get_etag(f"tree-{menu_id}")
+
     async def delete_menu(self, menu_id: str) -> None:
         return await DeleteMenu(self.uow, self.cache)(menu_id)
 
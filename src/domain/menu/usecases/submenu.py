@@ -3,7 +3,13 @@ import logging
 
 from src.domain.common.exceptions.repo import DataEmptyError, UniqueError
 from src.domain.common.interfaces.cache import ICache
-from src.domain.menu.dto.submenu import CreateSubMenu, OutputSubMenu, UpdateSubMenu
+from src.domain.common.usecases.batch import get_batch
+from src.domain.menu.dto.submenu import (
+    CreateSubMenu,
+    OutputSubMenu,
+    SubMenusBatch,
+    UpdateSubMenu,
+)
 from src.domain.menu.exceptions.menu import MenuNotExists
 from src.domain.menu.exceptions.submenu import (
     SubMenuAlreadyExists,
@@ -20,7 +26,7 @@ class GetSubMenu(SubMenuUseCase):
     async def __call__(  # type: ignore
         self, menu_id: str, submenu_id: str, load: bool
     ) -> OutputSubMenu | str:
-        cache = await self.cache.get(submenu_id)
+        cache = await self.cache.get(f"submenu-{submenu_id}")
         if cache:
             return json.loads(cache)
         submenu = await self.uow.menu_holder.submenu_repo.get_by_menu_and_id(
@@ -28,7 +34,8 @@ class GetSubMenu(SubMenuUseCase):
         )
         if submenu:
             await self.cache.put(
-                submenu_id, json.dumps(submenu.to_dto(len(submenu.dishes)).dict())
+                f"submenu-{submenu_id}",
+                json.dumps(submenu.to_dto(len(submenu.dishes)).dict()),
             )
             return submenu.to_dto(len(submenu.dishes))
 
@@ -39,7 +46,7 @@ class GetSubMenus(SubMenuUseCase):
     async def __call__(self, menu_id: str) -> list[OutputSubMenu] | str | None:  # type: ignore
         cache = await self.cache.get(f"submenus-{menu_id}")
         if cache:
-            return cache
+            return json.loads(cache)
 
         submenus = await self.uow.menu_holder.submenu_repo.get_by_menu_id(
             menu_id, load=True
@@ -54,6 +61,21 @@ class GetSubMenus(SubMenuUseCase):
         return submenus
 
 
+class GetSubMenusBatch(SubMenuUseCase):
+    async def __call__(self, submenu_ids: list[str]) -> SubMenusBatch:  # type: ignore
+        items, not_found = await get_batch(
+            self.cache, "submenu", submenu_ids, self._load
+        )
+        return SubMenusBatch.parse_obj({"items": items, "not_found": not_found})
+
+    async def _load(self, submenu_ids: list[str]) -> dict[str, dict]:
+        submenus = await self.uow.menu_holder.submenu_repo.get_by_ids_all(submenu_ids)
+        return {
+            str(submenu.id): submenu.to_dto(len(submenu.dishes)).dict()
+            for submenu in submenus
+        }
+
+
 class AddSubMenu(SubMenuUseCase):
     async def __call__(self, data: CreateSubMenu) -> OutputSubMenu:
         try:
@@ -63,11 +85,13 @@ class AddSubMenu(SubMenuUseCase):
             raise SubMenuNotExists
 
         await self.cache.delete(f"submenus-{data.menu_id}")
-        await self.cache.delete(data.menu_id)
+        await self.cache.delete(f"tree-{data.menu_id}")
+        await self.cache.delete(f"menu-{data.menu_id}")
         await self.cache.delete("menus")
+        await self.cache.delete("menus-fields")
 
         await self.cache.put(
-            str(new_submenu.id), json.dumps(new_submenu.to_dto().dict())
+            f"submenu-{new_submenu.id}", json.dumps(new_submenu.to_dto().dict())
         )
 
         logger.info("New submenu - %s", data.title)
@@ -84,10 +108,12 @@ class DeleteSubMenu(SubMenuUseCase):
             await self.uow.menu_holder.submenu_repo.delete(submenu_obj)
             await self.uow.commit()
 
-            await self.cache.delete(submenu_id)
-            await self.cache.delete(menu_id)
+            await self.cache.delete(f"submenu-{submenu_id}")
+            await self.cache.delete(f"menu-{menu_id}")
             await self.cache.delete(f"submenus-{menu_id}")
+            await self.cache.delete(f"tree-{menu_id}")
             await self.cache.delete("menus")
+            await self.cache.delete("menus-fields")
 
             logger.info("Submenu was deleted - %s", submenu_obj.title)
 
@@ -108,9 +134,11 @@ class PatchSubMenu(SubMenuUseCase):
 
         logger.info("Submenu was updated - %s", submenu_id)
 
-        await self.cache.delete(submenu_id)
+        await self.cache.delete(f"submenu-{submenu_id}")
         await self.cache.delete(f"submenus-{menu_id}")
+        await self.cache.delete(f"tree-{menu_id}")
         await self.cache.delete("menus")
+        await self.cache.delete("menus-fields")
 
 
 class SubMenuService:
@@ -144,5 +172,14 @@ class SubMenuService:
 
         raise MenuNotExists
 
+    async def get_submenus_batch(self, submenu_ids: list[str]) -> SubMenusBatch:
+        return await GetSubMenusBatch(self.uow, self.cache)(submenu_ids)
+
     async def get_submenu(self, menu_id: str, submenu_id: str) -> OutputSubMenu | str:
         return await GetSubMenu(self.uow, self.cache)(menu_id, submenu_id, load=True)
+
+    async def get_submenus_etag(self, menu_id: str) -> str | None:
+        return await self.cache.get_etag(f"submenus-{menu_id}")
+
+    async def get_submenu_etag(self, submenu_id: str) -> str | None:
+        return await self.cache.get_etag(f"submenu-{submenu_id}")
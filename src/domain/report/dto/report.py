@@ -1,6 +1,16 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
 from src.domain.common.dto.base import DTO
 
 
+class ReportFormat(str, Enum):
+    xlsx = "xlsx"
+    csv = "csv"
+    json = "json"
+
+
 class ReportDish(DTO):
     title: str
     description: str
@@ -19,6 +29,29 @@ class ReportMenu(DTO):
     submenus: list[ReportSubMenu]
 
 
+class ReportInfo(DTO):
+    name: str
+    size: int
+    row_count: int
+    generated_at: datetime
+
+
+class TaskResult(DTO):
+    status: str
+    result: Any = None
+    progress: int = 0
+
+
 class ReportStatusTask(DTO):
     status: str
+    progress: int = 0
     link: str | None = None
+    report: ReportInfo | None = None
+
+
+class ReportFile(DTO):
+    name: str
+    size: int
+    etag: str
+    modified_at: datetime
+    compressed: bool = False
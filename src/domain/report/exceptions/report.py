@@ -11,3 +11,9 @@ class ReportDataEmpty(ReportException):
     """Report data empty exception"""
 
     pass
+
+
+class TaskNotFound(ReportException):
+    """Report task is unknown or its result expired"""
+
+    pass
@@ -0,0 +1,23 @@
+from typing import BinaryIO, Protocol
+
+from src.domain.report.dto.report import ReportFile
+
+
+class IReportStorage(Protocol):
+    def save(self, name: str, path: str, compressed: bool = False) -> None:
+        pass
+
+    def stat(self, name: str) -> ReportFile | None:
+        pass
+
+    def touch(self, name: str) -> ReportFile | None:
+        """Mark the report as just generated, retention counts from now"""
+
+    def open(self, name: str, start: int = 0, end: int | None = None) -> BinaryIO:
+        pass
+
+    def delete(self, name: str) -> None:
+        pass
+
+    def list(self) -> list[ReportFile]:
+        pass
@@ -0,0 +1,12 @@
+from collections.abc import AsyncIterator
+from typing import Protocol
+
+from src.domain.report.dto.report import TaskResult
+
+
+class ITaskResults(Protocol):
+    async def get(self, task_id: str) -> TaskResult | None:
+        pass
+
+    def watch(self, task_id: str) -> AsyncIterator[TaskResult]:
+        pass
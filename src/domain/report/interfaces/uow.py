@@ -1,6 +1,7 @@
 from src.domain.common.interfaces.uow import IBaseUoW
-from src.infrastructure.db.uow import MenuHolder
+from src.infrastructure.db.uow import MenuHolder, ReportHolder
 
 
 class IReportUoW(IBaseUoW):
     menu_holder: MenuHolder
+    report_holder: ReportHolder
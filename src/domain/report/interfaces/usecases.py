@@ -1,8 +1,13 @@
 from abc import ABC
 
 from src.domain.report.interfaces.uow import IReportUoW
+from src.infrastructure.tracing import trace_calls
 
 
 class ReportUseCase(ABC):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        trace_calls(cls)
+
     def __init__(self, uow: IReportUoW):
         self.uow = uow
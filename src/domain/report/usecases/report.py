@@ -1,62 +1,101 @@
+from collections.abc import AsyncIterator
+
+from src.domain.menu.usecases.menu import get_tree_size
 from src.domain.report.dto.report import (
     ReportDish,
+    ReportFormat,
     ReportMenu,
     ReportStatusTask,
     ReportSubMenu,
+    TaskResult,
 )
-from src.domain.report.exceptions.report import ReportDataEmpty
+from src.domain.report.exceptions.report import ReportDataEmpty, TaskNotFound
+from src.domain.report.interfaces.task_results import ITaskResults
 from src.domain.report.interfaces.tasks_sender import IReportTasksSender
 from src.domain.report.interfaces.uow import IReportUoW
 from src.domain.report.interfaces.usecases import ReportUseCase
+from src.infrastructure.db.models.menu import Menu
+from src.infrastructure.offload import serialize
+
+
+def build_report_menus(menus: list[Menu]) -> list[dict]:
+    return [
+        ReportMenu(
+            title=menu.title,
+            description=menu.description,
+            submenus=[
+                ReportSubMenu(
+                    title=submenu.title,
+                    description=submenu.description,
+                    dishes=[
+                        ReportDish(
+                            title=dish.title,
+                            description=dish.description,
+                            price=dish.price,
+                        )
+                        for dish in submenu.dishes
+                    ],
+                )
+                for submenu in menu.submenus
+            ],
+        ).dict()
+        for menu in menus
+    ]
 
 
 class GetReportData(ReportUseCase):
     async def __call__(self) -> list[dict]:
-        result = []
-
         menus = await self.uow.menu_holder.menu_repo.get_all()
 
-        for menu in menus:
-            result.append(
-                ReportMenu(
-                    title=menu.title,
-                    description=menu.description,
-                    submenus=[
-                        ReportSubMenu(
-                            title=submenu.title,
-                            description=submenu.description,
-                            dishes=[
-                                ReportDish(
-                                    title=dish.title,
-                                    description=dish.description,
-                                    price=dish.price,
-                                )
-                                for dish in submenu.dishes
-                            ],
-                        )
-                        for submenu in menu.submenus
-                    ],
-                ).dict()
-            )
-
-        return result
+        return await serialize(
+            "report_data", get_tree_size(menus), build_report_menus, menus
+        )
 
 
 class ReportService:
-    def __init__(self, tasks_sender: IReportTasksSender, uow: IReportUoW):
+    def __init__(
+        self,
+        tasks_sender: IReportTasksSender,
+        task_results: ITaskResults,
+        uow: IReportUoW,
+    ):
         self.tasks_sender = tasks_sender
+        self.task_results = task_results
         self.uow = uow
 
     async def get_info_about_task(self, task_id: str) -> ReportStatusTask:
-        task = self.tasks_sender.get_info_by_task_id(task_id)
+        task = await self.task_results.get(task_id)
+        if task is None:
+            raise TaskNotFound(task_id)
+
+        return await self._get_status(task_id, task)
+
+    async def watch_task(self, task_id: str) -> AsyncIterator[ReportStatusTask]:
+        async for task in self.task_results.watch(task_id):
+            yield await self._get_status(task_id, task)
 
-        return ReportStatusTask(status=task.status, link=task.result)
+    async def _get_status(self, task_id: str, task: TaskResult) -> ReportStatusTask:
+        if task.status != "SUCCESS":
+            return ReportStatusTask(status=task.status, progress=task.progress)
 
-    async def collect_menu_data(self) -> str:
+        report = await self.uow.report_holder.report_repo.get_by_task_id(task_id)
+
+        return ReportStatusTask(
+            status=task.status,
+            progress=task.progress,
+            link=task.result,
+            report=report.to_dto() if report else None,
+        )
+
+    async def collect_menu_data(
+        self, report_format: ReportFormat = ReportFormat.xlsx
+    ) -> str:
         report_menus = await GetReportData(self.uow)()
 
         if report_menus:
-            task_id = self.tasks_sender.collect_menu_data(report_menus)
+            task_id = await self.tasks_sender.collect_menu_data(
+                report_menus, report_format.value
+            )
 
             return task_id
 
@@ -4,15 +4,32 @@ from redis.asyncio.client import Redis  # type: ignore
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
+from src.infrastructure.db.query_log import setup_query_log
+from src.infrastructure.tracing import instrument_engine
+
 logger = logging.getLogger("main_logger")
 
 Base = declarative_base()
 
 
-def create_pool(database_url: str, echo_mode: bool) -> sessionmaker:
+def create_pool(
+    database_url: str,
+    echo_mode: bool,
+    slow_query_threshold: float | None = None,
+    pool_size: int = 5,
+    max_overflow: int = 10,
+) -> sessionmaker:
     logger.info("Create connections pool for DB")
 
-    engine = create_async_engine(url=database_url, echo=echo_mode, future=True)
+    engine = create_async_engine(
+        url=database_url,
+        echo=echo_mode,
+        future=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+    )
+    setup_query_log(engine, slow_query_threshold)
+    instrument_engine(engine)
     pool = sessionmaker(
         bind=engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
     )
@@ -0,0 +1,28 @@
+"""Dish search
+
+Revision ID: 8f1b0c4e2a7d
+Revises: 3a7d2c91b5e4
+Create Date: 2026-10-19 16:20:05.104127
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8f1b0c4e2a7d"
+down_revision = "3a7d2c91b5e4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_dish_search ON dish USING gin "
+        "(to_tsvector('simple'::regconfig, (title || ' ') || description))"
+    )
+    op.execute("CREATE INDEX ix_dish_title_trgm ON dish USING gin (title gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_dish_title_trgm", table_name="dish")
+    op.drop_index("ix_dish_search", table_name="dish")
@@ -0,0 +1,41 @@
+"""Dish price numeric
+
+Revision ID: b52e9d7f1c30
+Revises: 8f1b0c4e2a7d
+Create Date: 2026-10-19 17:05:41.518302
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b52e9d7f1c30"
+down_revision = "8f1b0c4e2a7d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "dish",
+        "price",
+        existing_type=sa.String(length=10),
+        type_=sa.Numeric(precision=12, scale=2),
+        existing_nullable=False,
+        postgresql_using="price::numeric(12, 2)",
+    )
+    op.create_index(
+        "ix_dish_submenu_price", "dish", ["submenu_id", "price"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_dish_submenu_price", table_name="dish")
+    op.alter_column(
+        "dish",
+        "price",
+        existing_type=sa.Numeric(precision=12, scale=2),
+        type_=sa.String(length=19),
+        existing_nullable=False,
+        postgresql_using="price::text",
+    )
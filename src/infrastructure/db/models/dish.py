@@ -1,19 +1,23 @@
 import uuid
+from decimal import Decimal
 
-from sqlalchemy import Column, ForeignKey, String, Text
+from sqlalchemy import Column, ForeignKey, Index, Numeric, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from src.domain.menu.dto.dish import OutputDish
 from src.infrastructure.db.base import Base
 
+# Constants are inlined, so queries use the same expression as the index
+SEARCH_CONFIG = text("'simple'::regconfig")
+
 
 class Dish(Base):
     __tablename__ = "dish"
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String(32), unique=True, nullable=False)
     description = Column(Text, nullable=False)
-    price = Column(String(19), nullable=False)
+    price = Column(Numeric(12, 2), nullable=False)
 
     submenu_id = Column(UUID, ForeignKey("submenu.id", ondelete="CASCADE"))
 
@@ -24,5 +28,29 @@ class Dish(Base):
             id=str(self.id),
             title=self.title,
             description=self.description,
-            price=self.price,
+            price=format_price(self.price),
         )
+
+
+def format_price(price: Decimal | str) -> str:
+    """Wire format of a price, two decimal places"""
+    return f"{Decimal(price):.2f}"
+
+
+def dish_search_vector():
+    table = Dish.__table__
+    return func.to_tsvector(
+        SEARCH_CONFIG,
+        table.c.title.op("||")(text("' '")).op("||")(table.c.description),
+    )
+
+
+# Price filters are scoped by submenu
+Index("ix_dish_submenu_price", Dish.submenu_id, Dish.price)
+Index("ix_dish_search", dish_search_vector(), postgresql_using="gin")
+Index(
+    "ix_dish_title_trgm",
+    Dish.title,
+    postgresql_using="gin",
+    postgresql_ops={"title": "gin_trgm_ops"},
+)
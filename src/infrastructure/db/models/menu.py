@@ -5,6 +5,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from src.domain.menu.dto.menu import OutputMenu
+from src.domain.menu.dto.tree import MenuTree
 from src.infrastructure.db.base import Base
 
 
@@ -24,3 +25,15 @@ class Menu(Base):
             submenus_count=submenus_count,
             dishes_count=dishes_count,
         )
+
+    def to_tree_dto(self) -> MenuTree:
+        submenus = [submenu.to_tree_dto() for submenu in self.submenus]
+
+        return MenuTree(
+            id=str(self.id),
+            title=self.title,
+            description=self.description,
+            submenus_count=len(submenus),
+            dishes_count=sum(submenu.dishes_count for submenu in submenus),
+            submenus=submenus,
+        )
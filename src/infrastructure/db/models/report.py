@@ -0,0 +1,25 @@
+import uuid
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.domain.report.dto.report import ReportInfo
+from src.infrastructure.db.base import Base
+
+
+class Report(Base):
+    __tablename__ = "report"
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    task_id = Column(String(36), unique=True, nullable=False)
+    name = Column(String(64), nullable=False, index=True)
+    size = Column(BigInteger, nullable=False)
+    row_count = Column(Integer, nullable=False)
+    generated_at = Column(DateTime(timezone=True), nullable=False)
+
+    def to_dto(self) -> ReportInfo:
+        return ReportInfo(
+            name=self.name,
+            size=self.size,
+            row_count=self.row_count,
+            generated_at=self.generated_at,
+        )
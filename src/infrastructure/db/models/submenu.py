@@ -5,6 +5,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from src.domain.menu.dto.submenu import OutputSubMenu
+from src.domain.menu.dto.tree import SubMenuTree
 from src.infrastructure.db.base import Base
 
 
@@ -26,3 +27,12 @@ class SubMenu(Base):
             description=self.description,
             dishes_count=dishes_count,
         )
+
+    def to_tree_dto(self) -> SubMenuTree:
+        return SubMenuTree(
+            id=str(self.id),
+            title=self.title,
+            description=self.description,
+            dishes_count=len(self.dishes),
+            dishes=[dish.to_dto() for dish in self.dishes],
+        )
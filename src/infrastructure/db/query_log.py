@@ -0,0 +1,107 @@
+"""Slow query log and query counter by engine events
+
+Statements are attributed to the repository method which runs them,
+the method is kept in a context variable.
+"""
+import inspect
+import logging
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger("main_logger")
+
+T = TypeVar("T", bound=type)
+
+MAX_LOGGED_PARAMETERS = 1000  # characters
+
+_repository_method: ContextVar[str | None] = ContextVar(
+    "repository_method", default=None
+)
+
+
+class QueryCounter:
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def most_repeated(self) -> tuple[str, int]:
+        """Statement issued most times and its count, N+1 loads repeat one"""
+        if not self.statements:
+            return "", 0
+        return Counter(self.statements).most_common(1)[0]
+
+
+_query_counter: ContextVar[QueryCounter | None] = ContextVar(
+    "query_counter", default=None
+)
+
+
+class TooManyQueries(Exception):
+    """More queries than expected for one request, usually N+1 lazy loads"""
+
+
+def _tracked(method: Callable) -> Callable:
+    @wraps(method)
+    async def wrapped(self, *args: Any, **kwargs: Any):
+        token = _repository_method.set(f"{type(self).__name__}.{method.__name__}")
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            _repository_method.reset(token)
+
+    return wrapped
+
+
+def track_repository(cls: T) -> T:
+    """Statements of public coroutine methods are logged with the method name"""
+    for name, method in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.iscoroutinefunction(method):
+            setattr(cls, name, _tracked(method))
+    return cls
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """Statements executed in the block, in this context only"""
+    counter = QueryCounter()
+    token = _query_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _query_counter.reset(token)
+
+
+def setup_query_log(engine: AsyncEngine, slow_query_threshold: float | None) -> None:
+    """Log statements slower than the threshold (seconds) and count statements"""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def start_query(conn, cursor, statement, parameters, context, executemany):
+        context._query_started = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def end_query(conn, cursor, statement, parameters, context, executemany):
+        counter = _query_counter.get()
+        if counter is not None:
+            counter.statements.append(statement)
+
+        elapsed = time.perf_counter() - context._query_started
+        if slow_query_threshold is not None and elapsed >= slow_query_threshold:
+            logger.warning(
+                "Slow query %.3fs in %s: %s; parameters: %.*s",
+                elapsed,
+                _repository_method.get() or "unknown",
+                statement,
+                MAX_LOGGED_PARAMETERS,
+                repr(parameters),
+            )
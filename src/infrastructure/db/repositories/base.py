@@ -1,15 +1,30 @@
 from typing import Generic, TypeVar
 
-from sqlalchemy import select, update
+from sqlalchemy import any_, literal, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.db.base import Base
 from src.infrastructure.db.exception_mapper import exception_mapper
+from src.infrastructure.db.query_log import track_repository
+from src.infrastructure.metrics import time_repository
 
 Model = TypeVar("Model", bound=Base)
 
 
+def any_ids(ids: list[str]):
+    """ANY with one array parameter, statement is the same for any number of ids"""
+    return any_(literal(ids, ARRAY(UUID(as_uuid=False))))
+
+
+@time_repository
+@track_repository
 class BaseRepository(Generic[Model]):
+    def __init_subclass__(cls, **kwargs):
+        # Query duration and slow statements of every method, by repository class
+        super().__init_subclass__(**kwargs)
+        time_repository(track_repository(cls))
+
     def __init__(self, model: type[Model], session: AsyncSession):
         self._model = model
         self._session = session
@@ -18,6 +33,10 @@ class BaseRepository(Generic[Model]):
         query = select(self._model).where(self._model.id == id_)
         return (await self._session.execute(query)).scalar_one_or_none()
 
+    async def get_by_ids(self, ids: list[str]) -> list[Model]:
+        query = select(self._model).where(self._model.id == any_ids(ids))
+        return (await self._session.execute(query)).scalars().all()
+
     async def get_all(self) -> list[Model]:
         result = await self._session.execute(select(self._model))
         return result.scalars().all()
@@ -1,9 +1,13 @@
-from sqlalchemy import and_, select
+from decimal import Decimal
+
+from sqlalchemy import String, and_, cast, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
 
-from src.domain.menu.dto.dish import CreateDish
+from src.domain.menu.dto.dish import CreateDish, DishFilter
 from src.infrastructure.db.exception_mapper import exception_mapper
-from src.infrastructure.db.models.dish import Dish
+from src.infrastructure.db.models.dish import SEARCH_CONFIG, Dish, dish_search_vector
+from src.infrastructure.db.models.submenu import SubMenu
 from src.infrastructure.db.repositories.base import BaseRepository
 
 
@@ -11,10 +15,76 @@ class DishRepository(BaseRepository[Dish]):
     def __init__(self, session: AsyncSession):
         super().__init__(Dish, session)
 
-    async def get_by_submenu(self, submenu_id: str) -> list[Dish]:
+    def _filtered(self, query: Select, dish_filter: DishFilter | None) -> Select:
+        """Price range and order, served by the price index"""
+        if dish_filter is None:
+            return query
+        if dish_filter.min_price is not None:
+            query = query.where(self._model.price >= dish_filter.min_price)
+        if dish_filter.max_price is not None:
+            query = query.where(self._model.price <= dish_filter.max_price)
+        if dish_filter.sort == "price":
+            query = query.order_by(self._model.price, self._model.title)
+        elif dish_filter.sort == "-price":
+            query = query.order_by(self._model.price.desc(), self._model.title)
+        return query
+
+    async def get_by_submenu(
+        self, submenu_id: str, dish_filter: DishFilter | None = None
+    ) -> list[Dish]:
         query = select(self._model).where(self._model.submenu_id == submenu_id)
+        query = self._filtered(query, dish_filter)
         return (await self._session.execute(query)).scalars().all()
 
+    async def get_by_submenu_projected(
+        self, submenu_id: str, fields: list[str], dish_filter: DishFilter | None = None
+    ) -> list[dict]:
+        columns = {
+            "id": cast(self._model.id, String),
+            "title": self._model.title,
+            "description": self._model.description,
+            # numeric(12, 2) as text keeps two decimal places
+            "price": cast(self._model.price, String),
+        }
+        query = select(*(columns[field].label(field) for field in fields)).where(
+            self._model.submenu_id == submenu_id
+        )
+        query = self._filtered(query, dish_filter)
+        result = (await self._session.execute(query)).mappings().all()
+        return [dict(row) for row in result]
+
+    async def search(self, words: list[str], limit: int) -> list[tuple[Dish, str]]:
+        """Dishes with menu id, full-text prefix match or similar title
+
+        Both conditions are served by GIN indexes, by the search vector and
+        by title trigrams.
+        """
+        vector = dish_search_vector()
+        ts_query = func.to_tsquery(
+            SEARCH_CONFIG, " & ".join(f"{word}:*" for word in words)
+        )
+        phrase = " ".join(words)
+
+        query = (
+            select(self._model, SubMenu.menu_id)
+            .join(SubMenu, self._model.submenu_id == SubMenu.id)
+            .where(
+                or_(
+                    vector.op("@@")(ts_query),
+                    self._model.title.op("%")(phrase),
+                )
+            )
+            .order_by(
+                func.greatest(
+                    func.ts_rank(vector, ts_query),
+                    func.similarity(self._model.title, phrase),
+                ).desc(),
+                self._model.title,
+            )
+            .limit(limit)
+        )
+        return (await self._session.execute(query)).all()
+
     async def get_by_submenu_and_id(self, submenu_id: str, dish_id: str) -> Dish:
         query = select(self._model).where(
             and_(self._model.id == dish_id, self._model.submenu_id == submenu_id)
@@ -26,7 +96,7 @@ class DishRepository(BaseRepository[Dish]):
         new_dish = self._model(
             title=dish.title,
             description=dish.description,
-            price=dish.price,
+            price=Decimal(dish.price),
             submenu_id=dish.submenu_id,
         )
         self._session.add(new_dish)
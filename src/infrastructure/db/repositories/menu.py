@@ -1,12 +1,13 @@
-from sqlalchemy import delete, select
+from sqlalchemy import String, cast, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import contains_eager, joinedload
 
 from src.domain.menu.dto.menu import CreateMenu
 from src.infrastructure.db.exception_mapper import exception_mapper
+from src.infrastructure.db.models.dish import Dish
 from src.infrastructure.db.models.menu import Menu
 from src.infrastructure.db.models.submenu import SubMenu
-from src.infrastructure.db.repositories.base import BaseRepository
+from src.infrastructure.db.repositories.base import BaseRepository, any_ids
 
 
 class MenuRepository(BaseRepository[Menu]):
@@ -20,6 +21,24 @@ class MenuRepository(BaseRepository[Menu]):
         result = (await self._session.execute(query)).unique().scalars().all()
         return result
 
+    async def get_all_projected(self, fields: list[str]) -> list[dict]:
+        """Only requested columns, counters are computed by the database"""
+        columns = {
+            "id": cast(self._model.id, String),
+            "title": self._model.title,
+            "description": self._model.description,
+            "submenus_count": select(func.count(SubMenu.id))
+            .where(SubMenu.menu_id == self._model.id)
+            .scalar_subquery(),
+            "dishes_count": select(func.count(Dish.id))
+            .join(SubMenu, Dish.submenu_id == SubMenu.id)
+            .where(SubMenu.menu_id == self._model.id)
+            .scalar_subquery(),
+        }
+        query = select(*(columns[field].label(field) for field in fields))
+        result = (await self._session.execute(query)).mappings().all()
+        return [dict(row) for row in result]
+
     async def get_by_id_all(self, id_: str, load: bool) -> Menu:
         query = select(self._model).where(self._model.id == id_)
         if load:
@@ -29,6 +48,29 @@ class MenuRepository(BaseRepository[Menu]):
         result = (await self._session.execute(query)).scalar()
         return result
 
+    async def get_by_ids_all(self, ids: list[str]) -> list[Menu]:
+        query = (
+            select(self._model)
+            .where(self._model.id == any_ids(ids))
+            .options(joinedload(self._model.submenus).joinedload(SubMenu.dishes))
+        )
+        return (await self._session.execute(query)).unique().scalars().all()
+
+    async def get_tree(self, id_: str) -> Menu | None:
+        """Menu with submenus and dishes from one query, ordered by titles"""
+        query = (
+            select(self._model)
+            .outerjoin(self._model.submenus)
+            .outerjoin(SubMenu.dishes)
+            .options(
+                contains_eager(self._model.submenus).contains_eager(SubMenu.dishes)
+            )
+            .where(self._model.id == id_)
+            .order_by(SubMenu.title, Dish.title)
+        )
+        result = (await self._session.execute(query)).unique().scalar()
+        return result
+
     async def delete_by_id(self, id_: str) -> None:
         query = delete(self._model).where(self._model.id == id_)
         await self._session.execute(query)
@@ -1,28 +1,86 @@
+import hashlib
 import logging
 
 from redis.asyncio import Redis  # type: ignore
 
 from src.domain.common.interfaces.cache import ICache
+from src.infrastructure.metrics import CACHE_OPERATION_DURATION, cache_result
 
 logger = logging.getLogger("main_logger")
 
+# ETag of the value lives next to it, so it's read without the value itself
+ETAG_KEY = "{name}:etag"
+
+
+def get_etag(value: str | bytes) -> str:
+    if isinstance(value, str):
+        value = value.encode()
+    return f'"{hashlib.sha1(value).hexdigest()}"'
+
 
 class RedisRepository(ICache):
     def __init__(self, redis: Redis):
         self._redis = redis
 
     async def get(self, name: str) -> str:
-        return await self._redis.get(name)
+        with CACHE_OPERATION_DURATION.labels(operation="get").time():
+            value = await self._redis.get(name)
+        cache_result(value)
+        return value
 
     async def put(self, name: str, value: str, expire_at: int | None = None) -> None:
-        logger.info("Set new value %s - %s", name, value)
+        # Values are whole lists and trees, only their size is logged
+        logger.debug("Set new value %s - %s bytes", name, len(value))
 
-        if expire_at:
-            await self._redis.set(name, value, ex=expire_at)
-            return
-
-        await self._redis.set(name, value)
+        with CACHE_OPERATION_DURATION.labels(operation="put").time():
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.set(name, value, ex=expire_at or None)
+                pipe.set(
+                    ETAG_KEY.format(name=name), get_etag(value), ex=expire_at or None
+                )
+                await pipe.execute()
 
     async def delete(self, name: str) -> None:
         logger.info("Delete value - %s", name)
-        await self._redis.delete(name)
+        with CACHE_OPERATION_DURATION.labels(operation="delete").time():
+            await self._redis.delete(name, ETAG_KEY.format(name=name))
+
+    async def get_many(self, names: list[str]) -> list[str | None]:
+        with CACHE_OPERATION_DURATION.labels(operation="get_many").time():
+            values = await self._redis.mget(names)
+        for value in values:
+            cache_result(value)
+        return values
+
+    async def put_many(self, values: dict[str, str]) -> None:
+        logger.debug("Set new values - %s keys", len(values))
+
+        with CACHE_OPERATION_DURATION.labels(operation="put_many").time():
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for name, value in values.items():
+                    pipe.set(name, value)
+                    pipe.set(ETAG_KEY.format(name=name), get_etag(value))
+                await pipe.execute()
+
+    async def get_etag(self, name: str) -> str | None:
+        with CACHE_OPERATION_DURATION.labels(operation="get_etag").time():
+            etag = await self._redis.get(ETAG_KEY.format(name=name))
+        return etag.decode() if etag else None
+
+    async def get_field(self, name: str, field: str) -> str | None:
+        with CACHE_OPERATION_DURATION.labels(operation="get_field").time():
+            value = await self._redis.hget(name, field)
+        cache_result(value)
+        return value
+
+    async def put_field(
+        self, name: str, field: str, value: str, expire_at: int | None = None
+    ) -> None:
+        """Expiry is set once, when the hash is created, new fields don't extend it"""
+        logger.debug("Set new value %s[%s] - %s bytes", name, field, len(value))
+        with CACHE_OPERATION_DURATION.labels(operation="put_field").time():
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.hset(name, field, value)
+                if expire_at:
+                    pipe.expire(name, expire_at, nx=True)
+                await pipe.execute()
@@ -0,0 +1,29 @@
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.report.dto.report import ReportInfo
+from src.infrastructure.db.exception_mapper import exception_mapper
+from src.infrastructure.db.models.report import Report
+from src.infrastructure.db.repositories.base import BaseRepository
+
+
+class ReportRepository(BaseRepository[Report]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(Report, session)
+
+    async def get_by_task_id(self, task_id: str) -> Report:
+        query = select(self._model).where(self._model.task_id == task_id)
+        return (await self._session.execute(query)).scalar()
+
+    async def delete_by_names(self, names: list[str]) -> None:
+        query = delete(self._model).where(self._model.name.in_(names))
+        await self._session.execute(query)
+
+    @exception_mapper
+    async def create_report(self, task_id: str, data: ReportInfo) -> Report:
+        new_report = self._model(task_id=task_id, **data.dict())
+
+        self._session.add(new_report)
+        await self._session.flush()
+
+        return new_report
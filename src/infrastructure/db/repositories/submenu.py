@@ -5,7 +5,7 @@ from sqlalchemy.orm import joinedload
 from src.domain.menu.dto.submenu import CreateSubMenu
 from src.infrastructure.db.exception_mapper import exception_mapper
 from src.infrastructure.db.models.submenu import SubMenu
-from src.infrastructure.db.repositories.base import BaseRepository
+from src.infrastructure.db.repositories.base import BaseRepository, any_ids
 
 
 class SubMenuRepository(BaseRepository[SubMenu]):
@@ -21,6 +21,14 @@ class SubMenuRepository(BaseRepository[SubMenu]):
         result = (await self._session.execute(query)).scalar()
         return result
 
+    async def get_by_ids_all(self, ids: list[str]) -> list[SubMenu]:
+        query = (
+            select(self._model)
+            .where(self._model.id == any_ids(ids))
+            .options(joinedload(self._model.dishes))
+        )
+        return (await self._session.execute(query)).unique().scalars().all()
+
     async def get_all(self) -> list[SubMenu]:
         query = select(self._model).options(joinedload(self._model.dishes))
         result = (await self._session.execute(query)).scalars().unique()
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.domain.common.interfaces.uow import IBaseUoW
 from src.infrastructure.db.repositories.dish import DishRepository
 from src.infrastructure.db.repositories.menu import MenuRepository
+from src.infrastructure.db.repositories.report import ReportRepository
 from src.infrastructure.db.repositories.submenu import SubMenuRepository
 
 
@@ -24,8 +25,14 @@ class MenuHolder:
         self.dish_repo = DishRepository(session)
 
 
+class ReportHolder:
+    def __init__(self, session: AsyncSession):
+        self.report_repo = ReportRepository(session)
+
+
 class SQLAlchemyUoW(SQLAlchemyBaseUoW):
     def __init__(self, session: AsyncSession):
         super().__init__(session)
 
         self.menu_holder = MenuHolder(session)
+        self.report_holder = ReportHolder(session)
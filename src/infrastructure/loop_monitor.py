@@ -0,0 +1,83 @@
+"""Event loop lag monitor, finds calls blocking the loop in the API process
+
+A coroutine wakes up every interval, the delay of its wake up is the lag.
+A watchdog thread follows the wake ups and takes the stack of the loop
+thread while the loop is still blocked, it shows the blocking call.
+"""
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from contextlib import suppress
+
+from src.infrastructure.metrics import EVENT_LOOP_BLOCKS, EVENT_LOOP_LAG
+
+logger = logging.getLogger("main_logger")
+
+
+class LoopLagMonitor:
+    def __init__(self, interval: float = 0.1, threshold: float = 0.1):
+        self.interval = interval  # seconds
+        self.threshold = threshold  # lag logged with the stack, seconds
+
+        self._beat = 0.0  # monotonic time of the last wake up
+        self._reported_beat = 0.0
+        self._loop_thread = 0
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    async def start(self) -> None:
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stopped.clear()
+
+        self._task = asyncio.create_task(self._measure())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-lag-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+
+    async def _measure(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(loop.time() - started - self.interval, 0.0)
+
+            beat, self._beat = self._beat, time.monotonic()
+            EVENT_LOOP_LAG.observe(lag)
+            if lag < self.threshold:
+                continue
+
+            EVENT_LOOP_BLOCKS.inc()
+            # Blocks shorter than the watchdog period have no stack
+            if self._reported_beat != beat:
+                logger.warning("Event loop lag %.3fs", lag)
+
+    def _watch(self) -> None:
+        period = min(self.interval, self.threshold) / 2
+        while not self._stopped.wait(period):
+            beat = self._beat
+            blocked = time.monotonic() - beat - self.interval
+            if blocked < self.threshold or self._reported_beat == beat:
+                continue
+
+            self._reported_beat = beat
+            frame = sys._current_frames().get(self._loop_thread)
+            logger.warning(
+                "Event loop blocked for %.3fs, loop thread stack:\n%s",
+                blocked,
+                "".join(traceback.format_stack(frame)) if frame else "unknown",
+            )
@@ -0,0 +1,104 @@
+"""Prometheus metrics of the application
+
+Several processes (uvicorn or celery workers) write their values to
+PROMETHEUS_MULTIPROC_DIR when it is set, the exporter merges them.
+"""
+import inspect
+import os
+from collections.abc import Callable
+from functools import wraps
+from typing import Any, TypeVar
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    multiprocess,
+)
+
+T = TypeVar("T", bound=type)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests", ["method", "path", "status"]
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request duration", ["method", "path"]
+)
+
+CACHE_REQUESTS = Counter("cache_requests_total", "Cache reads by result", ["result"])
+CACHE_OPERATION_DURATION = Histogram(
+    "cache_operation_duration_seconds",
+    "Cache operation duration",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Repository method duration",
+    ["repository", "method"],
+)
+
+SERIALIZATION_DURATION = Histogram(
+    "serialization_duration_seconds",
+    "DTO building and JSON encoding, executor=loop is time the loop was blocked",
+    ["operation", "executor"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "Delay of scheduled wake ups on the event loop",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+EVENT_LOOP_BLOCKS = Counter(
+    "event_loop_blocks_total", "Event loop lags over the logging threshold"
+)
+
+CELERY_TASK_QUEUE_WAIT = Histogram(
+    "celery_task_queue_wait_seconds",
+    "Time from task publishing to start on a worker",
+    ["task"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0),
+)
+CELERY_TASK_DURATION = Histogram(
+    "celery_task_duration_seconds",
+    "Task run time on a worker",
+    ["task", "state"],
+    buckets=(0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+)
+
+
+def get_registry() -> CollectorRegistry:
+    """Registry to export, values of all processes in multiprocess mode"""
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def cache_result(value: Any) -> None:
+    CACHE_REQUESTS.labels(result="miss" if value is None else "hit").inc()
+
+
+def _timed(method: Callable) -> Callable:
+    @wraps(method)
+    async def wrapped(self, *args: Any, **kwargs: Any):
+        histogram = DB_QUERY_DURATION.labels(
+            repository=type(self).__name__, method=method.__name__
+        )
+        with histogram.time():
+            return await method(self, *args, **kwargs)
+
+    return wrapped
+
+
+def time_repository(cls: T) -> T:
+    """Observe duration of public coroutine methods of a repository class"""
+    for name, method in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.iscoroutinefunction(method):
+            setattr(cls, name, _timed(method))
+    return cls
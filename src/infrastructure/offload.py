@@ -0,0 +1,48 @@
+"""CPU-heavy serialization of big results in executor threads
+
+Threads, not processes: results are built from ORM objects, pickling them
+to a process costs more than the build. The GIL is still shared, but the
+loop gets it back every switch interval and other requests go on.
+"""
+import asyncio
+import contextvars
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from src.infrastructure.metrics import SERIALIZATION_DURATION
+
+R = TypeVar("R")
+
+_threshold: int | None = None
+
+
+def setup_offload(threshold: int | None) -> None:
+    """Results of threshold objects and more are built in executor threads
+
+    None - everything runs on the loop.
+    """
+    global _threshold
+    _threshold = threshold
+
+
+async def serialize(operation: str, size: int, func: Callable[..., R], *args: Any) -> R:
+    """Result of func, in the default executor for big sizes
+
+    Time on the loop is the time the loop was blocked for other requests.
+    """
+    started = time.perf_counter()
+    if _threshold is not None and size >= _threshold:
+        executor = "thread"
+        # Executor threads don't inherit context, trace goes with a copy
+        result = await asyncio.get_running_loop().run_in_executor(
+            None, contextvars.copy_context().run, func, *args
+        )
+    else:
+        executor = "loop"
+        result = func(*args)
+
+    SERIALIZATION_DURATION.labels(operation=operation, executor=executor).observe(
+        time.perf_counter() - started
+    )
+    return result
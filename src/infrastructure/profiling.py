@@ -0,0 +1,104 @@
+"""Request profiles, pyinstrument HTML or cProfile stats without it
+
+Install pyinstrument with "profiling" extra, it follows awaits of the
+request task. cProfile sees every coroutine running on the loop meanwhile.
+"""
+import cProfile
+import logging
+import marshal
+import os
+from datetime import datetime, timezone
+
+from pydantic import BaseModel
+
+try:
+    from pyinstrument import Profiler as _Pyinstrument
+except ImportError:  # pragma: no cover
+    _Pyinstrument = None  # type: ignore
+
+logger = logging.getLogger("main_logger")
+
+
+class ProfileFile(BaseModel):
+    name: str
+    size: int
+    created_at: datetime
+
+
+class RequestProfiler:
+    """Profile of one request, started and stopped around the app call"""
+
+    def __init__(self) -> None:
+        self._profiler: "_Pyinstrument | cProfile.Profile"
+        if _Pyinstrument is not None:
+            self._profiler = _Pyinstrument(async_mode="enabled")
+            self.extension = "html"
+        else:
+            self._profiler = cProfile.Profile()
+            self.extension = "prof"
+
+    def start(self) -> None:
+        if isinstance(self._profiler, cProfile.Profile):
+            self._profiler.enable()
+        else:
+            self._profiler.start()
+
+    def stop(self) -> None:
+        if isinstance(self._profiler, cProfile.Profile):
+            self._profiler.disable()
+        else:
+            self._profiler.stop()
+
+    def render(self) -> bytes:
+        """Flame graph page or stats file for snakeviz/pstats, CPU heavy"""
+        if isinstance(self._profiler, cProfile.Profile):
+            self._profiler.create_stats()
+            return marshal.dumps(self._profiler.stats)  # pstats dump format
+        return self._profiler.output_html().encode()
+
+
+class ProfileStorage:
+    """Profiles in a directory, only the latest max_files are kept"""
+
+    def __init__(self, directory: str, max_files: int = 200):
+        self.directory = directory
+        self.max_files = max_files
+
+    def _path(self, name: str) -> str:
+        # Name comes from the admin url, it must not leave the directory
+        return os.path.join(self.directory, os.path.basename(name))
+
+    def save(self, name: str, content: bytes) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path(name), "wb") as file:
+            file.write(content)
+
+        for profile in self.list()[self.max_files :]:
+            os.remove(self._path(profile.name))
+
+    def path(self, name: str) -> str | None:
+        path = self._path(name)
+        return path if os.path.isfile(path) else None
+
+    def list(self) -> list[ProfileFile]:
+        """Newest first"""
+        if not os.path.isdir(self.directory):
+            return []
+
+        profiles = [
+            ProfileFile(
+                name=entry.name,
+                size=entry.stat().st_size,
+                created_at=datetime.fromtimestamp(
+                    entry.stat().st_mtime, tz=timezone.utc
+                ),
+            )
+            for entry in os.scandir(self.directory)
+            if entry.is_file() and not entry.name.startswith(".")
+        ]
+        # Names start with the request time, they order profiles of the same mtime
+        return sorted(
+            profiles,
+            key=lambda profile: (profile.created_at, profile.name),
+            reverse=True,
+        )
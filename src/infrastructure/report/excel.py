@@ -0,0 +1,123 @@
+"""Excel report written as SpreadsheetML directly
+
+Rows and cells go without coordinates, so XML of a menu doesn't depend on
+its position in the report and is cached as a fragment. Assembly only
+streams the fragments to the zip archive.
+"""
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+COLUMN_WIDTHS = {"A": 10, "B": 35, "C": 35, "D": 35, "E": 35, "F": 10}
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+DOCUMENT_RELS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+# Style 1 - bold Montserrat, every filled cell of the report
+STYLED = 1
+
+# Control characters aren't allowed in XML 1.0
+ILLEGAL_CHARACTERS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+CONTENT_TYPES = (
+    f"{XML_HEADER}"
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    "</Types>"
+)
+
+ROOT_RELS = (
+    f'{XML_HEADER}<Relationships xmlns="{RELS_NS}">'
+    f'<Relationship Id="rId1" Type="{DOCUMENT_RELS}/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+
+WORKBOOK = (
+    f'{XML_HEADER}<workbook xmlns="{MAIN_NS}" xmlns:r="{DOCUMENT_RELS}">'
+    '<sheets><sheet name="Sheet" sheetId="1" r:id="rId1"/></sheets>'
+    "</workbook>"
+)
+
+WORKBOOK_RELS = (
+    f'{XML_HEADER}<Relationships xmlns="{RELS_NS}">'
+    f'<Relationship Id="rId1" Type="{DOCUMENT_RELS}/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    f'<Relationship Id="rId2" Type="{DOCUMENT_RELS}/styles" Target="styles.xml"/>'
+    "</Relationships>"
+)
+
+STYLES = (
+    f'{XML_HEADER}<styleSheet xmlns="{MAIN_NS}">'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><name val="Montserrat"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/>'
+    "</border></borders>"
+    '<cellStyleXfs count="1">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    "</cellXfs>"
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/>'
+    "</cellStyles></styleSheet>"
+)
+
+
+def _render_cell(value: str | int | None) -> str:
+    if value is None:
+        return "<c/>"
+
+    if isinstance(value, int):
+        return f'<c s="{STYLED}"><v>{value}</v></c>'
+
+    text = escape(ILLEGAL_CHARACTERS.sub("", value))
+    return (
+        f'<c s="{STYLED}" t="inlineStr">'
+        f'<is><t xml:space="preserve">{text}</t></is></c>'
+    )
+
+
+def render_rows(rows: list[list]) -> bytes:
+    """Rows of the sheet, cells are placed one after another from column A"""
+    return "".join(
+        f"<row>{''.join(_render_cell(value) for value in row)}</row>" for row in rows
+    ).encode()
+
+
+def write_workbook(fragments: list[bytes], path: str) -> None:
+    """Report of menu fragments, each fragment lacks the menu number cell"""
+    columns = "".join(
+        f'<col min="{number}" max="{number}" width="{width}" customWidth="1"/>'
+        for number, width in enumerate(COLUMN_WIDTHS.values(), start=1)
+    )
+
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", CONTENT_TYPES)
+        archive.writestr("_rels/.rels", ROOT_RELS)
+        archive.writestr("xl/workbook.xml", WORKBOOK)
+        archive.writestr("xl/_rels/workbook.xml.rels", WORKBOOK_RELS)
+        archive.writestr("xl/styles.xml", STYLES)
+
+        with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write(
+                f'{XML_HEADER}<worksheet xmlns="{MAIN_NS}">'
+                f"<cols>{columns}</cols><sheetData>".encode()
+            )
+            for menu_counter, fragment in enumerate(fragments, start=1):
+                # Fragment starts with "<row>" of the menu, its number goes first
+                sheet.write(b"<row>" + _render_cell(menu_counter).encode())
+                sheet.write(fragment[len(b"<row>") :])
+            sheet.write(b"</sheetData></worksheet>")
@@ -0,0 +1,29 @@
+import csv
+import gzip
+
+import orjson
+
+from src.domain.report.dto.report import ReportFormat
+from src.infrastructure.report.excel import write_workbook
+from src.infrastructure.report.fragments import iter_report_rows
+
+# Text formats are stored gzipped, xlsx is a zip archive already
+COMPRESSED_FORMATS = (ReportFormat.csv, ReportFormat.json)
+
+
+def write_report(
+    report_format: ReportFormat,
+    report_menus: list[dict],
+    fragments: list[bytes],
+    path: str,
+) -> None:
+    if report_format == ReportFormat.json:
+        with gzip.open(path, "wb") as file:
+            file.write(orjson.dumps(report_menus))
+
+    elif report_format == ReportFormat.csv:
+        with gzip.open(path, "wt", encoding="utf-8", newline="") as file:
+            csv.writer(file).writerows(iter_report_rows(report_menus))
+
+    else:
+        write_workbook(fragments, path)
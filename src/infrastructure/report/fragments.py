@@ -0,0 +1,177 @@
+import hashlib
+import logging
+import math
+import os
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+
+import orjson
+
+from src.infrastructure.report.excel import render_rows
+from src.settings import Settings
+
+logger = logging.getLogger("main_logger")
+
+
+def get_fragments_dir(settings: Settings) -> str:
+    """Fragments are kept next to reports, on the volume shared by workers"""
+    return os.path.join(settings.report_dir, "fragments")
+
+
+def get_menu_version(menu: dict) -> str:
+    """Version of the menu is a hash of its report data"""
+    return hashlib.sha1(orjson.dumps(menu, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def get_report_version(menu_versions: list[str]) -> str:
+    return hashlib.sha1("".join(menu_versions).encode()).hexdigest()[:16]
+
+
+def render_menu_rows(menu: dict) -> list[list]:
+    """Lay out the rows of one menu, the menu number is set on assembly"""
+    rows: list[list] = [[None, menu["title"], menu["description"]]]
+
+    for submenu_counter, submenu in enumerate(menu["submenus"], start=1):
+        rows.append([None, submenu_counter, submenu["title"], submenu["description"]])
+
+        for dish_counter, dish in enumerate(submenu["dishes"], start=1):
+            rows.append(
+                [
+                    None,
+                    None,
+                    dish_counter,
+                    dish["title"],
+                    dish["description"],
+                    dish["price"],
+                ]
+            )
+
+    return rows
+
+
+def iter_report_rows(report_menus: list[dict]) -> Iterator[list]:
+    for menu_counter, menu in enumerate(report_menus, start=1):
+        menu_row, *rows = render_menu_rows(menu)
+
+        yield [menu_counter, *menu_row[1:]]
+        yield from rows
+
+
+def render_menu_fragment(menu: dict) -> bytes:
+    """Sheet XML of the menu rows without the menu number cell"""
+    menu_row, *rows = render_menu_rows(menu)
+    return render_rows([menu_row[1:], *rows])
+
+
+def fragment_path(directory: str, version: str) -> str:
+    return os.path.join(directory, f"{version}.xml")
+
+
+def get_menu_fragment(directory: str, menu: dict, version: str) -> bytes:
+    path = fragment_path(directory, version)
+
+    if os.path.exists(path):
+        os.utime(path)
+        with open(path, "rb") as file:
+            return file.read()
+
+    logger.info("Render report fragment - %s", menu["title"])
+
+    fragment = render_menu_fragment(menu)
+
+    os.makedirs(directory, exist_ok=True)
+    # Tasks with the same menu write it at once, each one to its own file
+    descriptor, temporary_path = tempfile.mkstemp(prefix=".", dir=directory)
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(fragment)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+    return fragment
+
+
+def render_fragments(
+    directory: str,
+    menus: list[dict],
+    menu_versions: list[str],
+    on_progress: Callable[[int, int], None] | None = None,
+) -> list[bytes]:
+    """Render fragments or take them from the cache
+
+    on_progress is called with count of rendered menus and count of all menus.
+    """
+    fragments = []
+    for menu, version in zip(menus, menu_versions):
+        fragments.append(get_menu_fragment(directory, menu, version))
+        if on_progress:
+            on_progress(len(fragments), len(menus))
+    return fragments
+
+
+def partition_missing_fragments(
+    directory: str, menus: list[dict], menu_versions: list[str], count: int
+) -> list[tuple[list[dict], list[str]]]:
+    """Split menus without cached fragments into at most count partitions"""
+    missing = [
+        (menu, version)
+        for menu, version in zip(menus, menu_versions)
+        if not os.path.exists(fragment_path(directory, version))
+    ]
+    if not missing:
+        return []
+
+    size = math.ceil(len(missing) / count)
+    return [
+        (
+            [menu for menu, _ in missing[start : start + size]],
+            [version for _, version in missing[start : start + size]],
+        )
+        for start in range(0, len(missing), size)
+    ]
+
+
+def count_report_rows(report_menus: list[dict]) -> int:
+    return sum(
+        1 + len(menu["submenus"]) + sum(len(sub["dishes"]) for sub in menu["submenus"])
+        for menu in report_menus
+    )
+
+
+def prune_fragments(directory: str, max_age: float, quota: int) -> int:
+    """Delete fragments not used for max_age seconds, then the least recently used
+    ones while total size exceeds quota"""
+    if not os.path.isdir(directory):
+        return 0
+
+    now = time.time()
+    # (modified, size, path) of every fragment
+    expired: list[tuple[float, int, str]] = []
+    kept: list[tuple[float, int, str]] = []
+    for entry in os.scandir(directory):
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            # Temporary file of a fragment was just renamed
+            continue
+
+        fragment = (stat.st_mtime, stat.st_size, entry.path)
+        (expired if now - stat.st_mtime > max_age else kept).append(fragment)
+
+    kept.sort()
+    total_size = sum(size for _, size, _ in kept)
+
+    for fragment in kept:
+        if total_size <= quota:
+            break
+
+        expired.append(fragment)
+        total_size -= fragment[1]
+
+    for _, _, path in expired:
+        os.remove(path)
+
+    return len(expired)
@@ -0,0 +1,25 @@
+from datetime import datetime, timedelta
+
+from src.domain.report.dto.report import ReportFile
+
+
+def select_expired_reports(
+    report_files: list[ReportFile], now: datetime, max_age: timedelta, quota: int
+) -> list[ReportFile]:
+    """Reports older than max_age, then the oldest ones while total size exceeds quota"""
+    expired = [file for file in report_files if now - file.modified_at > max_age]
+
+    kept = sorted(
+        (file for file in report_files if now - file.modified_at <= max_age),
+        key=lambda file: file.modified_at,
+    )
+    total_size = sum(file.size for file in kept)
+
+    for file in kept:
+        if total_size <= quota:
+            break
+
+        expired.append(file)
+        total_size -= file.size
+
+    return expired
@@ -0,0 +1,183 @@
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Any, BinaryIO
+
+from src.domain.report.dto.report import ReportFile
+from src.domain.report.interfaces.storage import IReportStorage
+from src.settings import Settings
+
+logger = logging.getLogger("main_logger")
+
+# Compressed reports are stored with this suffix and served with Content-Encoding
+COMPRESSED_SUFFIX = ".gz"
+
+
+def _stored_name(name: str, compressed: bool) -> str:
+    return f"{name}{COMPRESSED_SUFFIX}" if compressed else name
+
+
+def _report_name(stored_name: str) -> tuple[str, bool]:
+    if stored_name.endswith(COMPRESSED_SUFFIX):
+        return stored_name.removesuffix(COMPRESSED_SUFFIX), True
+    return stored_name, False
+
+
+class LocalReportStorage(IReportStorage):
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, stored_name: str) -> str:
+        # Name comes from the download url, it must not leave the directory
+        return os.path.join(self.directory, os.path.basename(stored_name))
+
+    def _file(self, stored_name: str) -> ReportFile | None:
+        try:
+            stat = os.stat(self._path(stored_name))
+        except FileNotFoundError:
+            return None
+
+        name, compressed = _report_name(stored_name)
+        return ReportFile(
+            name=name,
+            size=stat.st_size,
+            etag=f"{stat.st_mtime_ns:x}-{stat.st_size:x}",
+            modified_at=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            compressed=compressed,
+        )
+
+    def save(self, name: str, path: str, compressed: bool = False) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        os.replace(path, self._path(_stored_name(name, compressed)))
+
+    def stat(self, name: str) -> ReportFile | None:
+        return self._file(name) or self._file(_stored_name(name, compressed=True))
+
+    def touch(self, name: str) -> ReportFile | None:
+        report_file = self.stat(name)
+        if report_file is None:
+            return None
+
+        stored_name = _stored_name(name, report_file.compressed)
+        os.utime(self._path(stored_name))
+        return self._file(stored_name)
+
+    def open(self, name: str, start: int = 0, end: int | None = None) -> BinaryIO:
+        report_file = self.stat(name)
+        if report_file is None:
+            raise FileNotFoundError(name)
+
+        file = open(self._path(_stored_name(name, report_file.compressed)), "rb")
+        file.seek(start)
+        return file
+
+    def delete(self, name: str) -> None:
+        report_file = self.stat(name)
+        if report_file:
+            os.remove(self._path(_stored_name(name, report_file.compressed)))
+
+    def list(self) -> list[ReportFile]:
+        if not os.path.isdir(self.directory):
+            return []
+
+        report_files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.startswith("."):
+                report_file = self._file(entry.name)
+                if report_file:
+                    report_files.append(report_file)
+
+        return report_files
+
+
+class S3ReportStorage(IReportStorage):
+    """Storage for any S3-compatible service (AWS S3, MinIO, ...)"""
+
+    def __init__(self, client: Any, bucket: str):
+        self.client = client
+        self.bucket = bucket
+
+    def _objects(self, prefix: str = "") -> list[ReportFile]:
+        report_files = []
+        paginator = self.client.get_paginator("list_objects_v2")
+
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                name, compressed = _report_name(obj["Key"])
+                report_files.append(
+                    ReportFile(
+                        name=name,
+                        size=obj["Size"],
+                        etag=obj["ETag"].strip('"'),
+                        modified_at=obj["LastModified"],
+                        compressed=compressed,
+                    )
+                )
+
+        return report_files
+
+    def save(self, name: str, path: str, compressed: bool = False) -> None:
+        self.client.upload_file(path, self.bucket, _stored_name(name, compressed))
+        os.remove(path)
+
+    def stat(self, name: str) -> ReportFile | None:
+        for report_file in self._objects(prefix=name):
+            if report_file.name == name:
+                return report_file
+        return None
+
+    def touch(self, name: str) -> ReportFile | None:
+        report_file = self.stat(name)
+        if report_file is None:
+            return None
+
+        # Copy in place is the only way to update LastModified of an object
+        key = _stored_name(name, report_file.compressed)
+        self.client.copy_object(
+            Bucket=self.bucket,
+            Key=key,
+            CopySource={"Bucket": self.bucket, "Key": key},
+            MetadataDirective="REPLACE",
+        )
+        return self.stat(name)
+
+    def open(self, name: str, start: int = 0, end: int | None = None) -> BinaryIO:
+        report_file = self.stat(name)
+        if report_file is None:
+            raise FileNotFoundError(name)
+
+        params = {
+            "Bucket": self.bucket,
+            "Key": _stored_name(name, report_file.compressed),
+        }
+        if start or end is not None:
+            params["Range"] = f"bytes={start}-{'' if end is None else end}"
+
+        return self.client.get_object(**params)["Body"]
+
+    def delete(self, name: str) -> None:
+        report_file = self.stat(name)
+        if report_file:
+            self.client.delete_object(
+                Bucket=self.bucket, Key=_stored_name(name, report_file.compressed)
+            )
+
+    def list(self) -> list[ReportFile]:
+        return self._objects()
+
+
+def build_report_storage(settings: Settings) -> IReportStorage:
+    if settings.report_storage == "s3":
+        import boto3  # optional dependency, install with "s3" extra
+
+        logger.info("Creating S3 report storage...")
+
+        client = boto3.client(
+            "s3",
+            endpoint_url=settings.s3_endpoint_url,
+            aws_access_key_id=settings.s3_access_key,
+            aws_secret_access_key=settings.s3_secret_key,
+        )
+        return S3ReportStorage(client=client, bucket=settings.s3_bucket)
+
+    return LocalReportStorage(directory=settings.report_dir)
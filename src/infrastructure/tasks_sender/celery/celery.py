@@ -1,25 +1,58 @@
+import asyncio
+import contextvars
 import logging
-
-from celery import Celery
-from celery.backends.database import Task
+from concurrent.futures import Executor
+from functools import partial
+from typing import TYPE_CHECKING
+from uuid import uuid4
 
 from src.domain.common.interfaces.tasks_sender import TasksSender
+from src.infrastructure.tracing import start_span
+
+if TYPE_CHECKING:
+    from celery import Celery
+    from celery.result import AsyncResult
 
 logger = logging.getLogger("main_logger")
 
 
 class CeleryTasksSender(TasksSender):
-    def __init__(self, celery_app: Celery):
+    """Publishes tasks from executor threads, broker I/O doesn't block event loop"""
+
+    def __init__(self, celery_app: "Celery", executor: Executor | None = None):
         self.celery = celery_app
+        self.executor = executor
 
-    def collect_menu_data(self, report_menus: list[dict]) -> str:
-        logger.info("Report to EXCEL task started...")
+    async def collect_menu_data(
+        self, report_menus: list[dict], report_format: str
+    ) -> str:
+        logger.info("Report to %s task started...", report_format.upper())
 
-        new_task = self.celery.send_task(
-            "src.presentation.celery.tasks.collect_menu_data", args=(report_menus,)
-        )
+        with start_span("send_task collect_menu_data"):
+            # Executor threads don't inherit context, trace goes with a copy
+            new_task = await asyncio.get_running_loop().run_in_executor(
+                self.executor,
+                contextvars.copy_context().run,
+                partial(self._send_report_task, report_menus, report_format),
+            )
 
         return new_task.id
 
-    def get_info_by_task_id(self, task_id: str) -> Task:
-        return self.celery.AsyncResult(task_id)
+    def _send_report_task(
+        self, report_menus: list[dict], report_format: str
+    ) -> "AsyncResult":
+        # State is stored before publishing, worker can't start the task earlier.
+        # Queued task is PENDING, a task without state is unknown or expired
+        task_id = str(uuid4())
+        self.celery.backend.store_result(task_id, None, "PENDING")
+
+        try:
+            return self.celery.send_task(
+                "src.presentation.celery.tasks.collect_menu_data",
+                args=(report_menus, report_format),
+                task_id=task_id,
+            )
+        except Exception:
+            # Task never queued, nobody should poll it
+            self.celery.backend.forget(task_id)
+            raise
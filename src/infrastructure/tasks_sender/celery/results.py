@@ -0,0 +1,99 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+
+from redis.asyncio import Redis  # type: ignore
+
+from src.domain.report.dto.report import TaskResult
+from src.domain.report.exceptions.report import TaskNotFound
+from src.domain.report.interfaces.task_results import ITaskResults
+
+# Key of the task result in Celery redis backend
+TASK_META_KEY = "celery-task-meta-{task_id}"
+
+# Channel with task states published by the worker
+TASK_EVENTS_CHANNEL = "report-task-events-{task_id}"
+
+READY_STATES = ("SUCCESS", "FAILURE", "REVOKED")
+
+
+class CeleryRedisTaskResults(ITaskResults):
+    """Reads Celery redis backend directly, without AsyncResult and its blocking I/O"""
+
+    def __init__(
+        self, redis: Redis, poll_interval: float = 15, max_duration: float = 900
+    ):
+        self._redis = redis
+        self._poll_interval = poll_interval
+        self._max_duration = max_duration
+
+    async def get(self, task_id: str) -> TaskResult | None:
+        """State of the task, None - unknown or expired task
+
+        Sender stores PENDING state before publishing, so a queued task is known.
+        """
+        meta = await self._redis.get(TASK_META_KEY.format(task_id=task_id))
+        if meta is None:
+            return None
+
+        task = json.loads(meta)
+
+        if task["status"] == "SUCCESS":
+            return TaskResult(status="SUCCESS", result=task["result"], progress=100)
+
+        if task["status"] == "PROGRESS":
+            return TaskResult(status="PROGRESS", progress=task["result"]["progress"])
+
+        return TaskResult(status=task["status"])
+
+    async def watch(self, task_id: str) -> AsyncIterator[TaskResult]:
+        """Task states from worker events until the task is ready
+
+        Subscription goes before the first read, so no event is lost in between.
+        Without events for poll_interval the state is read again, this covers
+        a dead worker and keeps the connection of the client alive.
+
+        Stream ends when the task expires or after max_duration, so a client
+        doesn't hold a connection forever. Unknown task raises TaskNotFound.
+        """
+        loop = asyncio.get_running_loop()
+
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(TASK_EVENTS_CHANNEL.format(task_id=task_id))
+
+        try:
+            task = await self.get(task_id)
+            if task is None:
+                raise TaskNotFound(task_id)
+
+            yield task
+            sent_at = loop.time()
+            deadline = sent_at + self._max_duration
+
+            while task.status not in READY_STATES:
+                timeout = min(self._poll_interval, deadline - loop.time())
+                if timeout <= 0:
+                    return
+
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=timeout
+                )
+
+                if message is None:
+                    # Timeout or a skipped subscribe message, report only changes and keepalive
+                    polled_task = await self.get(task_id)
+                    if polled_task is None:
+                        return
+                    if (
+                        polled_task == task
+                        and loop.time() - sent_at < self._poll_interval
+                    ):
+                        continue
+                    task = polled_task
+                else:
+                    task = TaskResult(**json.loads(message["data"]))
+
+                yield task
+                sent_at = loop.time()
+        finally:
+            await pubsub.reset()
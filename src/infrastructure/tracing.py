@@ -0,0 +1,148 @@
+"""OpenTelemetry tracing, enabled by TRACING_EXPORTER setting
+
+Install with "tracing" extra. Without it or without the setting
+spans are no-op and nothing is instrumented.
+"""
+import inspect
+import logging
+from functools import wraps
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.settings import Settings
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover
+    trace = None  # type: ignore
+
+logger = logging.getLogger("main_logger")
+
+T = TypeVar("T", bound=type)
+
+_enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def _build_exporter(settings: Settings) -> Any:
+    if settings.tracing_exporter == "console":
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+        return ConsoleSpanExporter()
+
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+
+    # OTEL_EXPORTER_OTLP_ENDPOINT is used without endpoint in settings
+    return OTLPSpanExporter(endpoint=settings.tracing_endpoint)
+
+
+def setup_tracing(settings: Settings, service: str, exporter: Any = None) -> bool:
+    """Tracer provider of the process with redis and celery instrumentation
+
+    Exporter from settings is used if it isn't passed.
+    """
+    global _enabled
+
+    if _enabled or trace is None or not (exporter or settings.tracing_exporter):
+        return _enabled
+
+    from opentelemetry.instrumentation.celery import CeleryInstrumentor
+    from opentelemetry.instrumentation.redis import RedisInstrumentor
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    provider = TracerProvider(
+        resource=Resource.create(
+            {"service.name": f"{settings.tracing_service_name}-{service}"}
+        )
+    )
+    provider.add_span_processor(
+        BatchSpanProcessor(exporter or _build_exporter(settings))
+    )
+    trace.set_tracer_provider(provider)
+
+    RedisInstrumentor().instrument()
+    # Trace context goes to the worker in task headers
+    CeleryInstrumentor().instrument()
+
+    _enabled = True
+    logger.info("Tracing of %s enabled", service)
+    return _enabled
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Span for every SQL statement of the engine
+
+    Engine events instead of SQLAlchemyInstrumentor, it instruments only
+    the first engine and workers create an engine for every task.
+    """
+    if not _enabled:
+        return
+
+    tracer = trace.get_tracer(__name__)
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def start_statement(conn, cursor, statement, parameters, context, executemany):
+        context._span = tracer.start_span(
+            statement.split(maxsplit=1)[0],
+            kind=trace.SpanKind.CLIENT,
+            attributes={"db.system": "postgresql", "db.statement": statement},
+        )
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def end_statement(conn, cursor, statement, parameters, context, executemany):
+        context._span.end()
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def fail_statement(exception_context):
+        span = getattr(exception_context.execution_context, "_span", None)
+        if span is not None:
+            span.record_exception(exception_context.original_exception)
+            span.set_status(trace.Status(trace.StatusCode.ERROR))
+            span.end()
+
+
+def instrument_app(app: Any) -> None:
+    """Server span of a request, parent of use case spans"""
+    if not _enabled:
+        return
+
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
+    FastAPIInstrumentor.instrument_app(app)
+
+
+def start_span(name: str) -> Any:
+    """Span context manager, no-op without opentelemetry"""
+    if trace is None:
+        return _NoSpan()
+    return trace.get_tracer(__name__).start_as_current_span(name)
+
+
+def trace_calls(cls: T) -> T:
+    """Span around coroutine __call__ of a use case, named by the class"""
+    call = vars(cls).get("__call__")
+    if call is None or not inspect.iscoroutinefunction(call):
+        return cls
+
+    @wraps(call)
+    async def wrapped(self, *args: Any, **kwargs: Any):
+        with start_span(type(self).__name__):
+            return await call(self, *args, **kwargs)
+
+    cls.__call__ = wrapped  # type: ignore
+    return cls
+
+
+class _NoSpan:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *args: Any) -> None:
+        return None
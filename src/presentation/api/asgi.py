@@ -1,11 +1,17 @@
-import uvicorn
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
 
 from src.infrastructure.db.base import create_pool, create_redis
+from src.infrastructure.loop_monitor import LoopLagMonitor
+from src.infrastructure.offload import setup_offload
+from src.infrastructure.profiling import ProfileStorage
+from src.infrastructure.report.storage import build_report_storage
+from src.infrastructure.tracing import instrument_app, setup_tracing
 from src.logging import setup_logging
 from src.presentation.api.di import setup_di
 from src.presentation.api.handlers import setup_routes
+from src.presentation.api.middlewares import setup_middlewares
+from src.presentation.api.server import run_server, worker_share
 from src.settings import get_settings
 
 
@@ -14,25 +20,60 @@ def build_app() -> FastAPI:
     setup_logging()
 
     settings = get_settings()
+    # Before the pool, its engine is instrumented on creation
+    setup_tracing(settings, service="api")
+    setup_offload(settings.serialization_offload_threshold)
 
-    pool = create_pool(database_url=settings.database_url, echo_mode=settings.echo_mode)
+    pool = create_pool(
+        database_url=settings.database_url,
+        echo_mode=settings.echo_mode,
+        slow_query_threshold=settings.slow_query_threshold,
+        pool_size=worker_share(settings.db_pool_size, settings.workers),
+        max_overflow=worker_share(settings.db_max_overflow, settings.workers),
+    )
+
+    redis = create_redis(
+        redis_host=settings.redis_host,
+        redis_port=settings.redis_port,
+        redis_db=settings.redis_db,
+    )
 
     app = FastAPI(title=settings.title, default_response_class=ORJSONResponse)
 
+    profile_storage = ProfileStorage(
+        directory=settings.profiling_dir, max_files=settings.profiling_max_files
+    )
+
     # setup application
     setup_di(
         app=app,
         pool=pool,
-        redis=create_redis(
+        redis=redis,
+        report_storage=build_report_storage(settings),
+        results_redis=create_redis(
             redis_host=settings.redis_host,
             redis_port=settings.redis_port,
-            redis_db=settings.redis_db,
+            redis_db=settings.celery_results_db,
         ),
+        profile_storage=profile_storage,
+        profiling_token=settings.profiling_token,
+        events_max_duration=settings.report_events_max_duration,
     )
     setup_routes(router=app.router)
+    setup_middlewares(
+        app=app, redis=redis, settings=settings, profile_storage=profile_storage
+    )
+    instrument_app(app)
+
+    if settings.loop_lag_threshold is not None:
+        monitor = LoopLagMonitor(
+            interval=settings.loop_lag_interval, threshold=settings.loop_lag_threshold
+        )
+        app.add_event_handler("startup", monitor.start)
+        app.add_event_handler("shutdown", monitor.stop)
 
     return app
 
 
 if __name__ == "__main__":
-    uvicorn.run(app="src.presentation.api.asgi:build_app", factory=True, host="0.0.0.0")
+    run_server(get_settings())
@@ -1,34 +1,75 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from fastapi import FastAPI, Depends
 from redis.asyncio.client import Redis  # type: ignore
 from sqlalchemy.orm import sessionmaker
 
 from src.domain.common.interfaces.cache import ICache
 from src.domain.common.interfaces.tasks_sender import TasksSender
+from src.domain.report.interfaces.task_results import ITaskResults
+from src.domain.report.interfaces.storage import IReportStorage
 from src.infrastructure.db.uow import SQLAlchemyUoW
+from src.infrastructure.profiling import ProfileStorage
 from src.presentation.api.di.providers.cache import CacheProvider, redis_provider
 from src.presentation.api.di.providers.celery import (
-    provide_tasks_sender,
+    TaskResultsProvider,
+    TasksSenderProvider,
+    build_celery_producer,
+    task_results_provider,
     tasks_sender_provider,
 )
 from src.presentation.api.di.providers.db import DBProvider, uow_provider
+from src.presentation.api.di.providers.profiling import (
+    ProfilingProvider,
+    profile_storage_provider,
+)
 from src.presentation.api.di.providers.services import (
     provide_menu_service,
     provide_submenu_service,
     provide_dish_service,
     provide_report_service,
 )
-from src.presentation.celery.app import app as celery_app
+from src.presentation.api.di.providers.storage import (
+    StorageProvider,
+    report_storage_provider,
+)
 
 
-def setup_di(app: FastAPI, pool: sessionmaker, redis: Redis) -> None:
+def setup_di(
+    app: FastAPI,
+    pool: sessionmaker,
+    redis: Redis,
+    report_storage: IReportStorage,
+    results_redis: Redis,
+    profile_storage: ProfileStorage,
+    profiling_token: str | None = None,
+    events_max_duration: float = 900,
+) -> None:
     db_provider = DBProvider(pool)
     cache_provider = CacheProvider(redis)
+    storage_provider = StorageProvider(report_storage)
+    results_provider = TaskResultsProvider(results_redis, events_max_duration)
+    profiling_provider = ProfilingProvider(profile_storage, profiling_token)
+    publish_executor = ThreadPoolExecutor(thread_name_prefix="celery-publish")
+    tasks_provider = TasksSenderProvider(build_celery_producer, publish_executor)
 
-    app.dependency_overrides[tasks_sender_provider] = lambda: provide_tasks_sender(
-        celery_app=celery_app
-    )
+    app.dependency_overrides[
+        tasks_sender_provider
+    ] = tasks_provider.provide_tasks_sender
     app.dependency_overrides[uow_provider] = db_provider.provide_db
     app.dependency_overrides[redis_provider] = cache_provider.provide_redis
+    app.dependency_overrides[
+        report_storage_provider
+    ] = storage_provider.provide_report_storage
+    app.dependency_overrides[
+        task_results_provider
+    ] = results_provider.provide_task_results
+    app.dependency_overrides[
+        profile_storage_provider
+    ] = profiling_provider.provide_profile_storage
+
+    # Tasks being published are sent, threads don't outlive the app
+    app.add_event_handler("shutdown", publish_executor.shutdown)
 
 
 def get_menu_service(
@@ -52,5 +93,8 @@ def get_dish_service(
 def get_report_service(
     uow: SQLAlchemyUoW = Depends(uow_provider),
     tasks_sender: TasksSender = Depends(tasks_sender_provider),
+    task_results: ITaskResults = Depends(task_results_provider),
 ):
-    return provide_report_service(uow=uow, tasks_sender=tasks_sender)
+    return provide_report_service(
+        uow=uow, tasks_sender=tasks_sender, task_results=task_results
+    )
@@ -1,11 +1,54 @@
-from celery import Celery
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING
+
+from redis.asyncio.client import Redis  # type: ignore
 
 from src.infrastructure.tasks_sender.celery.celery import CeleryTasksSender
+from src.infrastructure.tasks_sender.celery.results import CeleryRedisTaskResults
+
+if TYPE_CHECKING:
+    from celery import Celery
 
 
 def tasks_sender_provider() -> None:
     raise NotImplementedError
 
 
-def provide_tasks_sender(celery_app: Celery) -> CeleryTasksSender:
-    return CeleryTasksSender(celery_app=celery_app)
+def task_results_provider() -> None:
+    raise NotImplementedError
+
+
+def build_celery_producer() -> "Celery":
+    # Celery is loaded by the first report request, not at startup
+    from src.presentation.celery.app import build_producer_app
+
+    return build_producer_app()
+
+
+class TasksSenderProvider:
+    """Celery app is built on the first use by app_factory"""
+
+    def __init__(self, app_factory: Callable[[], "Celery"], executor: Executor):
+        self.app_factory = app_factory
+        self.executor = executor
+        self._celery_app: "Celery | None" = None
+        self._lock = threading.Lock()
+
+    def provide_tasks_sender(self) -> CeleryTasksSender:
+        # Sync dependency, FastAPI calls it from several threads at once
+        with self._lock:
+            if self._celery_app is None:
+                self._celery_app = self.app_factory()
+
+        return CeleryTasksSender(celery_app=self._celery_app, executor=self.executor)
+
+
+class TaskResultsProvider:
+    def __init__(self, redis: Redis, events_max_duration: float):
+        self.redis = redis
+        self.events_max_duration = events_max_duration
+
+    def provide_task_results(self) -> CeleryRedisTaskResults:
+        return CeleryRedisTaskResults(self.redis, max_duration=self.events_max_duration)
@@ -0,0 +1,27 @@
+import hmac
+
+from fastapi import Header
+
+from src.infrastructure.profiling import ProfileStorage
+
+
+def profile_storage_provider() -> None:
+    raise NotImplementedError
+
+
+class ProfilingProvider:
+    def __init__(self, storage: ProfileStorage, token: str | None):
+        self.storage = storage
+        self.token = token
+
+    def provide_profile_storage(
+        self, x_profile_token: str | None = Header(None)
+    ) -> ProfileStorage | None:
+        """Storage only for requests with the profiling token"""
+        if (
+            self.token
+            and x_profile_token
+            and hmac.compare_digest(x_profile_token, self.token)
+        ):
+            return self.storage
+        return None
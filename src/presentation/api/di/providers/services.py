@@ -3,6 +3,7 @@ from src.domain.common.interfaces.tasks_sender import TasksSender
 from src.domain.menu.usecases.dish import DishService
 from src.domain.menu.usecases.menu import MenuService
 from src.domain.menu.usecases.submenu import SubMenuService
+from src.domain.report.interfaces.task_results import ITaskResults
 from src.domain.report.usecases.report import ReportService
 from src.infrastructure.db.uow import SQLAlchemyUoW
 
@@ -20,6 +21,8 @@ def provide_dish_service(uow: SQLAlchemyUoW, cache: ICache) -> DishService:
 
 
 def provide_report_service(
-    uow: SQLAlchemyUoW, tasks_sender: TasksSender
+    uow: SQLAlchemyUoW, tasks_sender: TasksSender, task_results: ITaskResults
 ) -> ReportService:
-    return ReportService(uow=uow, tasks_sender=tasks_sender)  # type: ignore
+    return ReportService(
+        uow=uow, tasks_sender=tasks_sender, task_results=task_results  # type: ignore
+    )
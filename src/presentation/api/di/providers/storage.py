@@ -0,0 +1,13 @@
+from src.domain.report.interfaces.storage import IReportStorage
+
+
+def report_storage_provider() -> None:
+    raise NotImplementedError
+
+
+class StorageProvider:
+    def __init__(self, report_storage: IReportStorage):
+        self.report_storage = report_storage
+
+    def provide_report_storage(self) -> IReportStorage:
+        return self.report_storage
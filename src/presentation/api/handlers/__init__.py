@@ -3,11 +3,19 @@ from fastapi import APIRouter
 from src.presentation.api.handlers.menu.menu import router as menu_router
 from src.presentation.api.handlers.menu.submenu import router as sub_menu_router
 from src.presentation.api.handlers.menu.dish import router as dish_router
+from src.presentation.api.handlers.menu.batch import router as batch_router
+from src.presentation.api.handlers.menu.search import router as search_router
 from src.presentation.api.handlers.report import router as report_router
+from src.presentation.api.handlers.metrics import router as metrics_router
+from src.presentation.api.handlers.admin import router as admin_router
 
 
 def setup_routes(router: APIRouter):
     router.include_router(menu_router)
     router.include_router(sub_menu_router)
     router.include_router(dish_router)
+    router.include_router(batch_router)
+    router.include_router(search_router)
     router.include_router(report_router)
+    router.include_router(metrics_router)
+    router.include_router(admin_router)
@@ -0,0 +1,61 @@
+from fastapi import APIRouter, Depends, Response, status
+from fastapi.responses import FileResponse
+
+from src.infrastructure.profiling import ProfileFile, ProfileStorage
+from src.presentation.api.di.providers.profiling import profile_storage_provider
+from src.presentation.api.handlers.responses.exceptions.admin import (
+    ProfileNotFoundError,
+    ProfilingForbiddenError,
+)
+
+router = APIRouter(prefix="/api/v1/admin", tags=["admin"])
+
+PROFILE_MEDIA_TYPES = {"html": "text/html", "prof": "application/octet-stream"}
+
+
+@router.get(
+    "/profiles",
+    responses={status.HTTP_403_FORBIDDEN: {"model": ProfilingForbiddenError}},
+    summary="List request profiles",
+    description="Profiles of requests, newest first",
+)
+async def get_profiles(
+    response: Response,
+    storage: ProfileStorage | None = Depends(profile_storage_provider),
+) -> list[ProfileFile] | ProfilingForbiddenError:
+    if storage is None:
+        response.status_code = status.HTTP_403_FORBIDDEN
+        return ProfilingForbiddenError()
+
+    return storage.list()
+
+
+@router.get(
+    "/profiles/{name}",
+    responses={
+        status.HTTP_403_FORBIDDEN: {"model": ProfilingForbiddenError},
+        status.HTTP_404_NOT_FOUND: {"model": ProfileNotFoundError},
+    },
+    summary="Download request profile",
+    description="pyinstrument HTML page or cProfile stats for snakeviz",
+)
+async def get_profile(
+    name: str,
+    response: Response,
+    storage: ProfileStorage | None = Depends(profile_storage_provider),
+) -> ProfilingForbiddenError | ProfileNotFoundError:
+    if storage is None:
+        response.status_code = status.HTTP_403_FORBIDDEN
+        return ProfilingForbiddenError()
+
+    path = storage.path(name)
+    if path is None:
+        response.status_code = status.HTTP_404_NOT_FOUND
+        return ProfileNotFoundError()
+
+    extension = name.rpartition(".")[2]
+    return FileResponse(  # type: ignore
+        path,
+        media_type=PROFILE_MEDIA_TYPES.get(extension, "application/octet-stream"),
+        filename=name,
+    )
@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends
+
+from src.domain.menu.dto.dish import DishesBatch
+from src.domain.menu.dto.menu import MenusBatch
+from src.domain.menu.dto.submenu import SubMenusBatch
+from src.domain.menu.usecases.dish import DishService
+from src.domain.menu.usecases.menu import MenuService
+from src.domain.menu.usecases.submenu import SubMenuService
+from src.presentation.api.di import (
+    get_dish_service,
+    get_menu_service,
+    get_submenu_service,
+)
+from src.presentation.api.handlers.requests.menu import BatchGetRequest
+
+router = APIRouter(prefix="/api/v1", tags=["batch"])
+
+
+# Batch Routes
+
+
+@router.post(
+    "/menus:batchGet",
+    summary="Batch get menus",
+    description="Getting menus by IDs, menus which weren't found are in not_found",
+)
+async def batch_get_menus(
+    data: BatchGetRequest,
+    menu_service: MenuService = Depends(get_menu_service),
+) -> MenusBatch:
+    return await menu_service.get_menus_batch([str(id_) for id_ in data.ids])
+
+
+@router.post(
+    "/submenus:batchGet",
+    summary="Batch get submenus",
+    description="Getting submenus by IDs, submenus which weren't found are in not_found",
+)
+async def batch_get_submenus(
+    data: BatchGetRequest,
+    submenu_service: SubMenuService = Depends(get_submenu_service),
+) -> SubMenusBatch:
+    return await submenu_service.get_submenus_batch([str(id_) for id_ in data.ids])
+
+
+@router.post(
+    "/dishes:batchGet",
+    summary="Batch get dishes",
+    description="Getting dishes by IDs, dishes which weren't found are in not_found",
+)
+async def batch_get_dishes(
+    data: BatchGetRequest,
+    dish_service: DishService = Depends(get_dish_service),
+) -> DishesBatch:
+    return await dish_service.get_dishes_batch([str(id_) for id_ in data.ids])
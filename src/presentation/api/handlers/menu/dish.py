@@ -1,7 +1,17 @@
-from fastapi import APIRouter, Depends, Response, status
+from decimal import Decimal
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from pydantic import UUID4, ValidationError
 
-from src.domain.menu.dto.dish import CreateDish, OutputDish, UpdateDish
+from src.domain.common.exceptions.fields import FieldsNotAllowed
+from src.domain.menu.dto.dish import (
+    CreateDish,
+    DishFilter,
+    DishSort,
+    OutputDish,
+    UpdateDish,
+)
 from src.domain.menu.exceptions.dish import (
     DishAlreadyExists,
     DishDataEmpty,
@@ -14,11 +24,17 @@ from src.presentation.api.handlers.requests.menu import (
     CreateRequestDish,
     UpdateRequestDish,
 )
+from src.presentation.api.handlers.responses.etag import (
+    is_not_modified,
+    not_modified_response,
+    set_etag,
+)
 from src.presentation.api.handlers.responses.exceptions.menu import (
     DishAlreadyExistsError,
     DishEmptyRequestBodyError,
     DishNotFoundError,
     DishPriceValidationError,
+    FieldsNotAllowedError,
     SubMenuNotFoundError,
 )
 from src.presentation.api.handlers.responses.menu import DishDeleteResponse
@@ -31,15 +47,44 @@ router = APIRouter(prefix="/api/v1/menus", tags=["dishes"])
 
 @router.get(
     "/{menu_id}/submenus/{submenu_id}/dishes",
-    responses={status.HTTP_404_NOT_FOUND: {"model": SubMenuNotFoundError}},
+    responses={
+        status.HTTP_404_NOT_FOUND: {"model": SubMenuNotFoundError},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": FieldsNotAllowedError},
+    },
 )
 async def get_dishes(
     menu_id: UUID4,
     submenu_id: UUID4,
+    request: Request,
+    response: Response,
+    fields: str | None = Query(None, description="Comma separated, e.g. id,price"),
+    min_price: Decimal | None = Query(None, ge=0),
+    max_price: Decimal | None = Query(None, ge=0),
+    sort: DishSort | None = Query(None, description="price or -price"),
     dish_service: DishService = Depends(get_dish_service),
-) -> list[OutputDish] | str | None:  # , SubMenuNotFoundError]
-    # try:
-    return await dish_service.get_dishes(str(menu_id), str(submenu_id))
+) -> list[OutputDish] | FieldsNotAllowedError | str | None:  # , SubMenuNotFoundError]
+    dish_filter = DishFilter(min_price=min_price, max_price=max_price, sort=sort)
+
+    if fields or not dish_filter.is_empty:
+        try:
+            partial_dishes = await dish_service.get_dishes_projection(
+                str(submenu_id), fields, dish_filter
+            )
+        except FieldsNotAllowed:
+            response.status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+            return FieldsNotAllowedError()
+
+        # Partial dishes don't fit OutputDish validation
+        return ORJSONResponse(content=partial_dishes)  # type: ignore
+
+    etag = await dish_service.get_dishes_etag(str(submenu_id))
+    if etag and is_not_modified(request, etag):
+        return not_modified_response(request, etag)  # type: ignore
+
+    dishes = await dish_service.get_dishes(str(menu_id), str(submenu_id))
+
+    set_etag(response, etag or await dish_service.get_dishes_etag(str(submenu_id)))
+    return dishes
     # except SubMenuNotExists:
     #     response.status_code = status.HTTP_404_NOT_FOUND
     #     return SubMenuNotFoundError()
@@ -53,15 +98,23 @@ async def get_dish(
     menu_id: UUID4,
     submenu_id: UUID4,
     dish_id: UUID4,
+    request: Request,
     response: Response,
     dish_service: DishService = Depends(get_dish_service),
 ) -> OutputDish | str | DishNotFoundError:
+    etag = await dish_service.get_dish_etag(str(dish_id))
+    if etag and is_not_modified(request, etag):
+        return not_modified_response(request, etag)  # type: ignore
+
     try:
-        return await dish_service.get_dish(str(submenu_id), str(dish_id))
+        dish = await dish_service.get_dish(str(submenu_id), str(dish_id))
     except DishNotExists:
         response.status_code = status.HTTP_404_NOT_FOUND
         return DishNotFoundError()
 
+    set_etag(response, etag or await dish_service.get_dish_etag(str(dish_id)))
+    return dish
+
 
 @router.post(
     "/{menu_id}/submenus/{submenu_id}/dishes",
@@ -1,10 +1,12 @@
 import uuid
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from fastapi.responses import ORJSONResponse
 from pydantic import UUID4
 
+from src.domain.common.exceptions.fields import FieldsNotAllowed
 from src.domain.menu.dto.menu import CreateMenu, OutputMenu, UpdateMenu
+from src.domain.menu.dto.tree import MenuTree
 from src.domain.menu.exceptions.menu import (
     MenuAlreadyExists,
     MenuDataEmpty,
@@ -17,7 +19,14 @@ from src.presentation.api.handlers.requests.menu import (
     CreateRequestMenu,
     UpdateRequestMenu,
 )
+from src.presentation.api.handlers.responses.etag import (
+    cached_json_response,
+    is_not_modified,
+    not_modified_response,
+    set_etag,
+)
 from src.presentation.api.handlers.responses.exceptions.menu import (
+    FieldsNotAllowedError,
     MenuAlreadyExistsError,
     MenuEmptyRequestBodyError,
     MenuNotFoundError,
@@ -38,21 +47,84 @@ router = APIRouter(prefix="/api/v1/menus", tags=["menus"])
 )
 async def get_menu(
     menu_id: UUID4,
+    request: Request,
     response: Response,
     menu_service: MenuService = Depends(get_menu_service),
 ) -> OutputMenu | MenuNotFoundError:
+    etag = await menu_service.get_menu_etag(str(menu_id))
+    if etag and is_not_modified(request, etag):
+        return not_modified_response(request, etag)  # type: ignore
+
     try:
-        return await menu_service.get_menu(str(menu_id))  # type: ignore
+        menu = await menu_service.get_menu(str(menu_id))
     except MenuNotExists:
         response.status_code = status.HTTP_404_NOT_FOUND
         return MenuNotFoundError()
 
+    set_etag(response, etag or await menu_service.get_menu_etag(str(menu_id)))
+    return menu  # type: ignore
+
+
+@router.get(
+    "/{menu_id}/tree",
+    responses={status.HTTP_404_NOT_FOUND: {"model": MenuNotFoundError}},
+    summary="Get menu tree",
+    description="Getting the menu by ID with all its submenus and dishes",
+)
+async def get_menu_tree(
+    menu_id: UUID4,
+    request: Request,
+    response: Response,
+    menu_service: MenuService = Depends(get_menu_service),
+) -> MenuTree | MenuNotFoundError:
+    etag = await menu_service.get_menu_tree_etag(str(menu_id))
+    if etag and is_not_modified(request, etag):
+        return not_modified_response(request, etag)  # type: ignore
 
-@router.get("/", summary="Get menus", description="Getting the full menu list")
+    try:
+        tree = await menu_service.get_menu_tree(str(menu_id))
+    except MenuNotExists:
+        response.status_code = status.HTTP_404_NOT_FOUND
+        return MenuNotFoundError()
+
+    # JSON text of the tree, response_model only documents it
+    return cached_json_response(  # type: ignore
+        tree, etag or await menu_service.get_menu_tree_etag(str(menu_id))
+    )
+
+
+@router.get(
+    "/",
+    responses={status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": FieldsNotAllowedError}},
+    summary="Get menus",
+    description="Getting the full menu list, fields narrow menus to listed fields",
+)
 async def get_menus(
+    request: Request,
+    response: Response,
+    fields: str | None = Query(None, description="Comma separated, e.g. id,title"),
     menu_service: MenuService = Depends(get_menu_service),
-) -> list[OutputMenu] | None:
-    return await menu_service.get_menus()  # type: ignore
+) -> list[OutputMenu] | FieldsNotAllowedError | None:
+    if fields:
+        try:
+            partial_menus = await menu_service.get_menus_projection(fields)
+        except FieldsNotAllowed:
+            response.status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+            return FieldsNotAllowedError()
+
+        # Partial menus don't fit OutputMenu validation
+        return ORJSONResponse(content=partial_menus)  # type: ignore
+
+    etag = await menu_service.get_menus_etag()
+    if etag and is_not_modified(request, etag):
+        return not_modified_response(request, etag)  # type: ignore
+
+    menus = await menu_service.get_menus()
+
+    # JSON text of the menus, response_model only documents it
+    return cached_json_response(  # type: ignore
+        menus, etag or await menu_service.get_menus_etag()
+    )
 
 
 @router.post(
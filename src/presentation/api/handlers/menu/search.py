@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, Query
+
+from src.domain.menu.dto.dish import FoundDish
+from src.domain.menu.usecases.dish import DishService
+from src.presentation.api.di import get_dish_service
+
+router = APIRouter(prefix="/api/v1", tags=["search"])
+
+
+# Search Routes
+
+
+@router.get(
+    "/dishes:search",
+    summary="Search dishes",
+    description="Searching dishes by words or word prefixes of title and description,"
+    " titles with typos are found by similarity",
+)
+async def search_dishes(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    dish_service: DishService = Depends(get_dish_service),
+) -> list[FoundDish]:
+    return await dish_service.search_dishes(q, limit)  # type: ignore
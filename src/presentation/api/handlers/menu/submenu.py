@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from pydantic import UUID4
 
 from src.domain.menu.dto.submenu import CreateSubMenu, OutputSubMenu, UpdateSubMenu
@@ -14,6 +14,11 @@ from src.presentation.api.handlers.requests.menu import (
     CreateRequestSubMenu,
     UpdateRequestSubMenu,
 )
+from src.presentation.api.handlers.responses.etag import (
+    is_not_modified,
+    not_modified_response,
+    set_etag,
+)
 from src.presentation.api.handlers.responses.exceptions.menu import (
     MenuNotFoundError,
     SubMenuAlreadyExistsError,
@@ -36,15 +41,23 @@ router = APIRouter(prefix="/api/v1/menus", tags=["submenus"])
 )
 async def get_submenus(
     menu_id: UUID4,
+    request: Request,
     response: Response,
     submenu_service: SubMenuService = Depends(get_submenu_service),
 ) -> list[OutputSubMenu] | MenuNotFoundError | None:
+    etag = await submenu_service.get_submenus_etag(str(menu_id))
+    if etag and is_not_modified(request, etag):
+        return not_modified_response(request, etag)  # type: ignore
+
     try:
-        return await submenu_service.get_submenus(str(menu_id))  # type: ignore
+        submenus = await submenu_service.get_submenus(str(menu_id))
     except MenuNotExists:
         response.status_code = status.HTTP_404_NOT_FOUND
         return MenuNotFoundError()
 
+    set_etag(response, etag or await submenu_service.get_submenus_etag(str(menu_id)))
+    return submenus  # type: ignore
+
 
 @router.get(
     "/{menu_id}/submenus/{submenu_id}",
@@ -55,15 +68,23 @@ async def get_submenus(
 async def get_submenu(
     menu_id: UUID4,
     submenu_id: UUID4,
+    request: Request,
     response: Response,
     menu_service: SubMenuService = Depends(get_submenu_service),
 ) -> OutputSubMenu | SubMenuNotFoundError:
+    etag = await menu_service.get_submenu_etag(str(submenu_id))
+    if etag and is_not_modified(request, etag):
+        return not_modified_response(request, etag)  # type: ignore
+
     try:
-        return await menu_service.get_submenu(str(menu_id), str(submenu_id))  # type: ignore
+        submenu = await menu_service.get_submenu(str(menu_id), str(submenu_id))
     except SubMenuNotExists:
         response.status_code = status.HTTP_404_NOT_FOUND
         return SubMenuNotFoundError()
 
+    set_etag(response, etag or await menu_service.get_submenu_etag(str(submenu_id)))
+    return submenu  # type: ignore
+
 
 @router.post(
     "/{menu_id}/submenus",
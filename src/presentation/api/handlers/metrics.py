@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from starlette.concurrency import run_in_threadpool
+
+from src.infrastructure.metrics import get_registry
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    # Multiprocess collector reads files of all workers
+    content = await run_in_threadpool(generate_latest, get_registry())
+    return Response(content=content, media_type=CONTENT_TYPE_LATEST)
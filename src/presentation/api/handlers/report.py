@@ -1,13 +1,20 @@
-from fastapi import APIRouter, Depends, Response, status
-from fastapi.responses import FileResponse
+from collections.abc import AsyncIterator
 
-from src.domain.report.exceptions.report import ReportDataEmpty
+from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from src.domain.report.dto.report import ReportFormat, ReportStatusTask
+from src.domain.report.exceptions.report import ReportDataEmpty, TaskNotFound
+from src.domain.report.interfaces.storage import IReportStorage
 from src.domain.report.usecases.report import ReportService
-from src.presentation.api.di import get_report_service
+from src.presentation.api.di import get_report_service, report_storage_provider
 from src.presentation.api.handlers.responses.exceptions.report import (
     ReportDataEmptyError,
     ReportFileNotFoundError,
+    ReportTaskNotFoundError,
 )
+from src.presentation.api.handlers.responses.file import report_file_response
 from src.presentation.api.handlers.responses.report import (
     ReportTaskResponse,
     ReportTaskStatusResponse,
@@ -20,15 +27,18 @@ router = APIRouter(prefix="/api/v1/report", tags=["report"])
     "/",
     responses={status.HTTP_404_NOT_FOUND: {"model": ReportDataEmptyError}},
     status_code=status.HTTP_202_ACCEPTED,
-    summary="Create excel task",
-    description="Create background task for generate excel file with Menu.",
+    summary="Create report task",
+    description="Create background task for generate report file (xlsx, csv, json) with Menu.",
 )
 async def create_report(
     response: Response,
+    report_format: ReportFormat = ReportFormat.xlsx,
     report_service: ReportService = Depends(get_report_service),
 ) -> ReportTaskResponse | ReportDataEmptyError:
     try:
-        return ReportTaskResponse(task_id=await report_service.collect_menu_data())
+        return ReportTaskResponse(
+            task_id=await report_service.collect_menu_data(report_format)
+        )
     except ReportDataEmpty:
         response.status_code = status.HTTP_404_NOT_FOUND
         return ReportDataEmptyError()
@@ -36,14 +46,57 @@ async def create_report(
 
 @router.get(
     "/{task_id}",
+    responses={status.HTTP_404_NOT_FOUND: {"model": ReportTaskNotFoundError}},
     summary="Get info by task id",
     description="Get info about background task by task id",
 )
 async def get_info_about_task(
+    response: Response,
+    task_id: str,
+    report_service: ReportService = Depends(get_report_service),
+) -> ReportTaskStatusResponse | ReportTaskNotFoundError:
+    try:
+        return ReportTaskStatusResponse(
+            task=await report_service.get_info_about_task(task_id)
+        )
+    except TaskNotFound:
+        response.status_code = status.HTTP_404_NOT_FOUND
+        return ReportTaskNotFoundError()
+
+
+async def _task_events(
+    first_task: ReportStatusTask, tasks: AsyncIterator[ReportStatusTask]
+) -> AsyncIterator[str]:
+    yield f"data: {first_task.json()}\n\n"
+    async for task in tasks:
+        yield f"data: {task.json()}\n\n"
+
+
+@router.get(
+    "/{task_id}/events",
+    response_class=StreamingResponse,
+    responses={status.HTTP_404_NOT_FOUND: {"model": ReportTaskNotFoundError}},
+    summary="Watch task by task id",
+    description="Server-sent events with progress of background task, "
+    "the stream ends with SUCCESS (with download link) or FAILURE status, "
+    "when the task expires or after REPORT_EVENTS_MAX_DURATION",
+)
+async def watch_task(
     task_id: str, report_service: ReportService = Depends(get_report_service)
-) -> ReportTaskStatusResponse:
-    return ReportTaskStatusResponse(
-        task=await report_service.get_info_about_task(task_id)
+) -> Response:
+    tasks = report_service.watch_task(task_id)
+    try:
+        # Unknown task is found by the first state, before the stream starts
+        first_task = await anext(tasks)
+    except TaskNotFound:
+        return ORJSONResponse(
+            ReportTaskNotFoundError().dict(), status_code=status.HTTP_404_NOT_FOUND
+        )
+
+    return StreamingResponse(
+        _task_events(first_task, tasks),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -51,17 +104,20 @@ async def get_info_about_task(
     "/download/{file_name}",
     responses={status.HTTP_404_NOT_FOUND: {"model": ReportFileNotFoundError}},
     summary="Download report file",
-    description="Endpoint for download Excel file with menu",
+    description="Endpoint for download report file with menu, supports Range and ETag",
 )
 async def download_report_file(
-    response: Response, file_name: str
+    request: Request,
+    response: Response,
+    file_name: str,
+    report_storage: IReportStorage = Depends(report_storage_provider),
 ) -> ReportFileNotFoundError:
-    try:
-        return FileResponse(
-            path=f"data/{file_name}",
-            filename=file_name,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        )
-    except FileNotFoundError:
+    report_file = await run_in_threadpool(report_storage.stat, file_name)
+
+    if report_file is None:
         response.status_code = status.HTTP_404_NOT_FOUND
         return ReportFileNotFoundError()
+
+    return await report_file_response(  # type: ignore
+        report_storage, report_file, request
+    )
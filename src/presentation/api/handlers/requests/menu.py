@@ -1,4 +1,22 @@
-from pydantic import BaseModel, validator
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+
+from pydantic import UUID4, BaseModel, Field, validator
+
+MAX_BATCH_SIZE = 1000
+# Dish price is numeric(12, 2)
+MAX_PRICE = 10**10
+CENT = Decimal("0.01")
+
+
+def parse_price(v: str) -> str:
+    """Price of a request rounded half up to cents, without float errors"""
+    try:
+        price = Decimal(v).quantize(CENT, ROUND_HALF_UP)
+    except (InvalidOperation, TypeError):
+        raise ValueError("price is not a number")
+    if not price.is_finite() or abs(price) >= MAX_PRICE:
+        raise ValueError("price is out of range")
+    return f"{price:.2f}"
 
 
 class CreateRequestMenu(BaseModel):
@@ -16,7 +34,7 @@ class CreateRequestDish(CreateRequestMenu):
     @validator("price")
     def price_validator(cls, v):
         try:
-            return f"{round(float(v), 2):.2f}"
+            return parse_price(v)
         except ValueError:
             pass
 
@@ -38,6 +56,10 @@ class UpdateRequestDish(UpdateRequestMenu):
         try:
             if v is None:
                 return
-            return f"{round(float(v), 2):.2f}"
+            return parse_price(v)
         except ValueError:
             return {"detail": "Invalid data"}
+
+
+class BatchGetRequest(BaseModel):
+    ids: list[UUID4] = Field(..., min_items=1, max_items=MAX_BATCH_SIZE)
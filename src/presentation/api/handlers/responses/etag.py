@@ -0,0 +1,36 @@
+from fastapi import Request, Response, status
+
+from src.presentation.api.handlers.responses.file import etag_matches
+from src.presentation.api.middlewares.compression import select_encoding, weak_etag
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Client has the cached payload, checked before the payload is read"""
+    return etag_matches(request.headers.get("if-none-match"), etag)
+
+
+def not_modified_response(request: Request, etag: str) -> Response:
+    """304 of a JSON payload with the ETag its 200 response carries
+
+    CompressionMiddleware weakens ETags of JSON when the client accepts an
+    encoding, the 304 has no body to tell, so the request decides it here.
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if select_encoding(request.headers.get("accept-encoding", "")):
+        headers["ETag"] = weak_etag(etag)
+        headers["Vary"] = "Accept-Encoding"
+
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+
+def set_etag(response: Response, etag: str | None) -> None:
+    if etag:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
+
+
+def cached_json_response(content: str | bytes, etag: str | None) -> Response:
+    """JSON text of the cache as is, FastAPI doesn't parse and encode it again"""
+    response = Response(content=content, media_type="application/json")
+    set_etag(response, etag)
+    return response
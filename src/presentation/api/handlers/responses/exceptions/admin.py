@@ -0,0 +1,11 @@
+from pydantic import Field
+
+from src.presentation.api.handlers.responses.base import ApiError
+
+
+class ProfilingForbiddenError(ApiError):
+    detail = Field("Valid X-Profile-Token header is required", const=True)
+
+
+class ProfileNotFoundError(ApiError):
+    detail = Field("profile not found", const=True)
@@ -41,3 +41,7 @@ class DishEmptyRequestBodyError(ApiError):
 
 class DishPriceValidationError(ApiError):
     detail = Field("The price of the dish must be a floating point number")
+
+
+class FieldsNotAllowedError(ApiError):
+    detail = Field("requested fields are not allowed", const=True)
@@ -9,3 +9,7 @@ class ReportDataEmptyError(ApiError):
 
 class ReportFileNotFoundError(ApiError):
     detail = Field("Report file is not ready or not created", const=True)
+
+
+class ReportTaskNotFoundError(ApiError):
+    detail = Field("Report task is not found or its result expired", const=True)
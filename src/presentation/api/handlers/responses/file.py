@@ -0,0 +1,136 @@
+import gzip
+from collections.abc import Iterator
+from email.utils import formatdate
+from typing import BinaryIO
+
+from fastapi import Request, Response, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from src.domain.report.dto.report import ReportFile
+from src.domain.report.interfaces.storage import IReportStorage
+
+MEDIA_TYPES = {
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "csv": "text/csv",
+    "json": "application/json",
+}
+
+CHUNK_SIZE = 64 * 1024
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Parse a single "bytes" range, None means the header is ignored"""
+    unit, _, value = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in value:
+        return None
+
+    first, _, last = value.strip().partition("-")
+    try:
+        if not first:
+            length = int(last)
+            if length <= 0:
+                raise RangeNotSatisfiable
+            return max(size - length, 0), size - 1
+
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        return None
+
+    if start >= size:
+        raise RangeNotSatisfiable
+    if end < start:
+        return None
+
+    return start, min(end, size - 1)
+
+
+def etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+
+    etags = [value.strip().removeprefix("W/") for value in header.split(",")]
+    return "*" in etags or etag in etags
+
+
+def iter_file(file: BinaryIO, length: int | None = None) -> Iterator[bytes]:
+    try:
+        while length is None or length > 0:
+            chunk = file.read(CHUNK_SIZE if length is None else min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            if length is not None:
+                length -= len(chunk)
+            yield chunk
+    finally:
+        file.close()
+
+
+async def report_file_response(
+    storage: IReportStorage, report_file: ReportFile, request: Request
+) -> Response:
+    """Serve report with ETag, single byte range and stored gzip encoding"""
+    decode = report_file.compressed and "gzip" not in request.headers.get(
+        "accept-encoding", ""
+    )
+    etag = f'"{report_file.etag}-identity"' if decode else f'"{report_file.etag}"'
+    media_type = MEDIA_TYPES.get(
+        report_file.name.rpartition(".")[2], "application/octet-stream"
+    )
+
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(report_file.modified_at.timestamp(), usegmt=True),
+        "Content-Disposition": f'attachment; filename="{report_file.name}"',
+    }
+    if report_file.compressed:
+        headers["Vary"] = "Accept-Encoding"
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if decode:
+        # Client can't take gzip, decompress on the fly without ranges
+        file = await run_in_threadpool(storage.open, report_file.name)
+        return StreamingResponse(
+            iter_file(gzip.GzipFile(fileobj=file)),  # type: ignore
+            media_type=media_type,
+            headers=headers,
+        )
+
+    headers["Accept-Ranges"] = "bytes"
+    if report_file.compressed:
+        headers["Content-Encoding"] = "gzip"
+
+    status_code = status.HTTP_200_OK
+    start, end = 0, report_file.size - 1
+
+    if range_header := request.headers.get("range"):
+        try:
+            byte_range = parse_range(range_header, report_file.size)
+        except RangeNotSatisfiable:
+            headers["Content-Range"] = f"bytes */{report_file.size}"
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers=headers,
+            )
+
+        if byte_range:
+            start, end = byte_range
+            status_code = status.HTTP_206_PARTIAL_CONTENT
+            headers["Content-Range"] = f"bytes {start}-{end}/{report_file.size}"
+
+    headers["Content-Length"] = str(end - start + 1)
+
+    file = await run_in_threadpool(storage.open, report_file.name, start, end)
+    return StreamingResponse(
+        iter_file(file, end - start + 1),
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers,
+    )
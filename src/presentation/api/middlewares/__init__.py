@@ -0,0 +1,39 @@
+from fastapi import FastAPI
+from redis.asyncio import Redis  # type: ignore
+
+from src.infrastructure.profiling import ProfileStorage
+from src.presentation.api.middlewares.compression import CompressionMiddleware
+from src.presentation.api.middlewares.metrics import MetricsMiddleware
+from src.presentation.api.middlewares.profiling import ProfilingMiddleware
+from src.presentation.api.middlewares.query_count import QueryCountMiddleware
+from src.settings import Settings
+
+
+def setup_middlewares(
+    app: FastAPI, redis: Redis, settings: Settings, profile_storage: ProfileStorage
+) -> None:
+    if (
+        settings.query_count_limit is not None
+        or settings.query_repeat_limit is not None
+    ):
+        app.add_middleware(
+            QueryCountMiddleware,
+            limit=settings.query_count_limit,
+            repeat_limit=settings.query_repeat_limit,
+        )
+    app.add_middleware(
+        CompressionMiddleware,
+        redis=redis,
+        minimum_size=settings.compression_minimum_size,
+        expire=settings.compression_cache_expire,
+    )
+    if settings.profiling_token or settings.profiling_sample_rate:
+        # Without configuration there is no middleware and no overhead
+        app.add_middleware(
+            ProfilingMiddleware,
+            storage=profile_storage,
+            token=settings.profiling_token,
+            sample_rate=settings.profiling_sample_rate,
+        )
+    # The last one is the outermost, request duration includes compression
+    app.add_middleware(MetricsMiddleware)
@@ -0,0 +1,136 @@
+import gzip
+import logging
+
+from redis.asyncio import Redis  # type: ignore
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli  # optional dependency, install with "brotli" extra
+except ImportError:  # pragma: no cover
+    brotli = None
+
+logger = logging.getLogger("main_logger")
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+# Compressed body by encoding and ETag of the payload, ETag changes with payload
+COMPRESSED_KEY = "compressed-{encoding}-{etag}"
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def select_encoding(accept_encoding: str) -> str | None:
+    encodings = set()
+    for value in accept_encoding.split(","):
+        encoding, _, params = value.strip().partition(";")
+        if params.replace(" ", "") not in ("q=0", "q=0.0"):
+            encodings.add(encoding.strip().lower())
+
+    if brotli is not None and "br" in encodings:
+        return "br"
+    if "gzip" in encodings:
+        return "gzip"
+    return None
+
+
+def weak_etag(etag: str) -> str:
+    """Compressed body is other bytes of the same payload"""
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class CompressionMiddleware:
+    """gzip or brotli for large JSON and text bodies
+
+    Bodies with ETag are compressed once, the compressed variant is cached
+    in redis by the ETag. Streaming and already encoded responses are sent
+    as is. ETag of a compressible response is weak when the client accepts
+    an encoding, small bodies too, so it doesn't depend on the body size and
+    304 responses without body can carry the same one.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        redis: Redis | None = None,
+        minimum_size: int = 1024,
+        expire: int = 3600,
+    ):
+        self.app = app
+        self.redis = redis
+        self.minimum_size = minimum_size
+        self.expire = expire
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])  # type: ignore
+
+            if message.get("more_body") or not self._compressible(headers):
+                passthrough = True
+                await send(start_message)  # type: ignore
+                await send(message)
+                return
+
+            headers.add_vary_header("Accept-Encoding")
+            if "etag" in headers:
+                headers["ETag"] = weak_etag(headers["etag"])
+
+            if len(body) >= self.minimum_size:
+                body = await self._compress(body, encoding, headers.get("etag"))
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+
+            await send(start_message)  # type: ignore
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
+
+    def _compressible(self, headers: MutableHeaders) -> bool:
+        return "content-encoding" not in headers and headers.get(
+            "content-type", ""
+        ).startswith(COMPRESSIBLE_TYPES)
+
+    async def _compress(self, body: bytes, encoding: str, etag: str | None) -> bytes:
+        if self.redis is None or etag is None:
+            return compress(body, encoding)
+
+        key = COMPRESSED_KEY.format(
+            encoding=encoding, etag=etag.removeprefix("W/").strip('"')
+        )
+
+        compressed = await self.redis.get(key)
+        if compressed is None:
+            compressed = compress(body, encoding)
+            await self.redis.set(key, compressed, ex=self.expire)
+
+        return compressed
@@ -0,0 +1,49 @@
+import time
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS
+
+UNMATCHED_PATH = "unmatched"
+
+
+def get_path_template(scope: Scope) -> str:
+    """Route path with placeholders, ids don't blow up label cardinality"""
+    for route in scope["app"].router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+    return UNMATCHED_PATH
+
+
+class MetricsMiddleware:
+    """Count of requests and their duration by route and status"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            path = get_path_template(scope)
+            HTTP_REQUEST_DURATION.labels(method=scope["method"], path=path).observe(
+                time.perf_counter() - started
+            )
+            HTTP_REQUESTS.labels(
+                method=scope["method"], path=path, status=status_code
+            ).inc()
@@ -0,0 +1,89 @@
+import hmac
+import logging
+import random
+import re
+import time
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.profiling import ProfileStorage, RequestProfiler
+
+logger = logging.getLogger("main_logger")
+
+PROFILE_TOKEN_HEADER = "x-profile-token"
+PROFILE_ID_HEADER = "x-profile-id"
+
+# Profiles of the admin endpoint itself aren't interesting
+EXCLUDED_PREFIX = "/api/v1/admin"
+
+
+def profile_name(scope: Scope, extension: str) -> str:
+    path = re.sub(r"[^\w-]+", "_", scope["path"]).strip("_") or "root"
+    return f"{time.time_ns()}-{scope['method']}-{path[:100]}.{extension}"
+
+
+def has_token(scope: Scope, token: str | None) -> bool:
+    value = Headers(scope=scope).get(PROFILE_TOKEN_HEADER)
+    return bool(token and value and hmac.compare_digest(value, token))
+
+
+class ProfilingMiddleware:
+    """Profiles requests with the token header and a sample of the others
+
+    One request is profiled at a time, profilers of the same thread
+    interfere. The middleware is added only when profiling is configured.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        storage: ProfileStorage,
+        token: str | None = None,
+        sample_rate: float = 0.0,
+    ):
+        self.app = app
+        self.storage = storage
+        self.token = token
+        self.sample_rate = sample_rate
+        self._busy = False
+
+    def _should_profile(self, scope: Scope) -> bool:
+        if (
+            scope["type"] != "http"
+            or self._busy
+            or scope["path"].startswith(EXCLUDED_PREFIX)
+        ):
+            return False
+        return has_token(scope, self.token) or random.random() < self.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = RequestProfiler()
+        name = profile_name(scope, profiler.extension)
+        # Sampled profiles are found by admins, clients don't learn their names
+        with_token = has_token(scope, self.token)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and with_token:
+                MutableHeaders(scope=message)[PROFILE_ID_HEADER] = name
+            await send(message)
+
+        self._busy = True
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.stop()
+            self._busy = False
+            await run_in_threadpool(self._save, profiler, name)
+
+    def _save(self, profiler: RequestProfiler, name: str) -> None:
+        try:
+            self.storage.save(name, profiler.render())
+        except Exception:
+            logger.exception("Profile %s was not saved", name)
@@ -0,0 +1,41 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.infrastructure.db.query_log import TooManyQueries, count_queries
+
+
+class QueryCountMiddleware:
+    """Test mode, fails requests which issue more than limit queries
+
+    Catches N+1 regressions, e.g. lazy loading of relations in a loop: it
+    repeats one statement per parent, so it's found by repeat_limit even when
+    fixtures are too small to reach the total limit.
+    """
+
+    def __init__(
+        self, app: ASGIApp, limit: int | None = None, repeat_limit: int | None = None
+    ):
+        self.app = app
+        self.limit = limit
+        self.repeat_limit = repeat_limit
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with count_queries() as counter:
+            await self.app(scope, receive, send)
+
+        if self.limit is not None and counter.count > self.limit:
+            statements = "\n".join(counter.statements)
+            raise TooManyQueries(
+                f"{scope['method']} {scope['path']} issued {counter.count} queries, "
+                f"limit is {self.limit}:\n{statements}"
+            )
+
+        statement, repeats = counter.most_repeated()
+        if self.repeat_limit is not None and repeats > self.repeat_limit:
+            raise TooManyQueries(
+                f"{scope['method']} {scope['path']} issued a statement {repeats} "
+                f"times, limit is {self.repeat_limit}:\n{statement}"
+            )
@@ -0,0 +1,33 @@
+"""Production launcher, uvicorn workers with uvloop (where available) and httptools"""
+import os
+import tempfile
+
+import uvicorn
+
+from src.settings import Settings
+
+APP = "src.presentation.api.asgi:build_app"
+
+
+def worker_share(total: int, workers: int) -> int:
+    """Part of a process-wide limit for one worker, at least 1"""
+    return max(total // max(workers, 1), 1)
+
+
+def run_server(settings: Settings) -> None:
+    if settings.workers > 1:
+        # Workers write metrics to files, the exporter of any worker merges them
+        os.environ.setdefault(
+            "PROMETHEUS_MULTIPROC_DIR", tempfile.mkdtemp(prefix="prometheus-")
+        )
+
+    uvicorn.run(
+        app=APP,
+        factory=True,
+        host=settings.host,
+        port=settings.port,
+        workers=settings.workers,
+        loop=settings.server_loop,
+        http=settings.server_http,
+        lifespan="on",
+    )
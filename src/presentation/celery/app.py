@@ -2,27 +2,126 @@ import logging
 from collections.abc import Callable
 
 from celery import Celery
+from celery.signals import before_task_publish, worker_init
+from kombu import Queue
 
-from src.presentation.celery.tasks import collect_menu_data
-from src.settings import get_settings
+from src.infrastructure.tracing import setup_tracing
+from src.presentation.celery.metrics import setup_metrics, stamp_published_at
+from src.settings import Settings, get_settings
 
 logger = logging.getLogger("main_logger")
 
 
+def build_producer_app() -> Celery:
+    """Celery app of the API process, it only sends tasks by name
+
+    Tasks aren't imported, the API doesn't load report code. Tasks are
+    stamped with publishing time, workers measure their queue wait by it.
+    """
+    before_task_publish.connect(stamp_published_at, weak=False)
+    return _create_app(get_settings())
+
+
 def build_celery_app() -> Celery:
     """Factory celery application"""
     logger.info("Celery app creating...")
 
+    # Imported here, the tasks module is heavy and only workers run the tasks
+    from src.presentation.celery.tasks import (
+        assemble_report,
+        cleanup_reports,
+        collect_menu_data,
+        render_report_fragments,
+    )
+
     settings = get_settings()
+    celery_app = _create_app(settings)
 
-    celery_app = Celery(main="name", broker=settings.broker_url, backend="rpc://")
+    report_limits = {
+        "soft_time_limit": settings.report_soft_time_limit,
+        "time_limit": settings.report_time_limit,
+    }
 
     # Inject tasks to app
-    celery_app.task(collect_menu_data)
+    celery_app.task(
+        collect_menu_data, rate_limit=settings.report_rate_limit, **report_limits
+    )
+    # Parts of a big report, each one within the same limits
+    celery_app.task(render_report_fragments, **report_limits)
+    celery_app.task(assemble_report, **report_limits)
+    celery_app.task(cleanup_reports)
+
+    setup_metrics(settings)
+    # Forked pool processes keep the provider, span processor restarts in them
+    worker_init.connect(
+        lambda **kwargs: setup_tracing(settings, service="worker"), weak=False
+    )
+
+    celery_app.conf.beat_schedule = {
+        "cleanup-reports": {
+            "task": "src.presentation.celery.tasks.cleanup_reports",
+            "schedule": settings.report_cleanup_interval,
+        }
+    }
+
+    return celery_app
 
+
+def _create_app(settings: Settings) -> Celery:
+    celery_app = Celery(
+        main="name",
+        broker=settings.broker_url,
+        backend=(
+            f"redis://{settings.redis_host}:{settings.redis_port}"
+            f"/{settings.celery_results_db}"
+        ),
+    )
+    celery_app.conf.update(
+        task_track_started=True,
+        result_expires=settings.report_retention_hours * 3600,
+        **_queues_config(settings),
+    )
     return celery_app
 
 
+def _queues_config(settings: Settings) -> dict:
+    """Reports go to their own queue, so big reports don't starve other tasks
+
+    A worker per queue (-Q) separates them, priorities aren't needed: they only
+    order messages within one queue.
+
+    Report tasks are long and CPU-bound: worker takes one task at a time
+    and acknowledges it after execution, so waiting tasks stay in the broker
+    for free workers instead of a busy worker's prefetch buffer.
+    """
+    return {
+        "task_queues": (
+            Queue(
+                settings.celery_default_queue,
+                routing_key=settings.celery_default_queue,
+            ),
+            Queue(
+                settings.celery_report_queue,
+                routing_key=settings.celery_report_queue,
+            ),
+        ),
+        "task_default_queue": settings.celery_default_queue,
+        "task_routes": {
+            f"src.presentation.celery.tasks.{name}": {
+                "queue": settings.celery_report_queue,
+            }
+            for name in (
+                "collect_menu_data",
+                "render_report_fragments",
+                "assemble_report",
+            )
+        },
+        "worker_prefetch_multiplier": settings.celery_prefetch_multiplier,
+        "task_acks_late": True,
+        "task_reject_on_worker_lost": True,
+    }
+
+
 def _inject_dependency_to_task(task: Callable, **depends) -> Callable:
     """Special func for inject your own dependencies to task"""
 
@@ -33,4 +132,14 @@ def _inject_dependency_to_task(task: Callable, **depends) -> Callable:
     return task_provider
 
 
-app = build_celery_app()
+app: Celery  # built by __getattr__
+
+
+def __getattr__(name: str) -> Celery:
+    """Worker app of "celery --app src.presentation.celery.app", built on access"""
+    if name != "app":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    global app
+    app = build_celery_app()
+    return app
@@ -0,0 +1,83 @@
+import logging
+import os
+import time
+
+from celery.signals import (
+    before_task_publish,
+    task_postrun,
+    task_prerun,
+    worker_process_shutdown,
+    worker_ready,
+)
+from prometheus_client import multiprocess, start_http_server
+
+from src.infrastructure.metrics import (
+    CELERY_TASK_DURATION,
+    CELERY_TASK_QUEUE_WAIT,
+    get_registry,
+)
+from src.settings import Settings
+
+logger = logging.getLogger("main_logger")
+
+# Message header with publishing time, queue wait is measured by it
+PUBLISHED_AT_HEADER = "published_at"
+
+_started: dict[str, float] = {}
+
+
+def stamp_published_at(headers: dict | None = None, **kwargs) -> None:
+    if headers is not None:
+        headers[PUBLISHED_AT_HEADER] = time.time()
+
+
+def observe_queue_wait(task_id: str, task, **kwargs) -> None:
+    _started[task_id] = time.perf_counter()
+
+    published_at = getattr(task.request, PUBLISHED_AT_HEADER, None)
+    if published_at is not None:
+        # Wall clocks of publisher and worker, negative means clock skew
+        CELERY_TASK_QUEUE_WAIT.labels(task=task.name).observe(
+            max(time.time() - published_at, 0)
+        )
+
+
+def observe_run_time(task_id: str, task, state: str | None = None, **kwargs) -> None:
+    started = _started.pop(task_id, None)
+    if started is not None:
+        CELERY_TASK_DURATION.labels(task=task.name, state=state or "UNKNOWN").observe(
+            time.perf_counter() - started
+        )
+
+
+def mark_process_dead(pid: int, **kwargs) -> None:
+    """Live gauges of an exited pool process aren't exported anymore"""
+    multiprocess.mark_process_dead(pid)
+
+
+def setup_metrics(settings: Settings) -> None:
+    """Task metrics, exported by the worker on its own port
+
+    Tasks run in pool processes and the exporter in the main one, so values
+    are shared through PROMETHEUS_MULTIPROC_DIR. Without it the exporter
+    would serve empty task metrics, the worker doesn't start.
+    """
+    if settings.celery_metrics_port and "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        raise RuntimeError(
+            "CELERY_METRICS_PORT requires PROMETHEUS_MULTIPROC_DIR, "
+            "an existing empty directory for metrics of pool processes"
+        )
+
+    before_task_publish.connect(stamp_published_at, weak=False)
+    task_prerun.connect(observe_queue_wait, weak=False)
+    task_postrun.connect(observe_run_time, weak=False)
+
+    port = settings.celery_metrics_port
+    if port:
+        worker_process_shutdown.connect(mark_process_dead, weak=False)
+
+        def start_exporter(**kwargs) -> None:
+            logger.info("Celery metrics on port %s", port)
+            start_http_server(port, registry=get_registry())
+
+        worker_ready.connect(start_exporter, weak=False)
@@ -1,81 +1,293 @@
-from datetime import datetime, timedelta
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
 
-from openpyxl.styles import Font
-from openpyxl.workbook import Workbook
+from celery import chord, current_task
+from celery.canvas import Signature
 
+from src.domain.report.dto.report import ReportFormat, ReportInfo
+from src.infrastructure.db.base import create_pool
+from src.infrastructure.db.uow import SQLAlchemyUoW
+from src.infrastructure.report.formats import COMPRESSED_FORMATS, write_report
+from src.infrastructure.report.fragments import (
+    count_report_rows,
+    get_fragments_dir,
+    get_menu_version,
+    get_report_version,
+    partition_missing_fragments,
+    prune_fragments,
+    render_fragments,
+)
+from src.infrastructure.report.retention import select_expired_reports
+from src.infrastructure.report.storage import build_report_storage
+from src.infrastructure.tasks_sender.celery.results import TASK_EVENTS_CHANNEL
+from src.settings import Settings, get_settings
 
-def collect_menu_data(report_menus: list[dict]) -> str:
-    date = (datetime.now() + timedelta(hours=3)).strftime("%H:%M-%d.%m.%Y")
-    filename = f"{date}_menu.xlsx"
+logger = logging.getLogger("main_logger")
 
-    book = Workbook()
-    sheet = book.active
+RENDER_FRAGMENTS_TASK = "src.presentation.celery.tasks.render_report_fragments"
+ASSEMBLE_REPORT_TASK = "src.presentation.celery.tasks.assemble_report"
+# Menus rendered by all partitions of a report task
+RENDERED_COUNTER = "report-rendered-{task_id}"
 
-    sheet.column_dimensions["A"].width = 10
-    sheet.column_dimensions["B"].width = 35
-    sheet.column_dimensions["C"].width = 35
-    sheet.column_dimensions["D"].width = 35
-    sheet.column_dimensions["E"].width = 35
-    sheet.column_dimensions["F"].width = 10
 
-    font = Font(name="Montserrat", bold=True)
+@asynccontextmanager
+async def _provide_uow(settings: Settings) -> AsyncIterator[SQLAlchemyUoW]:
+    """Worker has no event loop of its own, so the pool lives only for one call"""
+    pool = create_pool(
+        database_url=settings.database_url,
+        echo_mode=False,
+        slow_query_threshold=settings.slow_query_threshold,
+    )
 
-    menu_row, menu_column, menu_counter = 1, 1, 1
-    for menu in report_menus:
-        menu_cells = [
-            sheet.cell(menu_row, menu_column, value=menu_counter),
-            sheet.cell(menu_row, menu_column + 1, value=menu["title"]),
-            sheet.cell(menu_row, menu_column + 2, value=menu["description"]),
-        ]
+    try:
+        async with pool() as session:
+            yield SQLAlchemyUoW(session)
+    finally:
+        await pool.kw["bind"].dispose()
 
-        for menu_cell in menu_cells:
-            menu_cell.font = font
 
-        menu_counter += 1
+async def _save_report_info(settings: Settings, task_id: str, info: ReportInfo):
+    async with _provide_uow(settings) as uow:
+        await uow.report_holder.report_repo.create_report(task_id, info)
+        await uow.commit()
 
-        submenu_row = menu_row + 1
-        submenu_column = menu_column + 1
 
-        submenu_counter = 1
+async def _delete_reports_info(settings: Settings, names: list[str]):
+    async with _provide_uow(settings) as uow:
+        await uow.report_holder.report_repo.delete_by_names(names)
+        await uow.commit()
 
-        for submenu in menu["submenus"]:
-            submenu_cells = [
-                sheet.cell(submenu_row, submenu_column, value=submenu_counter),
-                sheet.cell(submenu_row, submenu_column + 1, value=submenu["title"]),
-                sheet.cell(
-                    submenu_row, submenu_column + 2, value=submenu["description"]
-                ),
-            ]
 
-            for submenu_cell in submenu_cells:
-                submenu_cell.font = font
+def _send_event(
+    status: str,
+    progress: int = 0,
+    result: str | None = None,
+    task_id: str | None = None,
+) -> None:
+    """Publish task state for clients which watch the task, current one by default"""
+    if current_task and current_task.request.id:
+        current_task.backend.client.publish(
+            TASK_EVENTS_CHANNEL.format(task_id=task_id or current_task.request.id),
+            json.dumps({"status": status, "progress": progress, "result": result}),
+        )
+
+
+def _update_progress(progress: int, task_id: str | None = None) -> None:
+    if current_task and current_task.request.id:
+        current_task.update_state(
+            task_id, state="PROGRESS", meta={"progress": progress}
+        )
+        _send_event("PROGRESS", progress, task_id=task_id)
+
+
+def _fragments_progress(task_id: str | None = None) -> Callable[[int, int], None]:
+    """Fragments take progress from 10 to 80 percent, state is sent only on change"""
+    last_progress = 0
+
+    def on_progress(rendered: int, total: int) -> None:
+        nonlocal last_progress
+
+        progress = 10 + 70 * rendered // total
+        if progress != last_progress:
+            last_progress = progress
+            _update_progress(progress, task_id)
+
+    return on_progress
+
+
+def collect_menu_data(report_menus: list[dict], report_format: str = "xlsx") -> str:
+    """Report task, menus of a big report are rendered by several workers at once
+
+    Menus without cached fragments are split into report_processes partitions
+    for a chord of tasks on the report queue, each one within the report time
+    limits. Callback of the chord assembles the report under the id of this
+    task, so clients watch it as before.
+    """
+    try:
+        workflow = _render_in_partitions(report_menus, report_format)
+    except Exception:
+        _send_event("FAILURE")
+        raise
+
+    if workflow is None:
+        return assemble_report(report_menus, report_format)
+
+    return current_task.replace(workflow)
+
+
+def _render_in_partitions(
+    report_menus: list[dict], report_format: str
+) -> Signature | None:
+    settings = get_settings()
+
+    if (
+        report_format != ReportFormat.xlsx
+        or settings.report_processes <= 1
+        or not (current_task and current_task.request.id)
+    ):
+        return None
+
+    menu_versions = [get_menu_version(menu) for menu in report_menus]
+    filename = f"{get_report_version(menu_versions)}_menu.{report_format}"
+    if build_report_storage(settings).stat(filename) is not None:
+        return None
+
+    partitions = partition_missing_fragments(
+        get_fragments_dir(settings),
+        report_menus,
+        menu_versions,
+        settings.report_processes,
+    )
+    if len(partitions) <= 1:
+        return None
+
+    task_id = current_task.request.id
+    total = sum(len(menus) for menus, _ in partitions)
+    current_task.backend.client.set(
+        RENDERED_COUNTER.format(task_id=task_id), 0, ex=settings.report_time_limit
+    )
+    _update_progress(10)
 
-            submenu_counter += 1
+    app = current_task.app
+    return chord(
+        [
+            app.signature(
+                RENDER_FRAGMENTS_TASK,
+                args=(menus, versions, task_id, total),
+                immutable=True,
+            )
+            for menus, versions in partitions
+        ],
+        app.signature(
+            ASSEMBLE_REPORT_TASK, args=(report_menus, report_format), immutable=True
+        ),
+    )
 
-            dish_row = submenu_row + 1
-            dish_column = submenu_column + 1
 
-            dish_counter = 1
+def render_report_fragments(
+    menus: list[dict], menu_versions: list[str], report_task_id: str, total: int
+) -> None:
+    """Chord task, renders a partition of fragments of the report task"""
+    counter = RENDERED_COUNTER.format(task_id=report_task_id)
+    on_progress = _fragments_progress(report_task_id)
+
+    try:
+        render_fragments(
+            get_fragments_dir(get_settings()),
+            menus,
+            menu_versions,
+            # Partitions run at once, progress counts menus of all of them
+            on_progress=lambda *_: on_progress(
+                current_task.backend.client.incr(counter), total
+            ),
+        )
+    except Exception:
+        _send_event("FAILURE", task_id=report_task_id)
+        raise
+
+
+def assemble_report(report_menus: list[dict], report_format: str = "xlsx") -> str:
+    try:
+        link = _build_report(report_menus, report_format)
+    except Exception:
+        _send_event("FAILURE")
+        raise
+
+    _send_event("SUCCESS", progress=100, result=link)
+
+    return link
+
+
+def _build_report(report_menus: list[dict], report_format: str) -> str:
+    settings = get_settings()
+    storage = build_report_storage(settings)
+
+    menu_versions = [get_menu_version(menu) for menu in report_menus]
+
+    filename = f"{get_report_version(menu_versions)}_menu.{report_format}"
+
+    # Report with the same menus was already built, nothing to re-render.
+    # It's touched, retention counts from the new link, not the first one
+    report_file = storage.touch(filename)
+    if report_file is None:
+        # Fragments are sheet XML, other formats are cheap to write as a whole
+        fragments = []
+        if report_format == ReportFormat.xlsx:
+            _update_progress(10)
+            fragments = render_fragments(
+                get_fragments_dir(settings),
+                report_menus,
+                menu_versions,
+                on_progress=_fragments_progress(),
+            )
+
+        os.makedirs(settings.report_dir, exist_ok=True)
+        descriptor, path = tempfile.mkstemp(prefix=".", dir=settings.report_dir)
+        os.close(descriptor)
+
+        try:
+            write_report(ReportFormat(report_format), report_menus, fragments, path)
+            _update_progress(90)
+
+            storage.save(filename, path, compressed=report_format in COMPRESSED_FORMATS)
+        except BaseException:
+            # Soft time limit or failure, temporary file is not a report
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+
+        logger.info("Report was created - %s", filename)
+
+        report_file = storage.stat(filename)
+
+    if current_task and report_file:
+        asyncio.run(
+            _save_report_info(
+                settings,
+                current_task.request.id,
+                ReportInfo(
+                    name=filename,
+                    size=report_file.size,
+                    row_count=count_report_rows(report_menus),
+                    generated_at=report_file.modified_at,
+                ),
+            )
+        )
+
+    return f"{settings.report_base_url}/api/v1/report/download/{filename}"
 
-            for dish in submenu["dishes"]:
-                dish_cells = [
-                    sheet.cell(dish_row, dish_column, value=dish_counter),
-                    sheet.cell(dish_row, dish_column + 1, value=dish["title"]),
-                    sheet.cell(dish_row, dish_column + 2, value=dish["description"]),
-                    sheet.cell(dish_row, dish_column + 3, value=dish["price"]),
-                ]
 
-                for dish_cell in dish_cells:
-                    dish_cell.font = font
+def cleanup_reports() -> int:
+    """Periodic task, keeps reports storage within retention age and quota"""
+    settings = get_settings()
+    storage = build_report_storage(settings)
 
-                dish_counter += 1
+    max_age = timedelta(hours=settings.report_retention_hours)
 
-                dish_row += 1
+    expired = select_expired_reports(
+        storage.list(),
+        now=datetime.now(tz=timezone.utc),
+        max_age=max_age,
+        quota=settings.report_quota_bytes,
+    )
+    for report_file in expired:
+        storage.delete(report_file.name)
 
-            submenu_row = dish_row
+    if expired:
+        asyncio.run(_delete_reports_info(settings, [file.name for file in expired]))
 
-        menu_row = submenu_row
+    pruned = prune_fragments(
+        get_fragments_dir(settings),
+        max_age.total_seconds(),
+        settings.report_fragments_quota_bytes,
+    )
 
-    book.save(f"data/{filename}")
+    logger.info("Reports cleanup - %s reports, %s fragments", len(expired), pruned)
 
-    return f"http://127.0.0.1:8000/api/v1/report/download/{filename}"
+    return len(expired)
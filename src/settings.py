@@ -1,4 +1,7 @@
-from pydantic import BaseSettings
+from typing import Literal
+
+from pydantic import BaseSettings, validator
+from pydantic.fields import ModelField
 
 
 class Settings(BaseSettings):
@@ -7,9 +10,48 @@ class Settings(BaseSettings):
     # APP settings
     title: str = "RestaurantApplication"
 
+    # Responses smaller than minimum size aren't compressed
+    compression_minimum_size: int = 1024
+    compression_cache_expire: int = 3600  # seconds
+
+    # Server of python -m src.presentation.api.asgi
+    host: str = "0.0.0.0"
+    port: int = 8000
+    workers: int = 1
+    # auto - uvloop when installed, it isn't on Windows
+    server_loop: Literal["auto", "asyncio", "uvloop"] = "auto"
+    server_http: Literal["auto", "h11", "httptools"] = "httptools"
+
+    # Results of this many objects (menus, submenus and dishes) and more are
+    # serialized in executor threads, None - always on the event loop
+    serialization_offload_threshold: int | None = 1000
+
+    # Event loop lag monitor, lags over threshold are logged with the loop stack
+    loop_lag_interval: float = 0.1  # seconds
+    loop_lag_threshold: float | None = 0.1  # seconds, None - disabled
+
+    # Tracing, requires "tracing" extra
+    tracing_exporter: str | None = None  # console or otlp, None - disabled
+    tracing_endpoint: str | None = None  # OTLP collector, e.g. http://otel:4317
+    tracing_service_name: str = "restaurant"
+
+    # Profiling, requests with X-Profile-Token header and a sample of the others
+    profiling_token: str | None = None  # also opens /api/v1/admin/profiles
+    profiling_sample_rate: float = 0.0
+    profiling_dir: str = "profiles"
+    profiling_max_files: int = 200
+
     # DB(SQL) settings
     database_url: str
     echo_mode: bool = False
+    # Connections of all workers, every worker gets an equal share
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    slow_query_threshold: float | None = 0.5  # seconds, None - not logged
+    # Test mode, request with more queries fails, None - not checked
+    query_count_limit: int | None = None
+    # Test mode, request issuing a statement more times fails (N+1 loads)
+    query_repeat_limit: int | None = None
 
     # DB(NoSQL) settings
     redis_host: str
@@ -18,6 +60,35 @@ class Settings(BaseSettings):
 
     # Broker settings
     broker_url: str
+    celery_results_db: int = 3
+
+    celery_default_queue: str = "default"
+    celery_report_queue: str = "reports"
+    celery_prefetch_multiplier: int = 1
+    celery_metrics_port: int | None = None  # worker exporter, None - disabled
+
+    report_rate_limit: str | None = "30/m"  # per worker, None - without limit
+    report_soft_time_limit: int = 600  # seconds
+    report_time_limit: int = 660  # seconds
+    # Server-sent events of a task end after it, client reconnects
+    report_events_max_duration: int = 900  # seconds
+
+    # Report settings
+    # Tasks rendering fragments of one report at once, 1 - in the report task
+    report_processes: int = 1
+    report_base_url: str = "http://127.0.0.1:8000"
+    report_storage: str = "local"  # local or s3
+    report_dir: str = "data"
+
+    report_retention_hours: int = 24
+    report_quota_bytes: int = 1024**3
+    report_fragments_quota_bytes: int = 256 * 1024**2  # cached menu fragments
+    report_cleanup_interval: int = 3600  # seconds
+
+    s3_endpoint_url: str | None = None
+    s3_bucket: str = "reports"
+    s3_access_key: str | None = None
+    s3_secret_key: str | None = None
 
     # Test settings
     database_test_url: str
@@ -25,6 +96,13 @@ class Settings(BaseSettings):
     redis_test_cache: str
     redis_test_db: int = 2
 
+    @validator("*", pre=True)
+    def empty_to_none(cls, value, field: ModelField):
+        # Empty variable, e.g. CELERY_METRICS_PORT=, disables optional settings
+        if value == "" and field.allow_none:
+            return None
+        return value
+
     class Config:
         env_file = ".env"
 
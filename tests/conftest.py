@@ -14,33 +14,65 @@ from sqlalchemy.orm import close_all_sessions, sessionmaker
 from src.infrastructure.db.base import create_pool, create_redis
 from src.infrastructure.db.models.dish import Dish
 from src.infrastructure.db.models.menu import Menu
+from src.infrastructure.db.models.report import Report
 from src.infrastructure.db.models.submenu import SubMenu
+from src.infrastructure.profiling import ProfileStorage
+from src.infrastructure.report.storage import LocalReportStorage
 from src.presentation.api.di import setup_di, tasks_sender_provider
 from src.presentation.api.handlers import setup_routes
+from src.presentation.api.middlewares import setup_middlewares
 from src.settings import get_settings
 from tests.mocks import MockTasksSender
 
+# Any request issuing more queries fails, N+1 loads don't go unnoticed
+QUERY_COUNT_LIMIT = 6
+QUERY_REPEAT_LIMIT = 1
 
-def build_test_app() -> FastAPI:
+
+def build_test_app(
+    report_storage: LocalReportStorage,
+    profile_storage: ProfileStorage,
+    profiling_token: str,
+) -> FastAPI:
     """Factory test application"""
 
-    settings = get_settings()
+    # Test values are passed with a copy, settings objects aren't modified
+    settings = get_settings().copy(
+        update={
+            "profiling_token": profiling_token,
+            "query_count_limit": QUERY_COUNT_LIMIT,
+            "query_repeat_limit": QUERY_REPEAT_LIMIT,
+        }
+    )
 
     pool = create_pool(database_url=settings.database_test_url, echo_mode=False)
 
+    redis = create_redis(
+        redis_host=settings.redis_test_cache,
+        redis_port=settings.redis_port,
+        redis_db=settings.redis_test_db,
+    )
+
     app = FastAPI(title=settings.title, default_response_class=ORJSONResponse)
 
     # setup test application
     setup_di(
         app=app,
         pool=pool,
-        redis=create_redis(
+        redis=redis,
+        report_storage=report_storage,
+        results_redis=create_redis(
             redis_host=settings.redis_test_cache,
             redis_port=settings.redis_port,
             redis_db=settings.redis_test_db,
         ),
+        profile_storage=profile_storage,
+        profiling_token=profiling_token,
     )
     setup_routes(router=app.router)
+    setup_middlewares(
+        app=app, redis=redis, settings=settings, profile_storage=profile_storage
+    )
 
     app.dependency_overrides[tasks_sender_provider] = lambda: MockTasksSender()
 
@@ -55,11 +87,41 @@ def event_loop() -> Generator:
 
 
 @pytest_asyncio.fixture(scope="function")
-async def client() -> AsyncGenerator[AsyncClient, Any]:
-    async with AsyncClient(app=build_test_app(), base_url="http://test") as client:
+async def client(
+    report_storage, profile_storage, profiling_token
+) -> AsyncGenerator[AsyncClient, Any]:
+    async with AsyncClient(
+        app=build_test_app(report_storage, profile_storage, profiling_token),
+        base_url="http://test",
+    ) as client:
         yield client
 
 
+@pytest.fixture(scope="function")
+def report_storage(tmp_path) -> LocalReportStorage:
+    return LocalReportStorage(directory=str(tmp_path / "reports"))
+
+
+@pytest.fixture(scope="function")
+def profile_storage(tmp_path) -> ProfileStorage:
+    return ProfileStorage(directory=str(tmp_path / "profiles"), max_files=2)
+
+
+@pytest.fixture(scope="session")
+def profiling_token() -> str:
+    return "test-profiling-token"
+
+
+@pytest.fixture(scope="function")
+def save_report(report_storage, tmp_path):
+    def save_report(name: str, content: bytes, compressed: bool = False):
+        path = tmp_path / name
+        path.write_bytes(content)
+        report_storage.save(name, str(path), compressed=compressed)
+
+    return save_report
+
+
 @pytest_asyncio.fixture(scope="session")
 async def db_session_test() -> sessionmaker:
     yield create_pool(get_settings().database_test_url, echo_mode=False)
@@ -75,7 +137,7 @@ async def get_cache() -> Redis:
 
 @pytest_asyncio.fixture(scope="function", autouse=True)
 async def clean_tables(db_session_test):
-    tables = ("menu", "submenu", "dish")
+    tables = ("menu", "submenu", "dish", "report")
     async with db_session_test() as session:
         for table in tables:
             statement = text(f"""TRUNCATE TABLE {table} CASCADE;""")
@@ -88,6 +150,17 @@ async def clean_cache(get_cache):
     await get_cache.flushdb()
 
 
+@pytest_asyncio.fixture(scope="session")
+async def pg_trgm(db_session_test):
+    """Dish search needs pg_trgm, it comes with postgres contrib"""
+    async with db_session_test() as session:
+        installed = await session.scalar(
+            text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        )
+    if not installed:
+        pytest.skip("pg_trgm extension is not installed")
+
+
 @pytest_asyncio.fixture(scope="function")
 async def create_menu_in_database(db_session_test: sessionmaker):
     async def create_menu_in_database(menu_id: str, title: str, description: str):
@@ -136,6 +209,16 @@ async def create_dish_in_database(db_session_test: sessionmaker):
     return create_dish_in_database
 
 
+@pytest_asyncio.fixture(scope="function")
+async def create_report_in_database(db_session_test: sessionmaker):
+    async def create_report_in_database(task_id: str, **report_info):
+        async with db_session_test() as session:
+            await session.execute(insert(Report).values(task_id=task_id, **report_info))
+            await session.commit()
+
+    return create_report_in_database
+
+
 @pytest_asyncio.fixture(scope="function")
 async def delete_menu_from_database(db_session_test: sessionmaker):
     async def delete_menu_from_database(menu_id: str):
@@ -227,3 +310,24 @@ def dish_data():
         "price": "14.50",
         "submenu_id": "5f740121-65d6-490b-984c-1cb28a4b43fa",
     }
+
+
+@pytest.fixture
+def report_menu():
+    return {
+        "title": "some_title",
+        "description": "some_description",
+        "submenus": [
+            {
+                "title": "some_title",
+                "description": "some_description",
+                "dishes": [
+                    {
+                        "title": "some_title",
+                        "description": "some_description",
+                        "price": "14.50",
+                    }
+                ],
+            }
+        ],
+    }
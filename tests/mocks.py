@@ -1,6 +1,58 @@
+import hashlib
+import io
+from datetime import datetime, timezone
 from typing import Any
 
 
 class MockTasksSender:
-    def collect_menu_data(self, mock_arg: Any) -> None:
-        pass
+    async def collect_menu_data(self, mock_arg: Any, report_format: Any) -> str:
+        return "task-id"
+
+
+class MockS3Client:
+    """In-memory stand-in for S3-compatible client (boto3/MinIO)"""
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.modified: dict[str, datetime] = {}
+
+    def upload_file(self, path: str, bucket: str, key: str) -> None:
+        with open(path, "rb") as file:
+            self.objects[key] = file.read()
+        self.modified[key] = datetime.now(tz=timezone.utc)
+
+    def copy_object(
+        self, Bucket: str, Key: str, CopySource: dict, MetadataDirective: str
+    ) -> None:
+        self.objects[Key] = self.objects[CopySource["Key"]]
+        self.modified[Key] = datetime.now(tz=timezone.utc)
+
+    def get_paginator(self, operation_name: str) -> "MockS3Client":
+        return self
+
+    def paginate(self, Bucket: str, Prefix: str = "") -> list[dict]:
+        return [
+            {
+                "Contents": [
+                    {
+                        "Key": key,
+                        "Size": len(body),
+                        "ETag": f'"{hashlib.md5(body).hexdigest()}"',
+                        "LastModified": self.modified[key],
+                    }
+                    for key, body in self.objects.items()
+                    if key.startswith(Prefix)
+                ]
+            }
+        ]
+
+    def get_object(self, Bucket: str, Key: str, Range: str | None = None) -> dict:
+        body = self.objects[Key]
+        if Range:
+            start, _, end = Range.removeprefix("bytes=").partition("-")
+            body = body[int(start) : int(end) + 1 if end else None]
+        return {"Body": io.BytesIO(body)}
+
+    def delete_object(self, Bucket: str, Key: str) -> None:
+        self.objects.pop(Key, None)
+        self.modified.pop(Key, None)
@@ -0,0 +1,132 @@
+import json
+import uuid
+
+import pytest
+
+
+class TestBatchHandlers:
+    @pytest.mark.asyncio
+    async def test_batch_get_dishes(
+        self,
+        client,
+        menu_data,
+        submenu_data,
+        dish_data,
+        create_menu_in_database,
+        create_submenu_in_database,
+        create_dish_in_database,
+        get_cache,
+    ):
+        await create_menu_in_database(**menu_data)
+        await create_submenu_in_database(**submenu_data)
+        await create_dish_in_database(**dish_data)
+
+        second_dish_id = str(uuid.uuid4())
+        await create_dish_in_database(
+            **{**dish_data, "dish_id": second_dish_id, "title": "second_title"}
+        )
+        # One dish is cached, the other one is loaded from database
+        await client.get(
+            f'api/v1/menus/{menu_data["menu_id"]}/submenus/{submenu_data["submenu_id"]}'
+            f'/dishes/{dish_data["dish_id"]}'
+        )
+
+        missing_id = str(uuid.uuid4())
+        response = await client.post(
+            "api/v1/dishes:batchGet",
+            json={"ids": [second_dish_id, missing_id, dish_data["dish_id"]]},
+        )
+        data = response.json()
+
+        assert response.status_code == 200
+        assert [dish["id"] for dish in data["items"]] == [
+            second_dish_id,
+            dish_data["dish_id"],
+        ]
+        assert data["not_found"] == [missing_id]
+
+        dish_from_cache = json.loads(await get_cache.get(f"dish-{second_dish_id}"))
+
+        assert dish_from_cache == data["items"][0]
+        assert await get_cache.get(f"dish-{second_dish_id}:etag") is not None
+
+    @pytest.mark.asyncio
+    async def test_batch_get_menus_with_counters(
+        self,
+        client,
+        menu_data,
+        submenu_data,
+        dish_data,
+        create_menu_in_database,
+        create_submenu_in_database,
+        create_dish_in_database,
+    ):
+        await create_menu_in_database(**menu_data)
+        await create_submenu_in_database(**submenu_data)
+        await create_dish_in_database(**dish_data)
+
+        response = await client.post(
+            "api/v1/menus:batchGet",
+            json={"ids": [menu_data["menu_id"], menu_data["menu_id"]]},
+        )
+        data = response.json()
+
+        assert response.status_code == 200
+        assert len(data["items"]) == 1
+        assert data["items"][0]["submenus_count"] == 1
+        assert data["items"][0]["dishes_count"] == 1
+
+        menu_response = await client.get(f'api/v1/menus/{menu_data["menu_id"]}')
+
+        assert menu_response.json() == data["items"][0]
+
+    @pytest.mark.asyncio
+    async def test_batch_get_submenus(
+        self,
+        client,
+        menu_data,
+        submenu_data,
+        create_menu_in_database,
+        create_submenu_in_database,
+    ):
+        await create_menu_in_database(**menu_data)
+        await create_submenu_in_database(**submenu_data)
+
+        response = await client.post(
+            "api/v1/submenus:batchGet", json={"ids": [submenu_data["submenu_id"]]}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["items"][0]["dishes_count"] == 0
+        assert response.json()["not_found"] == []
+
+    @pytest.mark.asyncio
+    async def test_batch_get_menus_skips_cached_submenu(
+        self,
+        client,
+        menu_data,
+        submenu_data,
+        create_menu_in_database,
+        create_submenu_in_database,
+    ):
+        await create_menu_in_database(**menu_data)
+        await create_submenu_in_database(**submenu_data)
+        # Submenu is cached, its id isn't a menu one
+        await client.get(
+            f'api/v1/menus/{menu_data["menu_id"]}/submenus/{submenu_data["submenu_id"]}'
+        )
+
+        response = await client.post(
+            "api/v1/menus:batchGet", json={"ids": [submenu_data["submenu_id"]]}
+        )
+
+        assert response.json() == {
+            "items": [],
+            "not_found": [submenu_data["submenu_id"]],
+        }
+
+    @pytest.mark.asyncio
+    async def test_batch_get_invalid_ids(self, client):
+        response = await client.post("api/v1/dishes:batchGet", json={"ids": []})
+
+        assert response.status_code == 422
@@ -67,6 +67,231 @@ class TestDishHandlers:
         assert len(response.json()) == 1
         assert response.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_get_dishes_fields(
+        self,
+        client,
+        submenu_data,
+        create_submenu_in_database,
+        menu_data,
+        create_menu_in_database,
+        dish_data,
+        create_dish_in_database,
+        get_cache,
+    ):
+        await create_menu_in_database(**menu_data)
+        await create_submenu_in_database(**submenu_data)
+        await create_dish_in_database(**dish_data)
+        response = await client.get(
+            f'api/v1/menus/{menu_data["menu_id"]}/submenus/{submenu_data["submenu_id"]}/dishes',
+            params={"fields": "price,id"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {"id": dish_data["dish_id"], "price": dish_data["price"]}
+        ]
+
+        dishes_from_cache = await get_cache.hget(
+            f'dishes-{submenu_data["submenu_id"]}-fields', "id,price"
+        )
+
+        assert json.loads(dishes_from_cache) == response.json()
+
+    @pytest.mark.asyncio
+    async def test_get_dish_not_modified(
+        self,
+        client,
+        submenu_data,
+        create_submenu_in_database,
+        menu_data,
+        create_menu_in_database,
+        dish_data,
+        create_dish_in_database,
+    ):
+        await create_menu_in_database(**menu_data)
+        await create_submenu_in_database(**submenu_data)
+        await create_dish_in_database(**dish_data)
+        url = (
+            f'api/v1/menus/{menu_data["menu_id"]}/submenus/{submenu_data["submenu_id"]}'
+            f'/dishes/{dish_data["dish_id"]}'
+        )
+
+        first_response = await client.get(url)
+        etag = first_response.headers["etag"].removeprefix("W/")
+        response = await client.get(url, headers={"If-None-Match": f"W/{etag}"})
+
+        assert response.status_code == 304
+
+        await client.delete(url)
+        response = await client.get(
+            url, headers={"If-None-Match": first_response.headers["etag"]}
+        )
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_get_dishes_unknown_fields(self, client, menu_data, submenu_data):
+        response = await client.get(
+            f'api/v1/menus/{menu_data["menu_id"]}/submenus/{submenu_data["submenu_id"]}/dishes',
+            params={"fields": "id,secret"},
+        )
+
+        assert response.status_code == 422
+        assert response.json() == {"detail": "requested fields are not allowed"}
+
+    @pytest.mark.asyncio
+    async def test_get_dishes_price_filter(
+        self,
+        client,
+        submenu_data,
+        create_submenu_in_database,
+        menu_data,
+        create_menu_in_database,
+        dish_data,
+        create_dish_in_database,
+    ):
+        await create_menu_in_database(**menu_data)
+        await create_submenu_in_database(**submenu_data)
+        for title, price in (("soup", "250.12"), ("tea", "9.5"), ("cake", "14.50")):
+            await create_dish_in_database(
+                dish_id=str(uuid.uuid4()),
+                title=title,
+                description=dish_data["description"],
+                price=price,
+                submenu_id=submenu_data["submenu_id"],
+            )
+        url = (
+            f'api/v1/menus/{menu_data["menu_id"]}/submenus/{submenu_data["submenu_id"]}'
+            "/dishes"
+        )
+
+        response = await client.get(url, params={"sort": "price"})
+
+        assert response.status_code == 200
+        assert [dish["price"] for dish in response.json()] == [
+            "9.50",
+            "14.50",
+            "250.12",
+        ]
+
+        response = await client.get(
+            url,
+            params={"min_price": "10", "max_price": "250", "fields": "title,price"},
+        )
+
+        assert response.json() == [{"title": "cake", "price": "14.50"}]
+
+        response = await client.get(url, params={"min_price": "9.6", "sort": "-price"})
+
+        assert [dish["title"] for dish in response.json()] == ["soup", "cake"]
+
+    @pytest.mark.asyncio
+    async def test_get_dishes_zero_min_price(
+        self,
+        client,
+        submenu_data,
+        create_submenu_in_database,
+        menu_data,
+        create_menu_in_database,
+        dish_data,
+        create_dish_in_database,
+    ):
+        await create_menu_in_database(**menu_data)
+        await create_submenu_in_database(**submenu_data)
+        for title, price in (("discount", "-1.00"), ("tea", "9.50")):
+            await create_dish_in_database(
+                dish_id=str(uuid.uuid4()),
+                title=title,
+                description=dish_data["description"],
+                price=price,
+                submenu_id=submenu_data["submenu_id"],
+            )
+        url = (
+            f'api/v1/menus/{menu_data["menu_id"]}/submenus/{submenu_data["submenu_id"]}'
+            "/dishes"
+        )
+
+        response = await client.get(url, params={"sort": "price"})
+
+        assert len(response.json()) == 2
+
+        # Filtered list is cached apart from the list without min_price
+        response = await client.get(url, params={"min_price": "0", "sort": "price"})
+
+        assert [dish["title"] for dish in response.json()] == ["tea"]
+
+    @pytest.mark.asyncio
+    async def test_filtered_dishes_cache_expires(
+        self,
+        client,
+        submenu_data,
+        create_submenu_in_database,
+        menu_data,
+        create_menu_in_database,
+        dish_data,
+        create_dish_in_database,
+        get_cache,
+    ):
+        await create_menu_in_database(**menu_data)
+        await create_submenu_in_database(**submenu_data)
+        await create_dish_in_database(**dish_data)
+        url = (
+            f'api/v1/menus/{menu_data["menu_id"]}/submenus/{submenu_data["submenu_id"]}'
+            "/dishes"
+        )
+        filtered = f'dishes-{submenu_data["submenu_id"]}-filtered'
+
+        for min_price in range(5):
+            await client.get(url, params={"min_price": min_price})
+
+        assert await get_cache.hlen(filtered) == 5
+        assert 0 < await get_cache.ttl(filtered) <= 60
+        # Lists without a filter don't expire
+        await client.get(url, params={"fields": "id"})
+        assert await get_cache.ttl(f'dishes-{submenu_data["submenu_id"]}-fields') == -1
+
+        await client.patch(f'{url}/{dish_data["dish_id"]}', json={"price": "1.00"})
+
+        assert await get_cache.exists(filtered) == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "params", [{"sort": "title"}, {"min_price": "-1"}, {"max_price": "abc"}]
+    )
+    async def test_get_dishes_invalid_filter(
+        self, client, menu_data, submenu_data, params
+    ):
+        response = await client.get(
+            f'api/v1/menus/{menu_data["menu_id"]}/submenus/{submenu_data["submenu_id"]}/dishes',
+            params=params,
+        )
+
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "price, expected", [("2.675", "2.68"), ("1.005", "1.01"), ("9.5", "9.50")]
+    )
+    async def test_create_dish_price_rounded_half_up(
+        self,
+        client,
+        menu_data,
+        create_menu_in_database,
+        submenu_data,
+        create_submenu_in_database,
+        price,
+        expected,
+    ):
+        await create_menu_in_database(**menu_data)
+        await create_submenu_in_database(**submenu_data)
+        response = await client.post(
+            f'api/v1/menus/{menu_data["menu_id"]}/submenus/{submenu_data["submenu_id"]}/dishes',
+            json={"title": "title", "description": "description", "price": price},
+        )
+
+        assert response.json()["price"] == expected
+
     @pytest.mark.asyncio
     async def test_create_submenu(
         self,
@@ -99,9 +324,9 @@ class TestDishHandlers:
 
         assert data["title"] == dish_from_db.title
         assert data["description"] == dish_from_db.description
-        assert data["price"] == dish_from_db.price
+        assert data["price"] == str(dish_from_db.price)
 
-        dish_from_cache = json.loads(await get_cache.get(data["id"]))
+        dish_from_cache = json.loads(await get_cache.get(f'dish-{data["id"]}'))
 
         assert data["title"] == dish_from_cache["title"]
         assert data["description"] == dish_from_cache["description"]
@@ -211,7 +436,7 @@ class TestDishHandlers:
         assert data["price"] == dish_data["price"]
         assert response.status_code == 200
 
-        dish_from_cache = json.loads(await get_cache.get(data["id"]))
+        dish_from_cache = json.loads(await get_cache.get(f'dish-{data["id"]}'))
 
         assert data["id"] == dish_from_cache["id"]
         assert data["title"] == dish_from_cache["title"]
@@ -327,9 +552,9 @@ class TestDishHandlers:
 
             assert data["title"] == dish_from_db.title
             assert data["description"] == dish_from_db.description
-            assert data["price"] == dish_from_db.price
+            assert data["price"] == str(dish_from_db.price)
 
-            dish_from_cache = json.loads(await get_cache.get(data["id"]))
+            dish_from_cache = json.loads(await get_cache.get(f'dish-{data["id"]}'))
 
             assert data["title"] == dish_from_cache["title"]
             assert data["description"] == dish_from_cache["description"]
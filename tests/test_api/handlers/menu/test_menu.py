@@ -22,6 +22,65 @@ class TestMenuHandlers:
         assert len(response.json()) == 1
         assert response.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_menus_get_fields(
+        self,
+        client,
+        menu_data,
+        submenu_data,
+        dish_data,
+        create_menu_in_database,
+        create_submenu_in_database,
+        create_dish_in_database,
+        get_cache,
+    ):
+        await create_menu_in_database(**menu_data)
+        await create_submenu_in_database(**submenu_data)
+        await create_dish_in_database(**dish_data)
+
+        response = await client.get(
+            "api/v1/menus/", params={"fields": "dishes_count,title,id"}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {
+                "id": menu_data["menu_id"],
+                "title": menu_data["title"],
+                "dishes_count": 1,
+            }
+        ]
+
+        menus_from_cache = await get_cache.hget("menus-fields", "id,title,dishes_count")
+
+        assert json.loads(menus_from_cache) == response.json()
+
+    @pytest.mark.asyncio
+    async def test_menus_fields_cache_cleared_on_create(
+        self, client, menu_data, create_menu_in_database, get_cache
+    ):
+        await create_menu_in_database(**menu_data)
+        await client.get("api/v1/menus/", params={"fields": "id"})
+
+        assert await get_cache.hget("menus-fields", "id") is not None
+
+        await client.post(
+            "api/v1/menus/", json={"title": "title", "description": "description"}
+        )
+
+        assert await get_cache.hget("menus-fields", "id") is None
+
+        response = await client.get("api/v1/menus/", params={"fields": "id"})
+
+        assert len(response.json()) == 2
+
+    @pytest.mark.asyncio
+    async def test_menus_get_unknown_fields(self, client):
+        response = await client.get("api/v1/menus/", params={"fields": "id,secret"})
+
+        assert response.status_code == 422
+        assert response.json() == {"detail": "requested fields are not allowed"}
+
     @pytest.mark.asyncio
     async def test_create_menu(self, client, get_menu_from_database, get_cache):
         test_data = {"title": "test_title", "description": "test_description"}
@@ -39,7 +98,7 @@ class TestMenuHandlers:
         assert data["title"] == menu_from_db.title
         assert data["description"] == menu_from_db.description
 
-        menu_from_cache = json.loads(await get_cache.get(data["id"]))
+        menu_from_cache = json.loads(await get_cache.get(f'menu-{data["id"]}'))
 
         assert data["title"] == menu_from_cache["title"]
         assert data["description"] == menu_from_cache["description"]
@@ -120,7 +179,9 @@ class TestMenuHandlers:
 
         assert response.status_code == 200
 
-        menu_from_cache = json.loads(await get_cache.get(menu_data["menu_id"]))
+        menu_from_cache = json.loads(
+            await get_cache.get(f'menu-{menu_data["menu_id"]}')
+        )
 
         assert data["id"] == menu_from_cache["id"]
         assert data["title"] == menu_from_cache["title"]
@@ -204,7 +265,7 @@ class TestMenuHandlers:
             assert data["title"] == menu_from_db.title
             assert data["description"] == menu_from_db.description
 
-            menu_from_cache = json.loads(await get_cache.get(data["id"]))
+            menu_from_cache = json.loads(await get_cache.get(f'menu-{data["id"]}'))
 
             assert menu_from_cache["title"] == data["title"]
             assert menu_from_cache["description"] == data["description"]
@@ -269,7 +330,7 @@ class TestMenuHandlers:
         await delete_dish_from_database(temp)
         await delete_submenu_from_database(submenu_data["submenu_id"])
 
-        await get_cache.delete(menu_data["menu_id"])
+        await get_cache.delete(f'menu-{menu_data["menu_id"]}')
 
         second_response = await client.get(f'api/v1/menus/{menu_data["menu_id"]}')
         second_data = second_response.json()
@@ -280,3 +341,134 @@ class TestMenuHandlers:
         assert first_data["dishes_count"] == 2
         assert second_data["submenus_count"] == 0
         assert second_data["dishes_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_get_menu_tree(
+        self,
+        client,
+        menu_data,
+        submenu_data,
+        dish_data,
+        create_menu_in_database,
+        create_submenu_in_database,
+        create_dish_in_database,
+        get_cache,
+    ):
+        await create_menu_in_database(**menu_data)
+        await create_submenu_in_database(**submenu_data)
+        await create_dish_in_database(**dish_data)
+        await create_dish_in_database(
+            **{**dish_data, "dish_id": str(uuid.uuid4()), "title": "a_dish"}
+        )
+
+        response = await client.get(f'api/v1/menus/{menu_data["menu_id"]}/tree')
+        data = response.json()
+
+        assert response.status_code == 200
+        assert data["id"] == menu_data["menu_id"]
+        assert data["submenus_count"] == 1
+        assert data["dishes_count"] == 2
+
+        submenu = data["submenus"][0]
+
+        assert submenu["id"] == submenu_data["submenu_id"]
+        assert submenu["dishes_count"] == 2
+        assert [dish["title"] for dish in submenu["dishes"]] == [
+            "a_dish",
+            dish_data["title"],
+        ]
+        assert submenu["dishes"][1]["price"] == dish_data["price"]
+
+        tree_from_cache = json.loads(
+            await get_cache.get(f'tree-{menu_data["menu_id"]}')
+        )
+
+        assert tree_from_cache == data
+
+        # Cached JSON is sent as is, without parsing and encoding it again
+        response = await client.get(f'api/v1/menus/{menu_data["menu_id"]}/tree')
+
+        assert response.content == await get_cache.get(f'tree-{menu_data["menu_id"]}')
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["etag"]
+
+    @pytest.mark.asyncio
+    async def test_get_menu_tree_empty(
+        self, client, menu_data, create_menu_in_database
+    ):
+        await create_menu_in_database(**menu_data)
+
+        response = await client.get(f'api/v1/menus/{menu_data["menu_id"]}/tree')
+
+        assert response.status_code == 200
+        assert response.json()["submenus"] == []
+
+    @pytest.mark.asyncio
+    async def test_get_menu_tree_404(self, client):
+        response = await client.get(f"api/v1/menus/{uuid.uuid4()}/tree")
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "menu not found"}
+
+    @pytest.mark.asyncio
+    async def test_menu_tree_cache_cleared_on_dish_create(
+        self,
+        client,
+        menu_data,
+        submenu_data,
+        create_menu_in_database,
+        create_submenu_in_database,
+        get_cache,
+    ):
+        await create_menu_in_database(**menu_data)
+        await create_submenu_in_database(**submenu_data)
+
+        menu_id, submenu_id = menu_data["menu_id"], submenu_data["submenu_id"]
+
+        await client.get(f"api/v1/menus/{menu_id}/tree")
+        await client.post(
+            f"api/v1/menus/{menu_id}/submenus/{submenu_id}/dishes",
+            json={"title": "dish", "description": "dish", "price": "1.50"},
+        )
+
+        assert await get_cache.get(f"tree-{menu_id}") is None
+
+        response = await client.get(f"api/v1/menus/{menu_id}/tree")
+
+        assert response.json()["dishes_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_menu_not_modified(
+        self, client, menu_data, create_menu_in_database
+    ):
+        await create_menu_in_database(**menu_data)
+        url = f'api/v1/menus/{menu_data["menu_id"]}'
+
+        first_response = await client.get(url)
+        etag = first_response.headers["etag"]
+
+        response = await client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+        await client.patch(url, json={"title": "new_title"})
+        response = await client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "new_title"
+        assert response.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_get_menus_not_modified(
+        self, client, menu_data, create_menu_in_database
+    ):
+        await create_menu_in_database(**menu_data)
+
+        first_response = await client.get("api/v1/menus/")
+        response = await client.get(
+            "api/v1/menus/", headers={"If-None-Match": first_response.headers["etag"]}
+        )
+
+        assert response.status_code == 304
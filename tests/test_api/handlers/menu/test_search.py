@@ -0,0 +1,77 @@
+import json
+import uuid
+
+import pytest
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture
+async def dishes_for_search(
+    menu_data,
+    submenu_data,
+    dish_data,
+    create_menu_in_database,
+    create_submenu_in_database,
+    create_dish_in_database,
+):
+    await create_menu_in_database(**menu_data)
+    await create_submenu_in_database(**submenu_data)
+    await create_dish_in_database(
+        **{**dish_data, "title": "Борщ", "description": "Суп со сметаной"}
+    )
+    await create_dish_in_database(
+        **{
+            **dish_data,
+            "dish_id": str(uuid.uuid4()),
+            "title": "Салат Цезарь",
+            "description": "С курицей",
+        }
+    )
+
+
+@pytest.mark.usefixtures("pg_trgm", "dishes_for_search")
+class TestSearchHandlers:
+    @pytest.mark.asyncio
+    async def test_search_by_prefix(self, client, menu_data, submenu_data):
+        response = await client.get("api/v1/dishes:search", params={"q": "сметан"})
+        data = response.json()
+
+        assert response.status_code == 200
+        assert [dish["title"] for dish in data] == ["Борщ"]
+        assert data[0]["menu_id"] == menu_data["menu_id"]
+        assert data[0]["submenu_id"] == submenu_data["submenu_id"]
+
+    @pytest.mark.asyncio
+    async def test_search_all_words(self, client):
+        response = await client.get("api/v1/dishes:search", params={"q": "цез кур"})
+
+        assert [dish["title"] for dish in response.json()] == ["Салат Цезарь"]
+
+    @pytest.mark.asyncio
+    async def test_search_similar_title(self, client):
+        response = await client.get("api/v1/dishes:search", params={"q": "Борш"})
+
+        assert [dish["title"] for dish in response.json()] == ["Борщ"]
+
+    @pytest.mark.asyncio
+    async def test_search_cached(self, client, get_cache):
+        response = await client.get(
+            "api/v1/dishes:search", params={"q": "Борщ!", "limit": 5}
+        )
+
+        assert json.loads(await get_cache.get("search-5-борщ")) == response.json()
+
+
+class TestSearchValidation:
+    @pytest.mark.asyncio
+    async def test_search_without_words(self, client):
+        response = await client.get("api/v1/dishes:search", params={"q": "!!"})
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    @pytest.mark.asyncio
+    async def test_search_empty_query(self, client):
+        response = await client.get("api/v1/dishes:search", params={"q": ""})
+
+        assert response.status_code == 422
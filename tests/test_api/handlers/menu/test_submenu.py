@@ -70,7 +70,7 @@ class TestSubMenuHandlers:
         assert data["title"] == submenu_from_db.title
         assert data["description"] == submenu_from_db.description
 
-        submenu_from_cache = json.loads(await get_cache.get(data["id"]))
+        submenu_from_cache = json.loads(await get_cache.get(f'submenu-{data["id"]}'))
 
         assert data["title"] == submenu_from_cache["title"]
         assert data["description"] == submenu_from_cache["description"]
@@ -175,7 +175,9 @@ class TestSubMenuHandlers:
         assert data["dishes_count"] == 0
         assert response.status_code == 200
 
-        submenu_from_cache = json.loads(await get_cache.get(submenu_data["submenu_id"]))
+        submenu_from_cache = json.loads(
+            await get_cache.get(f'submenu-{submenu_data["submenu_id"]}')
+        )
         assert data["id"] == submenu_from_cache["id"]
         assert data["title"] == submenu_from_cache["title"]
         assert data["description"] == submenu_from_cache["description"]
@@ -271,7 +273,9 @@ class TestSubMenuHandlers:
             assert data["title"] == submenu_from_db.title
             assert data["description"] == submenu_from_db.description
 
-            submenu_from_cache = json.loads(await get_cache.get(data["id"]))
+            submenu_from_cache = json.loads(
+                await get_cache.get(f'submenu-{data["id"]}')
+            )
 
             assert data["title"] == submenu_from_cache["title"]
             assert data["description"] == submenu_from_cache["description"]
@@ -1,3 +1,9 @@
+import asyncio
+import gzip
+import json
+import uuid
+from datetime import datetime, timezone
+
 import pytest
 
 
@@ -10,3 +16,194 @@ class TestReportHandlers:
             "detail": "Report data for create Excel-file with menu was empty"
         }
         assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_download_report_not_found(self, client):
+        response = await client.get("api/v1/report/download/some_menu.xlsx")
+
+        assert response.json() == {"detail": "Report file is not ready or not created"}
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_download_report_range(self, client, save_report):
+        save_report("some_menu.xlsx", b"0123456789")
+
+        response = await client.get(
+            "api/v1/report/download/some_menu.xlsx", headers={"Range": "bytes=2-5"}
+        )
+
+        assert response.status_code == 206
+        assert response.content == b"2345"
+        assert response.headers["content-range"] == "bytes 2-5/10"
+
+    @pytest.mark.asyncio
+    async def test_download_report_range_not_satisfiable(self, client, save_report):
+        save_report("some_menu.xlsx", b"0123456789")
+
+        response = await client.get(
+            "api/v1/report/download/some_menu.xlsx", headers={"Range": "bytes=10-"}
+        )
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */10"
+
+    @pytest.mark.asyncio
+    async def test_download_report_not_modified(self, client, save_report):
+        save_report("some_menu.xlsx", b"0123456789")
+
+        response = await client.get("api/v1/report/download/some_menu.xlsx")
+        etag = response.headers["etag"]
+
+        response = await client.get(
+            "api/v1/report/download/some_menu.xlsx", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "accept_encoding, content_encoding",
+        [("gzip", "gzip"), ("identity", None)],
+    )
+    async def test_download_compressed_report(
+        self, client, save_report, accept_encoding, content_encoding
+    ):
+        save_report("some_menu.csv", gzip.compress(b"1,title"), compressed=True)
+
+        response = await client.get(
+            "api/v1/report/download/some_menu.csv",
+            headers={"Accept-Encoding": accept_encoding},
+        )
+
+        assert response.status_code == 200
+        assert response.content == b"1,title"
+        assert response.headers.get("content-encoding") == content_encoding
+
+    @pytest.mark.asyncio
+    async def test_get_info_about_pending_task(self, client, get_cache):
+        task_id = str(uuid.uuid4())
+        await get_cache.set(
+            f"celery-task-meta-{task_id}", json.dumps({"status": "PENDING"})
+        )
+
+        response = await client.get(f"api/v1/report/{task_id}")
+
+        assert response.json()["task"] == {
+            "status": "PENDING",
+            "progress": 0,
+            "link": None,
+            "report": None,
+        }
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path", ["api/v1/report/{}", "api/v1/report/{}/events"])
+    async def test_unknown_task_not_found(self, client, path):
+        response = await client.get(path.format(uuid.uuid4()))
+
+        assert response.status_code == 404
+        assert response.json() == {
+            "detail": "Report task is not found or its result expired"
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_info_about_task_in_progress(self, client, get_cache):
+        task_id = str(uuid.uuid4())
+        await get_cache.set(
+            f"celery-task-meta-{task_id}",
+            json.dumps({"status": "PROGRESS", "result": {"progress": 45}}),
+        )
+
+        response = await client.get(f"api/v1/report/{task_id}")
+
+        assert response.json()["task"]["status"] == "PROGRESS"
+        assert response.json()["task"]["progress"] == 45
+
+    @pytest.mark.asyncio
+    async def test_get_info_about_task_with_report(
+        self, client, get_cache, create_report_in_database
+    ):
+        task_id = str(uuid.uuid4())
+        await get_cache.set(
+            f"celery-task-meta-{task_id}",
+            json.dumps({"status": "SUCCESS", "result": "/download/some_menu.xlsx"}),
+        )
+        await create_report_in_database(
+            task_id,
+            name="some_menu.xlsx",
+            size=1024,
+            row_count=12,
+            generated_at=datetime(2023, 1, 1, tzinfo=timezone.utc),
+        )
+
+        response = await client.get(f"api/v1/report/{task_id}")
+        task = response.json()["task"]
+
+        assert response.status_code == 200
+        assert task["status"] == "SUCCESS"
+        assert task["progress"] == 100
+        assert task["link"] == "/download/some_menu.xlsx"
+        assert task["report"] == {
+            "name": "some_menu.xlsx",
+            "size": 1024,
+            "row_count": 12,
+            "generated_at": "2023-01-01T00:00:00+00:00",
+        }
+
+    @pytest.mark.asyncio
+    async def test_watch_finished_task(self, client, get_cache):
+        task_id = str(uuid.uuid4())
+        await get_cache.set(
+            f"celery-task-meta-{task_id}",
+            json.dumps({"status": "SUCCESS", "result": "/download/some_menu.xlsx"}),
+        )
+
+        response = await client.get(f"api/v1/report/{task_id}/events")
+        events = [
+            json.loads(line.removeprefix("data: "))
+            for line in response.text.splitlines()
+            if line
+        ]
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert [event["status"] for event in events] == ["SUCCESS"]
+        assert events[0]["link"] == "/download/some_menu.xlsx"
+
+    @pytest.mark.asyncio
+    async def test_watch_task_progress_events(self, client, get_cache):
+        task_id = str(uuid.uuid4())
+        channel = f"report-task-events-{task_id}"
+        await get_cache.set(
+            f"celery-task-meta-{task_id}", json.dumps({"status": "PENDING"})
+        )
+
+        async def publish_events():
+            while (
+                not await get_cache.pubsub_numsub(channel)
+                or not (await get_cache.pubsub_numsub(channel))[0][1]
+            ):
+                await asyncio.sleep(0.01)
+
+            for event in (
+                {"status": "PROGRESS", "progress": 50, "result": None},
+                {"status": "SUCCESS", "progress": 100, "result": "/download/menu.csv"},
+            ):
+                await get_cache.publish(channel, json.dumps(event))
+
+        publisher = asyncio.create_task(publish_events())
+        response = await client.get(f"api/v1/report/{task_id}/events")
+        await publisher
+
+        events = [
+            json.loads(line.removeprefix("data: "))
+            for line in response.text.splitlines()
+            if line
+        ]
+
+        assert [(event["status"], event["progress"]) for event in events] == [
+            ("PENDING", 0),
+            ("PROGRESS", 50),
+            ("SUCCESS", 100),
+        ]
+        assert events[-1]["link"] == "/download/menu.csv"
@@ -0,0 +1,110 @@
+import gzip
+import json
+
+import pytest
+
+from src.presentation.api.middlewares.compression import select_encoding
+
+
+class TestCompressionMiddleware:
+    @pytest.mark.asyncio
+    async def test_large_json_compressed_and_cached(
+        self, client, menu_data, create_menu_in_database, get_cache
+    ):
+        await create_menu_in_database(**{**menu_data, "description": "x" * 2048})
+
+        response = await client.get(
+            "api/v1/menus/", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.json()[0]["description"] == "x" * 2048
+
+        etag = response.headers["etag"].removeprefix("W/").strip('"')
+        compressed = await get_cache.get(f"compressed-gzip-{etag}")
+
+        assert json.loads(gzip.decompress(compressed)) == response.json()
+
+    @pytest.mark.asyncio
+    async def test_brotli_preferred(self, client, menu_data, create_menu_in_database):
+        pytest.importorskip("brotli")
+        await create_menu_in_database(**{**menu_data, "description": "x" * 2048})
+
+        response = await client.get(
+            "api/v1/menus/",
+            headers={"Accept-Encoding": "gzip, br"},
+        )
+
+        assert response.headers["content-encoding"] == "br"
+        assert response.json()[0]["description"] == "x" * 2048
+
+    @pytest.mark.asyncio
+    async def test_small_json_not_compressed(
+        self, client, menu_data, create_menu_in_database
+    ):
+        await create_menu_in_database(**menu_data)
+
+        response = await client.get(
+            "api/v1/menus/", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert "content-encoding" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_not_compressed_without_accept_encoding(
+        self, client, menu_data, create_menu_in_database
+    ):
+        await create_menu_in_database(**{**menu_data, "description": "x" * 2048})
+
+        response = await client.get(
+            "api/v1/menus/", headers={"Accept-Encoding": "identity"}
+        )
+
+        assert "content-encoding" not in response.headers
+        assert response.json()[0]["description"] == "x" * 2048
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "description, accept_encoding, weak",
+        [
+            ("x" * 2048, "gzip", True),
+            ("x", "gzip", True),
+            ("x" * 2048, "identity", False),
+        ],
+        ids=["compressed", "small", "identity"],
+    )
+    async def test_not_modified_etag_matches_response(
+        self,
+        client,
+        menu_data,
+        create_menu_in_database,
+        description,
+        accept_encoding,
+        weak,
+    ):
+        await create_menu_in_database(**{**menu_data, "description": description})
+        headers = {"Accept-Encoding": accept_encoding}
+
+        response = await client.get("api/v1/menus/", headers=headers)
+        not_modified = await client.get(
+            "api/v1/menus/",
+            headers={**headers, "If-None-Match": response.headers["etag"]},
+        )
+
+        assert not_modified.status_code == 304
+        assert not_modified.headers["etag"] == response.headers["etag"]
+        assert response.headers["etag"].startswith("W/") is weak
+
+    @pytest.mark.parametrize(
+        "header, encoding",
+        [
+            ("gzip, deflate", "gzip"),
+            ("br;q=0, gzip", "gzip"),
+            ("gzip;q=0", None),
+            ("identity", None),
+        ],
+    )
+    def test_select_encoding(self, header, encoding):
+        assert select_encoding(header) == encoding
@@ -0,0 +1,49 @@
+import pytest
+from prometheus_client import REGISTRY
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TestMetrics:
+    @pytest.mark.asyncio
+    async def test_request_metrics(self, client, menu_data, create_menu_in_database):
+        await create_menu_in_database(**menu_data)
+        path = "/api/v1/menus/{menu_id}"
+        requests = sample("http_requests_total", method="GET", path=path, status="200")
+        misses = sample("cache_requests_total", result="miss")
+        hits = sample("cache_requests_total", result="hit")
+        queries = sample(
+            "db_query_duration_seconds_count",
+            repository="MenuRepository",
+            method="get_by_id_all",
+        )
+
+        await client.get(f'api/v1/menus/{menu_data["menu_id"]}')
+        await client.get(f'api/v1/menus/{menu_data["menu_id"]}')
+
+        assert (
+            sample("http_requests_total", method="GET", path=path, status="200")
+            == requests + 2
+        )
+        assert sample("cache_requests_total", result="miss") > misses
+        assert sample("cache_requests_total", result="hit") > hits
+        assert (
+            sample(
+                "db_query_duration_seconds_count",
+                repository="MenuRepository",
+                method="get_by_id_all",
+            )
+            == queries + 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint(self, client):
+        await client.get("api/v1/menus/")
+
+        response = await client.get("metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'http_requests_total{method="GET",path="/api/v1/menus/"' in response.text
@@ -0,0 +1,93 @@
+import pytest
+from httpx import AsyncClient
+from starlette.responses import PlainTextResponse
+
+from src.presentation.api.middlewares.profiling import ProfilingMiddleware
+
+
+class TestProfiling:
+    @pytest.mark.asyncio
+    async def test_request_with_token_profiled(
+        self, client, profile_storage, profiling_token
+    ):
+        response = await client.get(
+            "api/v1/menus/", headers={"X-Profile-Token": profiling_token}
+        )
+
+        name = response.headers["x-profile-id"]
+
+        assert response.status_code == 200
+        assert profile_storage.path(name) is not None
+
+        response = await client.get(
+            "api/v1/admin/profiles", headers={"X-Profile-Token": profiling_token}
+        )
+
+        assert response.status_code == 200
+        assert [profile["name"] for profile in response.json()] == [name]
+
+        response = await client.get(
+            f"api/v1/admin/profiles/{name}",
+            headers={"X-Profile-Token": profiling_token},
+        )
+
+        assert response.status_code == 200
+        assert response.content
+
+    @pytest.mark.asyncio
+    async def test_request_without_token_not_profiled(self, client, profile_storage):
+        response = await client.get(
+            "api/v1/menus/", headers={"X-Profile-Token": "wrong"}
+        )
+
+        assert "x-profile-id" not in response.headers
+        assert profile_storage.list() == []
+
+    @pytest.mark.asyncio
+    async def test_sampled_request_without_profile_id(
+        self, profile_storage, profiling_token
+    ):
+        app = ProfilingMiddleware(
+            PlainTextResponse("ok"),
+            storage=profile_storage,
+            token=profiling_token,
+            sample_rate=1.0,
+        )
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.get("/")
+
+        assert "x-profile-id" not in response.headers
+        assert len(profile_storage.list()) == 1
+
+    @pytest.mark.asyncio
+    async def test_only_latest_profiles_kept(
+        self, client, profile_storage, profiling_token
+    ):
+        names = []
+        for _ in range(3):
+            response = await client.get(
+                "api/v1/menus/", headers={"X-Profile-Token": profiling_token}
+            )
+            names.append(response.headers["x-profile-id"])
+
+        assert [profile.name for profile in profile_storage.list()] == names[:0:-1]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "url", ["api/v1/admin/profiles", "api/v1/admin/profiles/some.html"]
+    )
+    async def test_admin_forbidden_without_token(self, client, url):
+        response = await client.get(url)
+
+        assert response.status_code == 403
+        assert response.json() == {"detail": "Valid X-Profile-Token header is required"}
+
+    @pytest.mark.asyncio
+    async def test_profile_not_found(self, client, profiling_token):
+        response = await client.get(
+            "api/v1/admin/profiles/..%2F..%2Fetc%2Fpasswd",
+            headers={"X-Profile-Token": profiling_token},
+        )
+
+        assert response.status_code == 404
@@ -0,0 +1,74 @@
+import uuid
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from starlette.responses import PlainTextResponse
+from starlette.types import Receive, Scope, Send
+
+from src.infrastructure.db.query_log import TooManyQueries
+from src.infrastructure.db.repositories.menu import MenuRepository
+from src.presentation.api.middlewares.query_count import QueryCountMiddleware
+
+MENUS = 2
+SUBMENUS = 3  # per menu
+DISHES = 3  # per submenu
+
+
+@pytest_asyncio.fixture
+async def menus_tree(
+    create_menu_in_database, create_submenu_in_database, create_dish_in_database
+) -> list[str]:
+    """Several children of every parent, lazy loads repeat a statement"""
+    menu_ids = [str(uuid.uuid4()) for _ in range(MENUS)]
+    for menu_id in menu_ids:
+        await create_menu_in_database(menu_id, f"menu-{menu_id[:8]}", "description")
+        for _ in range(SUBMENUS):
+            submenu_id = str(uuid.uuid4())
+            await create_submenu_in_database(
+                submenu_id, f"submenu-{submenu_id[:8]}", "description", menu_id
+            )
+            for _ in range(DISHES):
+                dish_id = str(uuid.uuid4())
+                await create_dish_in_database(
+                    dish_id, f"dish-{dish_id[:8]}", "description", "1.50", submenu_id
+                )
+    return menu_ids
+
+
+class TestQueryCount:
+    @pytest.mark.asyncio
+    async def test_lazy_loads_fail(self, db_session_test, menus_tree):
+        async def lazy_app(scope: Scope, receive: Receive, send: Send) -> None:
+            # A query per menu, as lazy loading in a loop does
+            async with db_session_test() as session:
+                for menu_id in menus_tree:
+                    await MenuRepository(session).get_by_id_all(menu_id, load=False)
+            await PlainTextResponse("ok")(scope, receive, send)
+
+        app = QueryCountMiddleware(lazy_app, limit=10, repeat_limit=1)
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            with pytest.raises(TooManyQueries, match=f"a statement {MENUS} times"):
+                await client.get("/")
+
+    @pytest.mark.asyncio
+    async def test_tree_endpoints_load_children_eagerly(self, client, menus_tree):
+        menu_id = menus_tree[0]
+
+        responses = [
+            await client.get("api/v1/menus/"),
+            await client.get(f"api/v1/menus/{menu_id}"),
+            await client.get(f"api/v1/menus/{menu_id}/tree"),
+            await client.get(f"api/v1/menus/{menu_id}/submenus"),
+            await client.post("api/v1/report/", params={"report_format": "json"}),
+        ]
+
+        assert [response.status_code for response in responses] == [
+            200,
+            200,
+            200,
+            200,
+            202,
+        ]
+        assert responses[1].json()["dishes_count"] == SUBMENUS * DISHES
@@ -0,0 +1,103 @@
+import os
+import time
+
+from openpyxl import load_workbook
+
+from src.infrastructure.report.excel import write_workbook
+from src.infrastructure.report.fragments import (
+    get_menu_fragment,
+    get_menu_version,
+    get_report_version,
+    partition_missing_fragments,
+    prune_fragments,
+    render_fragments,
+    render_menu_fragment,
+    render_menu_rows,
+)
+
+
+class TestReportFragments:
+    def test_render_menu_rows(self, report_menu):
+        assert render_menu_rows(report_menu) == [
+            [None, "some_title", "some_description"],
+            [None, 1, "some_title", "some_description"],
+            [None, None, 1, "some_title", "some_description", "14.50"],
+        ]
+
+    def test_menu_version_changed_with_data(self, report_menu):
+        version = get_menu_version(report_menu)
+
+        report_menu["submenus"][0]["dishes"][0]["price"] = "15.50"
+
+        assert get_menu_version(report_menu) != version
+
+    def test_report_version_depends_on_menus_order(self, report_menu):
+        first_version = get_menu_version(report_menu)
+        second_version = get_menu_version({**report_menu, "title": "other_title"})
+
+        assert get_report_version([first_version, second_version]) != (
+            get_report_version([second_version, first_version])
+        )
+
+    def test_render_fragments(self, report_menu, tmp_path):
+        menus = [{**report_menu, "title": f"title_{i}"} for i in range(3)]
+        versions = [get_menu_version(menu) for menu in menus]
+        progress = []
+
+        assert render_fragments(
+            str(tmp_path),
+            menus,
+            versions,
+            on_progress=lambda *args: progress.append(args),
+        ) == [render_menu_fragment(menu) for menu in menus]
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+
+    def test_partitions_of_missing_fragments(self, report_menu, tmp_path):
+        directory = str(tmp_path)
+        menus = [{**report_menu, "title": f"title_{i}"} for i in range(6)]
+        versions = [get_menu_version(menu) for menu in menus]
+        get_menu_fragment(directory, menus[0], versions[0])
+
+        partitions = partition_missing_fragments(directory, menus, versions, 2)
+
+        assert partitions == [(menus[1:4], versions[1:4]), (menus[4:], versions[4:])]
+        assert partition_missing_fragments(directory, menus[:1], versions[:1], 2) == []
+
+    def test_fragment_cached_by_version(self, report_menu, tmp_path):
+        directory = str(tmp_path / "fragments")
+
+        fragment = get_menu_fragment(directory, report_menu, "version")
+
+        assert os.listdir(directory) == ["version.xml"]
+        assert get_menu_fragment(directory, {}, "version") == fragment
+
+    def test_prune_fragments_by_age_and_quota(self, tmp_path):
+        now = time.time()
+        for name, age in (("old", 7200), ("used", 120), ("recent", 60), ("new", 0)):
+            path = tmp_path / f"{name}.xml"
+            path.write_bytes(b"x" * 100)
+            os.utime(path, (now - age, now - age))
+
+        assert prune_fragments(str(tmp_path), max_age=3600, quota=250) == 2
+        assert sorted(os.listdir(tmp_path)) == ["new.xml", "recent.xml"]
+
+    def test_workbook_of_fragments(self, report_menu, tmp_path):
+        menus = [report_menu, {**report_menu, "title": "other <title> & co"}]
+        path = str(tmp_path / "report.xlsx")
+
+        write_workbook([render_menu_fragment(menu) for menu in menus], path)
+
+        sheet = load_workbook(path).active
+        rows = list(sheet.iter_rows(values_only=True))
+        assert rows[0] == (1, "some_title", "some_description", None, None, None)
+        assert rows[3] == (
+            2,
+            "other <title> & co",
+            "some_description",
+            None,
+            None,
+            None,
+        )
+        assert rows[5] == (None, None, 1, "some_title", "some_description", "14.50")
+        assert sheet["B1"].font.name == "Montserrat"
+        assert sheet.column_dimensions["B"].width == 35
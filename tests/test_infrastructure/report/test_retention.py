@@ -0,0 +1,32 @@
+from datetime import datetime, timedelta, timezone
+
+from src.domain.report.dto.report import ReportFile
+from src.infrastructure.report.retention import select_expired_reports
+
+NOW = datetime(2023, 1, 2, tzinfo=timezone.utc)
+
+
+def report_file(name: str, hours: int, size: int) -> ReportFile:
+    return ReportFile(
+        name=name, size=size, etag=name, modified_at=NOW - timedelta(hours=hours)
+    )
+
+
+class TestReportRetention:
+    def test_expired_by_age(self):
+        files = [report_file("old", 25, 10), report_file("new", 1, 10)]
+
+        expired = select_expired_reports(files, NOW, timedelta(hours=24), quota=100)
+
+        assert [file.name for file in expired] == ["old"]
+
+    def test_expired_by_quota_oldest_first(self):
+        files = [
+            report_file("newest", 1, 40),
+            report_file("oldest", 3, 40),
+            report_file("middle", 2, 40),
+        ]
+
+        expired = select_expired_reports(files, NOW, timedelta(hours=24), quota=80)
+
+        assert [file.name for file in expired] == ["oldest"]
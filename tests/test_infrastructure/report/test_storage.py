@@ -0,0 +1,66 @@
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from src.infrastructure.report.storage import LocalReportStorage, S3ReportStorage
+from tests.mocks import MockS3Client
+
+
+@pytest.fixture(params=["local", "s3"])
+def storage(request, tmp_path):
+    if request.param == "s3":
+        return S3ReportStorage(client=MockS3Client(), bucket="reports")
+    return LocalReportStorage(directory=str(tmp_path / "reports"))
+
+
+@pytest.fixture
+def report_path(tmp_path):
+    path = tmp_path / "report.tmp"
+    path.write_bytes(b"0123456789")
+    return str(path)
+
+
+def make_old(storage, stored_name: str) -> None:
+    if isinstance(storage, S3ReportStorage):
+        storage.client.modified[stored_name] = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    else:
+        os.utime(os.path.join(storage.directory, stored_name), (0, 0))
+
+
+class TestReportStorage:
+    def test_save_and_stat(self, storage, report_path):
+        storage.save("report_menu.csv", report_path, compressed=True)
+
+        report_file = storage.stat("report_menu.csv")
+
+        assert report_file.name == "report_menu.csv"
+        assert report_file.size == 10
+        assert report_file.compressed is True
+        assert storage.stat("other_menu.csv") is None
+
+    def test_touch_updates_modified_at(self, storage, report_path):
+        storage.save("report_menu.csv", report_path, compressed=True)
+        make_old(storage, "report_menu.csv.gz")
+
+        touched = storage.touch("report_menu.csv")
+
+        assert touched.modified_at.year == datetime.now(tz=timezone.utc).year
+        assert touched.compressed is True
+        assert storage.stat("report_menu.csv") == touched
+        assert storage.touch("other_menu.csv") is None
+
+    def test_open_range(self, storage, report_path):
+        storage.save("report_menu.xlsx", report_path)
+
+        with storage.open("report_menu.xlsx", 2, 5) as file:
+            assert file.read(4) == b"2345"
+
+    def test_delete_and_list(self, storage, report_path):
+        storage.save("report_menu.xlsx", report_path)
+
+        assert [report.name for report in storage.list()] == ["report_menu.xlsx"]
+
+        storage.delete("report_menu.xlsx")
+
+        assert storage.list() == []
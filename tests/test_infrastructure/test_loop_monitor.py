@@ -0,0 +1,43 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from src.infrastructure.loop_monitor import LoopLagMonitor
+from src.infrastructure.metrics import EVENT_LOOP_BLOCKS
+
+
+def blocking_call() -> None:
+    time.sleep(0.3)
+
+
+class TestLoopLagMonitor:
+    @pytest.mark.asyncio
+    async def test_blocking_call_logged_with_stack(self, caplog):
+        monitor = LoopLagMonitor(interval=0.01, threshold=0.1)
+        blocks = EVENT_LOOP_BLOCKS._value.get()
+
+        await monitor.start()
+        try:
+            with caplog.at_level(logging.WARNING, logger="main_logger"):
+                await asyncio.sleep(0.05)
+                blocking_call()
+                await asyncio.sleep(0.05)
+        finally:
+            await monitor.stop()
+
+        assert "Event loop blocked" in caplog.text
+        assert "blocking_call" in caplog.text
+        assert EVENT_LOOP_BLOCKS._value.get() == blocks + 1
+
+    @pytest.mark.asyncio
+    async def test_no_lag_not_logged(self, caplog):
+        monitor = LoopLagMonitor(interval=0.01, threshold=0.1)
+
+        await monitor.start()
+        with caplog.at_level(logging.WARNING, logger="main_logger"):
+            await asyncio.sleep(0.1)
+        await monitor.stop()
+
+        assert "Event loop" not in caplog.text
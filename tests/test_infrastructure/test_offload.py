@@ -0,0 +1,49 @@
+import threading
+
+import pytest
+
+from src.infrastructure import offload
+from src.infrastructure.metrics import SERIALIZATION_DURATION
+
+
+@pytest.fixture
+def threshold():
+    offload.setup_offload(100)
+    yield 100
+    offload.setup_offload(None)
+
+
+def observed(executor: str) -> float:
+    samples = SERIALIZATION_DURATION.collect()[0].samples
+    return sum(
+        sample.value
+        for sample in samples
+        if sample.name.endswith("_count")
+        and sample.labels == {"operation": "test", "executor": executor}
+    )
+
+
+class TestOffload:
+    @pytest.mark.asyncio
+    async def test_small_result_on_loop(self, threshold):
+        before = observed("loop")
+
+        thread = await offload.serialize("test", threshold - 1, threading.get_ident)
+
+        assert thread == threading.get_ident()
+        assert observed("loop") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_big_result_in_thread(self, threshold):
+        before = observed("thread")
+
+        thread = await offload.serialize("test", threshold, threading.get_ident)
+
+        assert thread != threading.get_ident()
+        assert observed("thread") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        thread = await offload.serialize("test", 10**6, threading.get_ident)
+
+        assert thread == threading.get_ident()
@@ -0,0 +1,43 @@
+import logging
+
+import pytest
+import pytest_asyncio
+
+from src.infrastructure.db.base import create_pool
+from src.infrastructure.db.query_log import count_queries
+from src.infrastructure.db.repositories.menu import MenuRepository
+from src.settings import get_settings
+
+
+@pytest_asyncio.fixture
+async def slow_pool():
+    # Every statement is slower than zero seconds
+    pool = create_pool(
+        get_settings().database_test_url, echo_mode=False, slow_query_threshold=0
+    )
+    yield pool
+    await pool.kw["bind"].dispose()
+
+
+class TestQueryLog:
+    @pytest.mark.asyncio
+    async def test_slow_query_logged_with_method(self, slow_pool, caplog):
+        async with slow_pool() as session:
+            with caplog.at_level(logging.WARNING, logger="main_logger"):
+                await MenuRepository(session).get_all()
+
+        assert "MenuRepository.get_all" in caplog.text
+        assert "SELECT" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_queries_counted(self, slow_pool, menu_data, create_menu_in_database):
+        await create_menu_in_database(**menu_data)
+
+        async with slow_pool() as session:
+            with count_queries() as counter:
+                await MenuRepository(session).get_by_id_all(
+                    menu_data["menu_id"], load=True
+                )
+                await MenuRepository(session).get_all()
+
+        assert counter.count == 2
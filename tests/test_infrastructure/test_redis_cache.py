@@ -0,0 +1,22 @@
+import logging
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+
+from src.infrastructure.db.repositories.redis.base import RedisRepository
+
+
+class TestRedisRepository:
+    @pytest.mark.asyncio
+    async def test_values_not_logged(self, caplog):
+        cache = RedisRepository(FakeRedis())
+        value = '[{"title": "dish"}]'
+
+        with caplog.at_level(logging.DEBUG, logger="main_logger"):
+            await cache.put("dishes", value)
+            await cache.put_field("dishes-fields", "title", value)
+            await cache.put_many({"dish-1": value})
+
+        assert value not in caplog.text
+        assert f"dishes - {len(value)} bytes" in caplog.text
+        assert all(record.levelno == logging.DEBUG for record in caplog.records)
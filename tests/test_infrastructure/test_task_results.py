@@ -0,0 +1,47 @@
+import json
+import uuid
+
+import pytest
+
+from src.domain.report.dto.report import TaskResult
+from src.domain.report.exceptions.report import TaskNotFound
+from src.infrastructure.tasks_sender.celery.results import CeleryRedisTaskResults
+
+
+class TestCeleryRedisTaskResults:
+    @pytest.mark.asyncio
+    async def test_watch_unknown_task(self, get_cache):
+        task_results = CeleryRedisTaskResults(get_cache)
+
+        with pytest.raises(TaskNotFound):
+            await anext(task_results.watch(str(uuid.uuid4())))
+
+    @pytest.mark.asyncio
+    async def test_watch_ends_when_task_expires(self, get_cache):
+        task_id = str(uuid.uuid4())
+        meta_key = f"celery-task-meta-{task_id}"
+        await get_cache.set(meta_key, json.dumps({"status": "PENDING"}))
+        task_results = CeleryRedisTaskResults(get_cache, poll_interval=0.01)
+
+        tasks = []
+        async for task in task_results.watch(task_id):
+            tasks.append(task)
+            await get_cache.delete(meta_key)
+
+        assert tasks == [TaskResult(status="PENDING")]
+
+    @pytest.mark.asyncio
+    async def test_watch_ends_after_max_duration(self, get_cache):
+        task_id = str(uuid.uuid4())
+        await get_cache.set(
+            f"celery-task-meta-{task_id}", json.dumps({"status": "PENDING"})
+        )
+        task_results = CeleryRedisTaskResults(
+            get_cache, poll_interval=0.01, max_duration=0.05
+        )
+
+        tasks = [task async for task in task_results.watch(task_id)]
+
+        # Keepalive repeats the state until the stream ends
+        assert tasks[0] == TaskResult(status="PENDING")
+        assert len(tasks) < 10
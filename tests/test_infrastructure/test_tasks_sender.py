@@ -0,0 +1,78 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+
+from src.infrastructure.profiling import ProfileStorage
+from src.infrastructure.tasks_sender.celery.celery import CeleryTasksSender
+from src.presentation.api.di import setup_di, tasks_sender_provider
+
+
+class StubCelery:
+    def __init__(self):
+        self.calls: list[tuple] = []
+        self.backend = SimpleNamespace(
+            store_result=self.store_result, forget=self.forget
+        )
+        self.broker_error: Exception | None = None
+
+    def store_result(self, task_id: str, result: None, state: str) -> None:
+        self.calls.append(("store_result", task_id, state))
+
+    def forget(self, task_id: str) -> None:
+        self.calls.append(("forget", task_id))
+
+    def send_task(self, name: str, args: tuple, task_id: str) -> SimpleNamespace:
+        if self.broker_error:
+            raise self.broker_error
+        self.calls.append(("send_task", name, args, threading.get_ident()))
+        return SimpleNamespace(id=task_id)
+
+
+class TestCeleryTasksSender:
+    @pytest.mark.asyncio
+    async def test_task_published_from_executor_thread(self):
+        celery_app = StubCelery()
+        sender = CeleryTasksSender(celery_app, ThreadPoolExecutor(max_workers=1))
+
+        task_id = await sender.collect_menu_data([{"title": "menu"}], "csv")
+
+        _, name, args, thread = celery_app.calls[-1]
+        assert name == "src.presentation.celery.tasks.collect_menu_data"
+        assert args == ([{"title": "menu"}], "csv")
+        assert thread != threading.get_ident()
+        # Queued task is known before a worker starts it
+        assert celery_app.calls[0] == ("store_result", task_id, "PENDING")
+
+    @pytest.mark.asyncio
+    async def test_pending_state_forgotten_when_publish_fails(self):
+        celery_app = StubCelery()
+        celery_app.broker_error = ConnectionError("broker is down")
+        sender = CeleryTasksSender(celery_app)
+
+        with pytest.raises(ConnectionError):
+            await sender.collect_menu_data([], "csv")
+
+        (_, task_id, state), forget = celery_app.calls
+        assert state == "PENDING"
+        assert forget == ("forget", task_id)
+
+    @pytest.mark.asyncio
+    async def test_executor_shut_down_with_app(self, tmp_path):
+        app = FastAPI()
+        setup_di(
+            app=app,
+            pool=None,  # type: ignore
+            redis=None,
+            report_storage=None,  # type: ignore
+            results_redis=None,
+            profile_storage=ProfileStorage(str(tmp_path)),
+        )
+        executor = app.dependency_overrides[tasks_sender_provider].__self__.executor
+
+        await app.router.shutdown()
+
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
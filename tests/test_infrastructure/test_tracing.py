@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+from src.domain.menu.usecases.menu import GetMenus
+from src.infrastructure import tracing
+from src.infrastructure.db.base import create_pool, create_redis
+from src.infrastructure.db.repositories.redis.base import RedisRepository
+from src.infrastructure.db.uow import SQLAlchemyUoW
+from src.infrastructure.tasks_sender.celery.celery import CeleryTasksSender
+from src.settings import get_settings
+
+
+@pytest.fixture(scope="module")
+def span_exporter():
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry import trace
+    from opentelemetry.instrumentation.celery import CeleryInstrumentor
+    from opentelemetry.instrumentation.redis import RedisInstrumentor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    tracing.setup_tracing(get_settings(), service="test", exporter=exporter)
+
+    yield exporter
+
+    RedisInstrumentor().uninstrument()
+    CeleryInstrumentor().uninstrument()
+    trace.get_tracer_provider().shutdown()
+    tracing._enabled = False
+
+
+@pytest_asyncio.fixture
+async def get_menus(span_exporter):
+    settings = get_settings()
+    pool = create_pool(settings.database_test_url, echo_mode=False)
+    redis = create_redis(settings.redis_test_cache, settings.redis_port, 2)
+
+    async with pool() as session:
+        yield GetMenus(SQLAlchemyUoW(session), RedisRepository(redis))
+
+    await redis.close()
+    await pool.kw["bind"].dispose()
+
+
+def finished_spans(span_exporter) -> dict:
+    from opentelemetry import trace
+
+    trace.get_tracer_provider().force_flush()
+    return {span.name: span for span in span_exporter.get_finished_spans()}
+
+
+class TestTracing:
+    @pytest.mark.asyncio
+    async def test_use_case_span_is_parent(self, span_exporter, get_menus):
+        span_exporter.clear()
+
+        await get_menus()
+
+        spans = finished_spans(span_exporter)
+        use_case = spans["GetMenus"]
+
+        assert spans["SELECT"].parent.span_id == use_case.context.span_id
+        assert spans["GET"].parent.span_id == use_case.context.span_id
+        assert spans["SELECT"].attributes["db.system"] == "postgresql"
+
+    @pytest.mark.asyncio
+    async def test_send_task_keeps_trace_in_executor(self, span_exporter):
+        from opentelemetry import trace
+
+        span_exporter.clear()
+        parents = []
+
+        class Celery:
+            backend = SimpleNamespace(store_result=lambda *args: None)
+
+            def send_task(self, name: str, args: tuple, task_id: str):
+                parents.append(trace.get_current_span().get_span_context().span_id)
+                return SimpleNamespace(id="task-id")
+
+        sender = CeleryTasksSender(Celery(), ThreadPoolExecutor(max_workers=1))
+
+        assert await sender.collect_menu_data([], "xlsx") == "task-id"
+
+        spans = finished_spans(span_exporter)
+
+        assert parents == [spans["send_task collect_menu_data"].context.span_id]
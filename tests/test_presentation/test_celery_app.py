@@ -0,0 +1,88 @@
+import pytest
+from celery.signals import before_task_publish
+
+from src.presentation.celery.app import build_celery_app, build_producer_app
+from src.presentation.celery.metrics import PUBLISHED_AT_HEADER, stamp_published_at
+from src.settings import get_settings
+
+REPORT_TASK = "src.presentation.celery.tasks.collect_menu_data"
+CLEANUP_TASK = "src.presentation.celery.tasks.cleanup_reports"
+REPORT_PART_TASKS = (
+    "src.presentation.celery.tasks.render_report_fragments",
+    "src.presentation.celery.tasks.assemble_report",
+)
+
+
+class TestCeleryApp:
+    def test_report_task_routed_to_report_queue(self):
+        settings = get_settings()
+        app = build_celery_app()
+
+        route = app.amqp.router.route({}, REPORT_TASK)
+
+        assert route["queue"].name == settings.celery_report_queue
+        assert route["queue"].routing_key == settings.celery_report_queue
+        assert "priority" not in route
+
+    def test_other_tasks_routed_to_default_queue(self):
+        settings = get_settings()
+        app = build_celery_app()
+
+        route = app.amqp.router.route({}, CLEANUP_TASK)
+
+        assert route["queue"].name == settings.celery_default_queue
+
+    def test_report_task_limits(self):
+        settings = get_settings()
+        app = build_celery_app()
+
+        task = app.tasks[REPORT_TASK]
+
+        assert task.rate_limit == settings.report_rate_limit
+        assert task.soft_time_limit == settings.report_soft_time_limit
+        assert task.time_limit == settings.report_time_limit
+        assert app.conf.worker_prefetch_multiplier == 1
+        assert app.conf.task_acks_late
+
+    @pytest.mark.parametrize("name", REPORT_PART_TASKS)
+    def test_report_parts_run_by_report_workers_within_limits(self, name):
+        settings = get_settings()
+        app = build_celery_app()
+
+        route = app.amqp.router.route({}, name)
+        task = app.tasks[name]
+
+        assert route["queue"].name == settings.celery_report_queue
+        assert task.soft_time_limit == settings.report_soft_time_limit
+        assert task.time_limit == settings.report_time_limit
+
+    def test_worker_app_built_on_access(self):
+        from src.presentation.celery import app as module
+
+        assert REPORT_TASK in module.app.tasks
+        assert module.app is module.app
+
+    def test_producer_app_routes_by_task_name(self):
+        settings = get_settings()
+        app = build_producer_app()
+
+        route = app.amqp.router.route({}, REPORT_TASK)
+
+        assert route["queue"].name == settings.celery_report_queue
+
+    def test_producer_app_stamps_published_at(self):
+        # Worker app of other tests connects it too, the producer does it alone
+        before_task_publish.disconnect(stamp_published_at)
+        settings = get_settings()
+        app = build_producer_app()
+        app.conf.broker_url = "memory://"
+
+        app.send_task(CLEANUP_TASK)
+
+        with app.connection_for_read() as connection:
+            queue = connection.SimpleQueue(settings.celery_default_queue)
+            message = queue.get(timeout=1)
+            message.ack()
+            queue.close()
+
+        assert PUBLISHED_AT_HEADER in message.headers
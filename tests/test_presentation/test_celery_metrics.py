@@ -0,0 +1,63 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from celery.signals import worker_process_shutdown
+from prometheus_client import REGISTRY, multiprocess
+
+from src.presentation.celery.metrics import (
+    PUBLISHED_AT_HEADER,
+    observe_queue_wait,
+    observe_run_time,
+    setup_metrics,
+    stamp_published_at,
+)
+from src.settings import get_settings
+
+TASK = "tests.task"
+
+
+class TestCeleryMetrics:
+    def test_queue_wait_and_run_time(self):
+        headers: dict = {}
+        stamp_published_at(headers=headers)
+        task = SimpleNamespace(
+            name=TASK,
+            request=SimpleNamespace(
+                **{PUBLISHED_AT_HEADER: headers[PUBLISHED_AT_HEADER] - 5}
+            ),
+        )
+
+        observe_queue_wait(task_id="1", task=task)
+        observe_run_time(task_id="1", task=task, state="SUCCESS")
+
+        assert (
+            REGISTRY.get_sample_value(
+                "celery_task_queue_wait_seconds_sum", {"task": TASK}
+            )
+            >= 5
+        )
+        assert (
+            REGISTRY.get_sample_value(
+                "celery_task_duration_seconds_count", {"task": TASK, "state": "SUCCESS"}
+            )
+            == 1
+        )
+        assert headers[PUBLISHED_AT_HEADER] <= time.time()
+
+    def test_exporter_requires_multiprocess_dir(self, monkeypatch):
+        monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+        settings = get_settings().copy(update={"celery_metrics_port": 9808})
+
+        with pytest.raises(RuntimeError, match="PROMETHEUS_MULTIPROC_DIR"):
+            setup_metrics(settings)
+
+    def test_exited_pool_process_marked_dead(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+        dead = []
+        monkeypatch.setattr(multiprocess, "mark_process_dead", dead.append)
+        setup_metrics(get_settings().copy(update={"celery_metrics_port": 9808}))
+
+        worker_process_shutdown.send(sender=None, pid=123, exitcode=0)
+
+        assert dead == [123]
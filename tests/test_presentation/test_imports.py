@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import pytest
+
+# Worker-only modules, API processes and test runs don't need them at startup
+LAZY_MODULES = ("celery", "kombu", "src.presentation.celery.tasks")
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Cumulative import time (microseconds) of every module imported by module"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestImports:
+    @pytest.mark.parametrize(
+        "module", ["src.presentation.api.asgi", "src.presentation.api.di"]
+    )
+    def test_api_doesnt_import_worker_modules(self, module):
+        times = import_times(module)
+
+        assert times[module] > 0
+        assert [
+            name for name in LAZY_MODULES if name in times
+        ] == [], f"{module} imported in {times[module] / 1000:.0f} ms"
@@ -0,0 +1,59 @@
+import os
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.presentation.celery import tasks
+from src.presentation.celery.app import build_celery_app
+
+REPORT_TASK = "src.presentation.celery.tasks.collect_menu_data"
+
+
+@pytest.fixture
+def report_app(tmp_path, monkeypatch):
+    monkeypatch.setenv("REPORT_STORAGE", "local")
+    monkeypatch.setenv("REPORT_DIR", str(tmp_path / "reports"))
+    monkeypatch.setattr(tasks, "_save_report_info", AsyncMock())
+
+    app = build_celery_app()
+    app.conf.task_always_eager = True
+    return app
+
+
+@pytest.fixture
+def rendered(monkeypatch) -> list[int]:
+    """Count of menus of every render_fragments call"""
+    calls = []
+    render_fragments = tasks.render_fragments
+
+    def spy(directory, menus, *args, **kwargs):
+        calls.append(len(menus))
+        return render_fragments(directory, menus, *args, **kwargs)
+
+    monkeypatch.setattr(tasks, "render_fragments", spy)
+    return calls
+
+
+class TestReportTask:
+    def test_report_rendered_by_partitions(
+        self, report_app, report_menu, rendered, tmp_path, monkeypatch
+    ):
+        monkeypatch.setenv("REPORT_PROCESSES", "2")
+        menus = [{**report_menu, "title": f"title_{i}"} for i in range(5)]
+
+        result = report_app.tasks[REPORT_TASK].apply(args=(menus, "xlsx"))
+
+        assert result.get().endswith("_menu.xlsx")
+        # Partitions render the menus, the report is assembled of cached fragments
+        assert rendered == [3, 2, 5]
+        assert len(os.listdir(tmp_path / "reports" / "fragments")) == 5
+        assert len(list((tmp_path / "reports").glob("*_menu.xlsx"))) == 1
+
+    def test_report_rendered_alone_with_one_process(
+        self, report_app, report_menu, rendered
+    ):
+        menus = [{**report_menu, "title": f"title_{i}"} for i in range(5)]
+
+        report_app.tasks[REPORT_TASK].apply(args=(menus, "xlsx")).get()
+
+        assert rendered == [5]
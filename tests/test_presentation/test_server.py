@@ -0,0 +1,30 @@
+import os
+
+import pytest
+
+from src.presentation.api import server
+from src.settings import get_settings
+
+
+class TestServer:
+    @pytest.mark.parametrize(
+        "total, workers, share", [(10, 1, 10), (10, 4, 2), (10, 20, 1), (10, 0, 10)]
+    )
+    def test_worker_share(self, total, workers, share):
+        assert server.worker_share(total, workers) == share
+
+    def test_run_server(self, monkeypatch, tmp_path):
+        calls = []
+        monkeypatch.setattr(
+            server.uvicorn, "run", lambda **kwargs: calls.append(kwargs)
+        )
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+        settings = get_settings()
+        monkeypatch.setattr(settings, "workers", 4)
+
+        server.run_server(settings)
+
+        assert calls[0]["workers"] == 4
+        assert calls[0]["loop"] == settings.server_loop
+        assert calls[0]["http"] == "httptools"
+        assert os.environ["PROMETHEUS_MULTIPROC_DIR"] == str(tmp_path)